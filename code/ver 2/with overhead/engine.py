@@ -0,0 +1,77 @@
+ #**************************************************************************
+ # engine.py
+ #
+ # Simulate the mapping process using a discrete-event engine, which jumps
+ # straight to the time of the next event instead of running a clock
+ # thread that sleeps on each tick.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+import heapq
+
+# Simulate the mapping process of a scheduler (an instance of the scheduler class of bfs, wfs, lnsnl or new) #
+# At each event time, the threads perform one step in the same order as the loop-based simulator, #
+# so the results are identical on every run #
+def simulate(policy, task_type, num_threads, queue, args):
+	events = [] # The min-heap of the finish events (finish time, thread number)
+	registered = [] # The last part of each thread whose finish event has been registered
+	for i in range(num_threads):
+		registered.append(None)
+
+	t = 0 # Response time
+
+	# Continue the mapping process while there are any parts that have not been completed #
+	while policy.comp_parts_cnt < policy.parts_cnt:
+		num_queued = 0 # The number of parts existing in the queues before the step
+		for i in range(num_threads):
+			num_queued += len(queue[i])
+
+		# Perform one step of each thread at the current time #
+		policy.t = t
+		for thr_num in range(num_threads):
+			if task_type == 'tied':
+				policy.step_tied(thr_num, *args)
+			else:
+				policy.step_untied(thr_num, *args)
+
+		# Discard the finish events that have been processed (the part finished at this step) #
+		changed = False
+		while bool(events) and events[0][0] <= t:
+			heapq.heappop(events)
+			changed = True
+
+		# Register the finish events of the parts started (or released from a data dependency) at this step #
+		for i in range(num_threads):
+			num_queued -= len(queue[i])
+			if bool(queue[i]):
+				part = queue[i][len(queue[i]) - 1]
+				detail = policy.details[part]
+				if detail.status == 's' and part != registered[i]:
+					heapq.heappush(events, (detail.f_time, i))
+					registered[i] = part
+					changed = True
+
+		# Any part mapped or put in the waiting status #
+		if num_queued != 0:
+			changed = True
+
+		# A change at this step (a finished, started or released part) can enable new decisions at the next time, #
+		# otherwise nothing can happen until the next part finishes #
+		if changed or not bool(events):
+			t += 1
+		else:
+			t = events[0][0]
+
+	return t
@@ -18,10 +18,17 @@
  # limitations under the License.
  #**************************************************************************
 import func
+import json
 import random
+import store
+
+# NumPy is optional, and it is only needed to generate the graph using a NumPy random generator (graph_rand_np) #
+try:
+	import numpy
+except ImportError:
+	numpy = None
 
 dep_list = [] # The list of available dependant parts in the data dependency
-desc_rel_flag = 0 # The flag for the descendant relation between tasks
 
 # Look for a parent #
 def look_for_parent(parts_list_tmp, child, parent_list, system_model):
@@ -35,31 +42,105 @@ def look_for_parent(parts_list_tmp, child, parent_list, system_model):
 
 	return sel_parent, parent_list
 
-# Look for the descendant relation between tasks #
-def look_for_desc_rel(num_tasks, parent_child_rel, curr_task, descendant_task):
-	global desc_rel_flag
+# Group the child tasks (their first parts) by their parents in one pass, keeping the order of the tasks in each group #
+def group_child(num_tasks, part_list):
+	child_group = {} # The child tasks of each parent part
+	for i in range(num_tasks):
+		if part_list[i][0].parent != None:
+			child_group.setdefault(part_list[i][0].parent, []).append(part_list[i][0])
 
-	if curr_task == descendant_task:
-		desc_rel_flag = 1
-	else:
-		# Check child tasks #
-		for i in range(num_tasks):
-			if parent_child_rel[curr_task][i] == 1:
-				look_for_desc_rel(num_tasks, parent_child_rel, i, descendant_task)
+	return child_group
 
-# Specify an execution time for each part and create the list of tasks #
-def specify_et(num_tasks, part_list, et_min, et_max, deadline_min, deadline_max):
-	global desc_rel_flag
+# Specify the data dependencies between the selected sibling tasks (in the order of the tasks) #
+# Each task of the list depends on one of the previous tasks, and at most num_dep_level tasks depend on each of them in order, #
+# i.e., the task r (from 0) depends on the task (r - 1) // num_dep_level, so the dependencies are specified in linear time #
+def wire_dep(sel_child_list, num_dep_level):
+	if num_dep_level <= 0:
+		return
+
+	for r in range(len(sel_child_list))[1::]:
+		sel_child_list[r].dep = sel_child_list[(r - 1) // num_dep_level]
 
+# Build the index of the child tasks of each part, which is reused by all the mapping algorithms #
+def index_child(num_tasks, part_list):
+	for i in range(num_tasks):
+		for j in range(len(part_list[i])):
+			part_list[i][j].child = []
+
+	for i in range(num_tasks):
+		for j in range(len(part_list[i])):
+			if part_list[i][j].parent != None:
+				part_list[i][j].parent.child.append(part_list[i][j])
+
+	# Determine the number of immediate successors of each part (used by the LNSNL heuristic) #
+	for i in range(num_tasks):
+		for j in range(len(part_list[i])):
+			part_list[i][j].num_succ = len(part_list[i][j].child)
+			if part_list[i][j].sibling != None:
+				part_list[i][j].num_succ += 1
+
+	return part_list
+
+# Specify the descendant relation between tasks #
+# The relation of each task is a bitset (an integer) in which bit j is set if task j is a descendant of the task, #
+# so it takes O(num_tasks^2 / 64) words, is queried by func.is_descendant and is combined for each thread by func.allowed_tasks #
+def descendant_rel(num_tasks, part_list):
+	# Specify the child tasks of each task #
+	child_task = [] # The child tasks
+	has_parent = [] # Whether the task has a parent task
+	for i in range(num_tasks):
+		child_task.append([])
+		has_parent.append(False)
+
+	for i in range(num_tasks):
+		for j in range(len(part_list[i])):
+			if part_list[i][j].parent != None and part_list[i][j].parent.t_id != i:
+				child_task[part_list[i][j].parent.t_id].append(i)
+				has_parent[i] = True
+
+	# Order the tasks from the root tasks to the leaves by walking the task tree once #
+	order = []
+	for i in range(num_tasks):
+		if has_parent[i] == False:
+			order.append(i)
+
+	index = 0
+	while index < len(order):
+		for i in range(len(child_task[order[index]])):
+			order.append(child_task[order[index]][i])
+		index += 1
+
+	# Build the bitsets from the leaves to the root tasks #
+	desc_rel = []
+	for i in range(num_tasks):
+		desc_rel.append(0)
+
+	for index in range(len(order))[::-1]:
+		task = order[index]
+		for i in range(len(child_task[task])):
+			child = child_task[task][i]
+			desc_rel[task] |= (1 << child) | desc_rel[child]
+
+	return desc_rel
+
+# Specify an execution time for each part and create the list of tasks #
+def specify_et(num_tasks, part_list, et_min, et_max, deadline_min, deadline_max, desc_rel = None):
 	# Specify an execution time for each part #
 	for i in range(num_tasks):
 		for j in range(len(part_list[i])):
 			part_list[i][j].et = random.randint(et_min, et_max)
 
+	return specify_rt(num_tasks, part_list, deadline_min, deadline_max, desc_rel)
+
+# Determine the deadline and the response time of the parts from their execution times, and create the list of tasks #
+# It is used by specify_et, and directly if the execution times are given (e.g., by the file of a graph) #
+def specify_rt(num_tasks, part_list, deadline_min, deadline_max, desc_rel = None):
 	# Determine the deadline of the whole system #
 	sum_et = 0
 	for i in range(num_tasks):
 		for j in range(len(part_list[i])):
+			if part_list[i][j].et == None:
+				raise ValueError('The execution time of p' + str(i) + str(j) + ' is not given')
 			sum_et += part_list[i][j].et
 	deadline = (random.randint(int(deadline_min * 10), int(deadline_max * 10)) / 10) * sum_et
 
@@ -68,38 +149,61 @@ def specify_et(num_tasks, part_list, et_min, et_max, deadline_min, deadline_max)
 		for j in range(len(part_list[i])):
 			part_list[i][j].rt = deadline * part_list[i][j].et / sum_et
 
-	# Specify the descendant relation between tasks #
-	parent_child_rel = [] # The parent-child relation
-	desc_rel = [] # The descendant relation
+	# Specify the descendant relation between tasks (unless it is given, e.g., by the cache of the graphs) #
+	if desc_rel == None:
+		desc_rel = descendant_rel(num_tasks, part_list)
 
-	for i in range(num_tasks):
-		parent_child_rel.append([])
-		for j in range(num_tasks):
-			parent_child_rel_flag = 0
+	return part_list, deadline, desc_rel
+
+# Draw the execution times of all the parts and the factors of the deadline for several iterations at once using a NumPy random generator #
+# Row i of the execution times (iterations x parts, in the order of the parts in part_list) and item i of the factors are given #
+# to specify_et_np for iteration i, with the same distributions as specify_et #
+def draw_et(num_iterations, num_all_parts, et_min, et_max, deadline_min, deadline_max, rng):
+	et = rng.integers(et_min, et_max, size = (num_iterations, num_all_parts), endpoint = True)
+	deadline_factor = rng.integers(int(deadline_min * 10), int(deadline_max * 10), size = num_iterations, endpoint = True)
 
-			for k in range(len(part_list[i])):
-				for z in range(len(part_list[j])):
-					if part_list[j][z].parent == part_list[i][k]:
-						parent_child_rel_flag = 1
-						break
+	return et, deadline_factor
+
+# Specify the execution time of each part (drawn by draw_et) as arrays, and create the list of tasks #
+# The deadline and the response times are calculated in the same order of operations as specify_et, and they are written #
+# to the parts in bulk if the parts are stored compactly (store.graph) #
+def specify_et_np(num_tasks, part_list, et, deadline_factor, desc_rel = None):
+	# Determine the deadline of the whole system #
+	et = numpy.asarray(et, dtype = numpy.int64)
+	sum_et = int(et.sum())
+	deadline = (int(deadline_factor) / 10) * sum_et
 
-			parent_child_rel[i].append([])
-			parent_child_rel[i][j] = parent_child_rel_flag
+	# Determine response time of the parts #
+	rt = deadline * et / sum_et
 
+	# Write the execution times and the response times to the parts #
+	parts_list_tmp = [] # All the parts in the order of part_list
 	for i in range(num_tasks):
-		desc_rel.append([])
-		for j in range(num_tasks):
-			desc_rel_flag = 0
+		parts_list_tmp.extend(part_list[i])
 
-			for k in range(num_tasks):
-				if parent_child_rel[i][k] == 1:
-					look_for_desc_rel(num_tasks, parent_child_rel, k, j)
+	et = et.tolist()
+	rt = rt.tolist()
+	if num_tasks > 0 and isinstance(parts_list_tmp[0], store.part) and contiguous(parts_list_tmp):
+		parts_list_tmp[0].graph.set_et(parts_list_tmp[0].index, et, rt)
+	else:
+		for k in range(len(parts_list_tmp)):
+			parts_list_tmp[k].et = et[k]
+			parts_list_tmp[k].rt = rt[k]
 
-			desc_rel[i].append([])
-			desc_rel[i][j] = desc_rel_flag
+	# Specify the descendant relation between tasks (unless it is given, e.g., by the cache of the graphs) #
+	if desc_rel == None:
+		desc_rel = descendant_rel(num_tasks, part_list)
 
 	return part_list, deadline, desc_rel
 
+# Check whether the parts stored compactly are kept in the arrays in order, one after another #
+def contiguous(parts_list_tmp):
+	index = []
+	for k in range(len(parts_list_tmp)):
+		index.append(parts_list_tmp[k].index)
+
+	return bool(numpy.all(numpy.diff(index) == 1))
+
 # Generate the graph randomly #
 def graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child):
 	global dep_list
@@ -112,21 +216,21 @@ def graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level,
 	if system_model == 1:
 		# The number of parts for the first task equals the number of tasks #
 		for i in range(num_tasks):
-			part_list[0].append(part(0, i, None, None, None, None, None, None, None, None, None, None))
+			part_list[0].append(part(0, i, None, None, None, None, None))
 		# The number of parts for the next tasks equals 1 #
 		for i in range(num_tasks)[1::]:
-			part_list[i].append(part(i, 0, None, None, None, None, None, None, None, None, None, None))
+			part_list[i].append(part(i, 0, None, None, None, None, None))
 	elif system_model == 2:
 		for i in range(num_tasks):
 			sel_num_parts = random.randint(1, num_parts)
 			for j in range(sel_num_parts):
-				part_list[i].append(part(i, j, None, None, None, None, None, None, None, None, None, None))
+				part_list[i].append(part(i, j, None, None, None, None, None))
 	elif system_model == 3:
 		# Only the first part of each task can create child task, so the number of parts for each task equals 2 #
 		for i in range(num_tasks):
 			sel_num_parts = 2
 			for j in range(sel_num_parts):
-				part_list[i].append(part(i, j, None, None, None, None, None, None, None, None, None, None))
+				part_list[i].append(part(i, j, None, None, None, None, None))
 
 	# Specify the sibling parts into each task #
 	for i in range(num_tasks):
@@ -192,88 +296,201 @@ def graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level,
 			if random.random() <= dep_pro:
 				sel_child_list.append(part_list[i][0])
 
-		index = 0
-		num_curr_dep = 0 # The number of current dependencies
-		while num_curr_dep < len(sel_child_list) - 1:
-			non_dep_list = [] # The non-dependent tasks in the list of child tasks
-			for i in range(len(sel_child_list))[index + 1::]:
-				if sel_child_list[i].dep == None:
-					non_dep_list.append(sel_child_list[i])
-
-			count = 0
-			for i in range(len(non_dep_list)):
-				if count < num_dep_level:
-					non_dep_list[i].dep = sel_child_list[index]
-					count += 1
-					num_curr_dep += 1
-				else:
-					break
-
-			index += 1
+		wire_dep(sel_child_list, num_dep_level)
 	elif system_model == 2:
+		child_group = group_child(num_tasks, part_list)
 		for i in range(num_tasks):
 			for j in range(len(part_list[i])):
-				child_list = []
-				for k in range(num_tasks):
-					if part_list[k][0].parent == part_list[i][j]:
-						child_list.append(part_list[k][0])
+				child_list = child_group.get(part_list[i][j], [])
 
 				sel_child_list = [] # The selected list of child tasks
 				for k in range(len(child_list))[1::]:
 					if random.random() <= dep_pro:
 						sel_child_list.append(child_list[k])
 
-				index = 0
-				num_curr_dep = 0 # The number of current dependencies
-				while num_curr_dep < len(sel_child_list) - 1:
-					non_dep_list = [] # The non-dependent tasks in the list of child tasks
-					for k in range(len(sel_child_list))[index + 1::]:
-						if sel_child_list[k].dep == None:
-							non_dep_list.append(sel_child_list[k])
-
-					count = 0
-					for k in range(len(non_dep_list)):
-						if count < num_dep_level:
-							non_dep_list[k].dep = sel_child_list[index]
-							count += 1
-							num_curr_dep += 1
-						else:
-							break
-
-					index += 1
+				wire_dep(sel_child_list, num_dep_level)
 	elif system_model == 3:
+		child_group = group_child(num_tasks, part_list)
 		for i in range(num_tasks):
-			child_list = []
-			for j in range(num_tasks):
-				if part_list[j][0].parent == part_list[i][0]:
-					child_list.append(part_list[j][0])
+			child_list = child_group.get(part_list[i][0], [])
 
 			sel_child_list = [] # The selected list of child tasks
 			for k in range(len(child_list))[1::]:
 				if random.random() <= dep_pro:
 					sel_child_list.append(child_list[k])
 
-			index = 0
-			num_curr_dep = 0 # The number of current dependencies
-			while num_curr_dep < len(sel_child_list) - 1:
-				non_dep_list = [] # The non-dependent tasks in the list of child tasks
-				for k in range(len(sel_child_list))[index + 1::]:
-					if sel_child_list[k].dep == None:
-						non_dep_list.append(sel_child_list[k])
-
-				count = 0
-				for k in range(len(non_dep_list)):
-					if count < num_dep_level:
-						non_dep_list[k].dep = sel_child_list[index]
-						count += 1
-						num_curr_dep += 1
-					else:
-						break
-
-				index += 1
+			wire_dep(sel_child_list, num_dep_level)
+
+	# Build the index of the child tasks #
+	part_list = index_child(num_tasks, part_list)
+
+	return part_list
+
+# Create a NumPy random generator from a seed #
+def random_generator(seed):
+	if numpy == None:
+		raise ImportError("The 'numpy' module is needed to generate the graph using a NumPy random generator")
+
+	return numpy.random.default_rng(seed)
+
+# Specify the parent task of each child task (Tasks 1 to num_tasks - 1) in the system model 3 using a NumPy random generator #
+# The tasks get their parents in order (like waiting_list and inprogress_list in graph_rand), so Task k is the parent of the next #
+# num_child tasks, where num_child is drawn for each Task k, and the last parent takes the remaining tasks #
+def parent_task_np(num_tasks, min_num_child, max_num_child, rng):
+	num_child_tasks = num_tasks - 1
+	parent_task = [] # The parent tasks of the child tasks (in blocks)
+	k = 0 # The next parent task
+	assigned = 0 # The number of child tasks that have a parent
+	while assigned < num_child_tasks:
+		# Draw the number of child tasks of the next parent tasks (each of them has at least one child task if min_num_child > 0) #
+		size = num_child_tasks - assigned + 1
+		num_child = min_num_child + (rng.random(size) * (max_num_child - min_num_child)).astype(numpy.int64)
+		end = numpy.minimum(assigned + numpy.cumsum(num_child), num_child_tasks)
+		begin = numpy.concatenate(([assigned], end[:-1]))
+
+		# A parent task that has not been created yet (only if min_num_child is 0) cannot have child tasks, so the remaining #
+		# tasks are given to the last parent task, like completed_list in graph_rand #
+		stop = numpy.flatnonzero(k + numpy.arange(size) > begin)
+		if stop.size > 0:
+			s = stop[0]
+			parent_task.append(numpy.repeat(k + numpy.arange(s), end[:s] - begin[:s]))
+			parent_task.append(numpy.full(num_child_tasks - begin[s], k + s - 1))
+			break
+
+		parent_task.append(numpy.repeat(k + numpy.arange(size), end - begin))
+		assigned = end[-1]
+		k += size
+
+	return numpy.concatenate(parent_task + [numpy.zeros(0, dtype = numpy.int64)])
+
+# Specify the data dependencies between the child tasks of each group of siblings using a NumPy random generator #
+# child includes the child tasks sorted by their groups (group), and keeping the order of the tasks in each group #
+# A child task (except the first one of each group if skip_first is True) is selected with the probability dep_pro, and #
+# the selected tasks of a group depend on each other like wire_dep (at most num_dep_level tasks depend on each selected task), #
+# i.e., the selected task r (from 0) depends on the selected task (r - 1) // num_dep_level of the group #
+# The returned array includes the task on which each child task depends (-1 for none) #
+def sibling_dep_np(num_tasks, child, group, skip_first, dep_pro, num_dep_level, rng):
+	dep = numpy.full(num_tasks, -1, dtype = numpy.int64)
+	if child.size == 0:
+		return dep
+
+	# Specify the position of each child task in its group #
+	first = numpy.flatnonzero(numpy.concatenate(([True], group[1:] != group[:-1])))
+	pos = numpy.arange(child.size) - numpy.repeat(first, numpy.diff(numpy.append(first, child.size)))
+
+	# Select the child tasks #
+	selected = rng.random(child.size) <= dep_pro
+	if skip_first:
+		selected &= pos > 0
+	sel = numpy.flatnonzero(selected)
+	if sel.size == 0:
+		return dep
+
+	# Specify the rank of each selected task in its group, and the selected task on which it depends #
+	sel_group = group[sel]
+	sel_first = numpy.flatnonzero(numpy.concatenate(([True], sel_group[1:] != sel_group[:-1])))
+	sel_first_index = numpy.repeat(sel_first, numpy.diff(numpy.append(sel_first, sel.size)))
+	rank = numpy.arange(sel.size) - sel_first_index
+
+	has_dep = rank > 0
+	dep[child[sel[has_dep]]] = child[sel[sel_first_index[has_dep] + (rank[has_dep] - 1) // num_dep_level]]
+
+	return dep
+
+# Create the task parts of a graph from the lists of their details, either at once in the compact storage or one at a time #
+# offset includes the index of the first part of each task (and the number of all the parts at the end), dep, parent and sibling #
+# are the indices of the parts (-1 for no part), and the child tasks of part k are child[child_offset[k]:child_offset[k + 1]] #
+def create_parts(num_tasks, part, offset, t_id, p_id, dep, parent, sibling, num_succ, child_offset, child):
+	num_all_parts = len(t_id)
+
+	if isinstance(part, store.graph):
+		parts_list_tmp = part.extend(t_id, p_id, dep, parent, sibling, num_succ)
+	else:
+		parts_list_tmp = [] # All the parts in the order of their indices
+		for k in range(num_all_parts):
+			parts_list_tmp.append(part(t_id[k], p_id[k], None, None, None, None, None))
+			parts_list_tmp[k].num_succ = num_succ[k]
+
+		# Specify the sibling parts, the parent of each child task and the data dependencies #
+		for k in range(num_all_parts):
+			if sibling[k] != -1:
+				parts_list_tmp[k].sibling = parts_list_tmp[sibling[k]]
+			if parent[k] != -1:
+				parts_list_tmp[k].parent = parts_list_tmp[parent[k]]
+			if dep[k] != -1:
+				parts_list_tmp[k].dep = parts_list_tmp[dep[k]]
+
+	# Split the parts into the tasks #
+	part_list = []
+	for i in range(num_tasks):
+		part_list.append(parts_list_tmp[offset[i]:offset[i + 1]])
+
+	# Build the index of the child tasks #
+	for k in range(num_all_parts):
+		for c in range(child_offset[k], child_offset[k + 1]):
+			parts_list_tmp[k].child.append(parts_list_tmp[child[c]])
 
 	return part_list
 
+# Generate the graph randomly using a NumPy random generator (rng), for large graphs #
+# The graph has the same distributions as graph_rand, but the random choices are drawn as arrays instead of one at a time: #
+# the number of parts, the parent of each child task (uniform over the parts of the previous tasks in the system model 2) #
+# and the data dependencies between the sibling tasks #
+def graph_rand_np(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, rng):
+	# Specify the number of parts of each task #
+	if system_model == 1:
+		# The number of parts for the first task equals the number of tasks, and it equals 1 for the next tasks #
+		part_count = numpy.ones(num_tasks, dtype = numpy.int64)
+		part_count[0] = num_tasks
+	elif system_model == 2:
+		part_count = rng.integers(1, num_parts, size = num_tasks, endpoint = True)
+	elif system_model == 3:
+		# Only the first part of each task can create child task, so the number of parts for each task equals 2 #
+		part_count = numpy.full(num_tasks, 2, dtype = numpy.int64)
+
+	# The index of the first part of each task among all the parts #
+	offset = numpy.concatenate(([0], numpy.cumsum(part_count)))
+
+	# Specify the parent of each child task (the index of the part), and the groups of the child tasks with the same parent #
+	child = numpy.arange(1, num_tasks)
+	if system_model == 1:
+		parent = child - 1
+		group = numpy.zeros(num_tasks - 1, dtype = numpy.int64)
+	elif system_model == 2:
+		# Each task takes one of the parts of the previous tasks uniformly #
+		parent = rng.integers(0, offset[1:num_tasks])
+		group = parent
+	elif system_model == 3:
+		parent = offset[parent_task_np(num_tasks, min_num_child, max_num_child, rng)]
+		group = parent
+
+	# Specify the data dependencies between sibling tasks #
+	order = numpy.argsort(group, kind = 'stable')
+	dep = sibling_dep_np(num_tasks, child[order], group[order], system_model != 1, dep_pro, num_dep_level, rng)
+
+	# Specify the details of all the parts as arrays (the indices of the parts, -1 for no part) #
+	num_all_parts = int(offset[num_tasks])
+	t_id = numpy.repeat(numpy.arange(num_tasks), part_count)
+	p_id = numpy.arange(num_all_parts) - numpy.repeat(offset[:num_tasks], part_count)
+	sibling = numpy.arange(1, num_all_parts + 1)
+	sibling[offset[1:] - 1] = -1
+	parent_part = numpy.full(num_all_parts, -1, dtype = numpy.int64)
+	parent_part[offset[1:num_tasks]] = parent
+	dep_part = numpy.full(num_all_parts, -1, dtype = numpy.int64)
+	has_dep = numpy.flatnonzero(dep >= 0)
+	dep_part[offset[has_dep]] = offset[dep[has_dep]]
+
+	# The number of immediate successors of each part (the child tasks and the sibling part), like index_child #
+	num_succ = numpy.bincount(parent, minlength = num_all_parts) + (sibling >= 0)
+
+	# The child tasks (their first parts) of each part in the order of the tasks, like index_child #
+	child_offset = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(parent, minlength = num_all_parts))))
+	child_part = offset[1:num_tasks][numpy.argsort(parent, kind = 'stable')]
+
+	# Create the task parts #
+	return create_parts(num_tasks, part, offset.tolist(), t_id.tolist(), p_id.tolist(), dep_part.tolist(), parent_part.tolist(), sibling.tolist(), \
+		num_succ.tolist(), child_offset.tolist(), child_part.tolist())
+
 #  Generate the graph based on a predefined structure #
 def graph_predef(num_tasks, part):
 	# Initialize the task parts #
@@ -281,19 +498,19 @@ def graph_predef(num_tasks, part):
 	for i in range(num_tasks):
 		part_list.append([])
 
-	part_list[0].append(part(0, 0, None, None, None, None, None, None, None, None, None, None))
-	part_list[0].append(part(0, 1, None, None, None, None, None, None, None, None, None, None))
-	part_list[0].append(part(0, 2, None, None, None, None, None, None, None, None, None, None))
-	part_list[1].append(part(1, 0, None, None, None, None, None, None, None, None, None, None))
-	part_list[1].append(part(1, 1, None, None, None, None, None, None, None, None, None, None))
-	part_list[1].append(part(1, 2, None, None, None, None, None, None, None, None, None, None))
-	part_list[2].append(part(2, 0, None, None, None, None, None, None, None, None, None, None))
-	part_list[2].append(part(2, 1, None, None, None, None, None, None, None, None, None, None))
-	part_list[3].append(part(3, 0, None, None, None, None, None, None, None, None, None, None))
-	part_list[4].append(part(4, 0, None, None, None, None, None, None, None, None, None, None))
-	part_list[5].append(part(5, 0, None, None, None, None, None, None, None, None, None, None))
-	part_list[5].append(part(5, 1, None, None, None, None, None, None, None, None, None, None))
-	part_list[6].append(part(6, 0, None, None, None, None, None, None, None, None, None, None))
+	part_list[0].append(part(0, 0, None, None, None, None, None))
+	part_list[0].append(part(0, 1, None, None, None, None, None))
+	part_list[0].append(part(0, 2, None, None, None, None, None))
+	part_list[1].append(part(1, 0, None, None, None, None, None))
+	part_list[1].append(part(1, 1, None, None, None, None, None))
+	part_list[1].append(part(1, 2, None, None, None, None, None))
+	part_list[2].append(part(2, 0, None, None, None, None, None))
+	part_list[2].append(part(2, 1, None, None, None, None, None))
+	part_list[3].append(part(3, 0, None, None, None, None, None))
+	part_list[4].append(part(4, 0, None, None, None, None, None))
+	part_list[5].append(part(5, 0, None, None, None, None, None))
+	part_list[5].append(part(5, 1, None, None, None, None, None))
+	part_list[6].append(part(6, 0, None, None, None, None, None))
 
 	# Specify the sibling parts into each task #
 	part_list[0][0].sibling = part_list[0][1]
@@ -315,4 +532,201 @@ def graph_predef(num_tasks, part):
 	part_list[1][2].dep = part_list[2][1]
 	part_list[5][0].dep = part_list[4][0]
 
+	# Build the index of the child tasks #
+	part_list = index_child(num_tasks, part_list)
+
+	return part_list
+
+# Load a graph (e.g., a benchmark) from a file in the JSON lines format, and return the same structure as graph_predef #
+# Each line of the file is one part, e.g., {"t_id": 1, "p_id": 0, "et": 5, "parent": [0, 0], "sibling": [1, 1], "dep": null}, #
+# where the parts are referred to by [t_id, p_id], et (optional) is the execution time, parent is given only for the first part #
+# of each task except Task 0, and sibling (optional) is the next part of the task #
+# The file is read one line at a time, so the text is not kept in memory, and the references are checked after reading all the parts #
+def graph_load(file_name, part):
+	index = {} # The part of each [t_id, p_id]
+	ref_list = [] # The references (part, field, t_id, p_id, line number) to check after reading all the parts
+	line_num = 0
+
+	with open(file_name) as file:
+		for line in file:
+			line_num += 1
+			if not line.strip():
+				continue
+
+			# Read the part #
+			try:
+				fields = json.loads(line)
+			except ValueError as error:
+				raise ValueError(file_name + ', line ' + str(line_num) + ': ' + str(error))
+			if not isinstance(fields, dict):
+				raise ValueError(file_name + ', line ' + str(line_num) + ': a part must be a JSON object')
+
+			t_id = fields.get('t_id')
+			p_id = fields.get('p_id')
+			et = fields.get('et')
+			if not is_count(t_id) or not is_count(p_id):
+				raise ValueError(file_name + ', line ' + str(line_num) + ': t_id and p_id must be non-negative integers')
+			if et != None and (not is_count(et) or et == 0):
+				raise ValueError(file_name + ', line ' + str(line_num) + ': et must be a positive integer')
+			if (t_id, p_id) in index:
+				raise ValueError(file_name + ', line ' + str(line_num) + ': p' + str(t_id) + str(p_id) + ' is given more than once')
+
+			index[(t_id, p_id)] = part(t_id, p_id, et, None, None, None, None)
+
+			# Keep the references to the other parts #
+			for field in ['parent', 'sibling', 'dep']:
+				ref = fields.get(field)
+				if ref != None:
+					if not isinstance(ref, list) or len(ref) != 2 or not is_count(ref[0]) or not is_count(ref[1]):
+						raise ValueError(file_name + ', line ' + str(line_num) + ': ' + field + ' must be [t_id, p_id] or null')
+					ref_list.append((index[(t_id, p_id)], field, ref[0], ref[1], line_num))
+				elif field == 'sibling' and field in fields:
+					# The part is the last part of the task #
+					ref_list.append((index[(t_id, p_id)], field, -1, -1, line_num))
+
+	# Specify the number of tasks and the number of parts of each task #
+	num_tasks = 0
+	for t_id, p_id in index:
+		num_tasks = max(num_tasks, t_id + 1)
+
+	num_parts = []
+	for i in range(num_tasks):
+		num_parts.append(0)
+	for t_id, p_id in index:
+		num_parts[t_id] = max(num_parts[t_id], p_id + 1)
+
+	if num_tasks == 0:
+		raise ValueError(file_name + ': the file does not include any parts')
+
+	# Create the list of tasks, and check that the parts of each task are numbered from 0 without any gaps #
+	part_list = []
+	for i in range(num_tasks):
+		part_list.append([])
+		for j in range(num_parts[i]):
+			if (i, j) not in index:
+				raise ValueError(file_name + ': p' + str(i) + str(j) + ' is not given')
+			part_list[i].append(index[(i, j)])
+
+	# Specify the sibling parts into each task (the next part of the task, unless the sibling is given) #
+	for i in range(num_tasks):
+		for j in range(len(part_list[i]) - 1):
+			part_list[i][j].sibling = part_list[i][j + 1]
+
+	# Specify the parents and the data dependencies, and check the references #
+	for ref_part, field, t_id, p_id, line_num in ref_list:
+		position = file_name + ', line ' + str(line_num) + ': ' + field + ' of p' + str(ref_part.t_id) + str(ref_part.p_id)
+		if field == 'sibling':
+			if (ref_part.sibling == None and t_id != -1) or (ref_part.sibling != None and (t_id, p_id) != (ref_part.t_id, ref_part.p_id + 1)):
+				raise ValueError(position + ' must be the next part of the task')
+			continue
+
+		if (t_id, p_id) not in index:
+			raise ValueError(position + ' refers to p' + str(t_id) + str(p_id) + ', which is not given')
+		if t_id == ref_part.t_id:
+			raise ValueError(position + ' must be a part of another task')
+
+		if field == 'parent':
+			if ref_part.p_id != 0:
+				raise ValueError(position + ' is given, but only the first part of a task has a parent')
+			ref_part.parent = index[(t_id, p_id)]
+		else:
+			ref_part.dep = index[(t_id, p_id)]
+
+	# Check that all the tasks are created from Task 0 (i.e., the tasks form a tree rooted at Task 0 without any cycles) #
+	child_task = [] # The child tasks of each task
+	for i in range(num_tasks):
+		child_task.append([])
+	for i in range(num_tasks)[1::]:
+		if part_list[i][0].parent == None:
+			raise ValueError(file_name + ': p' + str(i) + '0 does not have a parent')
+		child_task[part_list[i][0].parent.t_id].append(i)
+	if part_list[0][0].parent != None:
+		raise ValueError(file_name + ': p00 must not have a parent')
+
+	order = [0] # The tasks created from Task 0
+	k = 0
+	while k < len(order):
+		order.extend(child_task[order[k]])
+		k += 1
+	if len(order) != num_tasks:
+		raise ValueError(file_name + ': the parents of the tasks include a cycle')
+
+	# Check that all the parts can become ready #
+	check_precedence(file_name, num_tasks, part_list)
+
+	# Build the index of the child tasks #
+	part_list = index_child(num_tasks, part_list)
+
 	return part_list
+
+# Check that the precedence graph of the parts does not include a cycle using Kahn's algorithm, since the parts of a cycle never become ready #
+# Each part waits for its previous sibling part (or the parent of the task for the first part) and its data dependency #
+def check_precedence(file_name, num_tasks, part_list):
+	# Specify the parts that each part waits for (the predecessors) and the parts that wait for each part (the successors) #
+	pred = {}
+	succ = {}
+	for i in range(num_tasks):
+		for j in range(len(part_list[i])):
+			pred[(i, j)] = []
+			succ[(i, j)] = []
+
+	for i in range(num_tasks):
+		for j in range(len(part_list[i])):
+			part = part_list[i][j]
+			if j > 0:
+				pred[(i, j)].append((i, j - 1))
+			elif part.parent != None:
+				pred[(i, j)].append((part.parent.t_id, part.parent.p_id))
+			if part.dep != None:
+				pred[(i, j)].append((part.dep.t_id, part.dep.p_id))
+
+			for k in range(len(pred[(i, j)])):
+				succ[pred[(i, j)][k]].append((i, j))
+
+	# Remove the parts without any predecessors one after another #
+	num_pred = {} # The number of the predecessors of each part that are not removed
+	order = [] # The removed parts
+	for node in pred:
+		num_pred[node] = len(pred[node])
+		if num_pred[node] == 0:
+			order.append(node)
+
+	k = 0
+	while k < len(order):
+		for node in succ[order[k]]:
+			num_pred[node] -= 1
+			if num_pred[node] == 0:
+				order.append(node)
+		k += 1
+
+	if len(order) == len(pred):
+		return
+
+	# Each remaining part has a remaining predecessor, so following them from any remaining part leads to a cycle #
+	for node in pred:
+		if num_pred[node] != 0:
+			break
+
+	path = [] # The parts in the order of following the predecessors
+	visited = set()
+	while node not in visited:
+		path.append(node)
+		visited.add(node)
+		for prev in pred[node]:
+			if num_pred[prev] != 0:
+				node = prev
+				break
+
+	# Take the parts of the cycle (from the repeated part to the end of the path) in the order of waiting #
+	cycle = path[path.index(node):]
+	cycle.reverse()
+
+	names = []
+	for t_id, p_id in cycle + [cycle[0]]:
+		names.append('p' + str(t_id) + str(p_id))
+	raise ValueError(file_name + ': the sibling parts, the parents and the data dependencies include a cycle, so p' + str(node[0]) + str(node[1]) + \
+		' never becomes ready (each part waits for the previous one: ' + ' -> '.join(names) + ')')
+
+# Check whether a value of the file of a graph is a non-negative integer #
+def is_count(value):
+	return isinstance(value, int) and not isinstance(value, bool) and value >= 0
@@ -17,21 +17,15 @@
  # See the License for the specific language governing permissions and
  # limitations under the License.
  #**************************************************************************
+from heapq import heapify, heappop, heappush
 from operator import itemgetter
+import engine
+import cost
 import func
 import threading
 import time
 
-# Global variables #
-t = 0 # Response time
-alloc_queue = [] # The allocation queues of the threads
-suspend_list = [] # The list of tasks suspended on the threads
-last_idle = [] # Last idle time of the threads (-1 for a busy thread)
-execution_queue = [] # The execution queues of the threads
-curr_thr = 0 # The current thread
-parts_cnt = 0 # The number of all the parts
-comp_parts_cnt = 0 # The number of completed parts
-
+# Default weights of the TMCD (alpha, beta and gamma) and MCD (theta and psi) heuristics #
 alpha = 0.2
 beta = 0.5
 gamma = 0.3
@@ -39,196 +33,351 @@ gamma = 0.3
 theta = 0.4
 psi = 0.6
 
-# Specify the clock of the system #
-def clock(num_threads):
-	global t, parts_cnt, comp_parts_cnt
-
-	while comp_parts_cnt < parts_cnt:
-		t += 1
-		time.sleep(0.001)
-
-# Select an allocation queue using one of the scheduling heuristics #
-def schedule_heuristic(num_threads, schedule_alg):
-	global last_idle, alloc_queue, curr_thr, t, alpha, beta, gamma, delta
-
-	thr_list = [] # The thread numbers
-	thr_list_sort = [] # The sorted thread numbers
-
-	# The MNTP heuristic #
-	if schedule_alg == 'MNTP':
-		# Determine the number of parts existing in the queues #
-		for i in range(num_threads):
-			thr_list.append([i, len(alloc_queue[i])])
-
-		# Sort the numbers based on the minimum number of parts #
-		thr_list = sorted(thr_list, key = itemgetter(1), reverse = False)
-		for i in range(num_threads):
-			thr_list_sort.append(thr_list[i][0])
-
-	# The NT heuristic #
-	if schedule_alg == 'NT':
-		# Specify the numbers based on the current thread #
-		for i in range(num_threads)[curr_thr + 1::]:
-			thr_list_sort.append(i)
-		for i in range(num_threads)[:curr_thr + 1:]:
-			thr_list_sort.append(i)
-
-	# The MRIT heuristic #
-	if schedule_alg == 'MRIT':
-		# Calculate the recent idle time of the threads #
-		for i in range(num_threads):
-			if last_idle[i] != -1:
-				thr_list.append([i, t - last_idle[i]])
+# Define the class of the scheduler of the new mapping algorithm, which keeps the state of one mapping process #
+class scheduler:
+	def __init__(self):
+		self.t = 0 # Response time
+		self.alloc_queue = [] # The allocation queues of the threads (the parts in the order of their arrival and their sequence numbers)
+		self.alloc_heap = [] # The heaps of the allocation queues keyed by the allocation heuristic (MET and MRT)
+		self.alloc_seq = 0 # The sequence number of the next part added to the allocation queues
+		self.alloc_alg = None # The allocation heuristic
+		self.blocked_dep = {} # The entries of the heaps of the parts waiting for their data dependency, keyed by the related part (with the thread numbers)
+		self.blocked_thr = [] # The entries of the heaps of the first parts of tied tasks that cannot be started on the threads yet
+		self.queue_et = [] # Total execution time of the allocation queues
+		self.queue_rt = [] # Total response time of the allocation queues (see queue_total_rt)
+		self.rt_changed = [] # Whether a part has been removed from the allocation queues since their total response time was calculated
+		self.total_num_parts = 0 # The number of parts existing in all the allocation queues
+		self.total_et = 0 # Total execution time of all the allocation queues
+		self.schedule_alg = None # The scheduling heuristic
+		self.queue_order = None # The heap of the allocation queues keyed by the scheduling heuristic (MNTP, MTET and MTRT), including old keys that are skipped
+		self.queue_ver = [] # The version of the key of the allocation queues (an entry of the heap with an older version is an old key)
+		self.queue_lock = threading.Lock() # The lock of the allocation queues (the threads of the clock-based simulation change them concurrently)
+		self.suspend_list = [] # The list of tasks suspended on the threads
+		self.allowed = [] # The tasks that can be started on the threads, kept as the suspended tasks change (see func.allowed_tasks)
+		self.last_idle = [] # Last idle time of the threads (-1 for a busy thread)
+		self.execution_queue = [] # The execution queues of the threads
+		self.curr_thr = 0 # The current thread
+		self.details = {} # The details of the mapping process of the parts (see func.detail), kept apart from the parts of the graph
+		self.parts_cnt = 0 # The number of all the parts
+		self.comp_parts_cnt = 0 # The number of completed parts
+
+		# Weights of the heuristics, which can be changed for each scheduler #
+		self.alpha = alpha
+		self.beta = beta
+		self.gamma = gamma
+		self.theta = theta
+		self.psi = psi
+
+	# Specify the clock of the system #
+	def clock(self, num_threads):
+		while self.comp_parts_cnt < self.parts_cnt:
+			self.t += 1
+			time.sleep(0.001)
+
+	# The key of an allocation queue in the order of the queues #
+	# The thread number breaks the ties, so the order is the same as sorting the threads in order (a stable sort) #
+	# The response time of each part is proportional to its execution time (see gen.specify_rt), so the MTRT heuristic is keyed by #
+	# the total execution time (the maximum first), and the ties are broken by the total response time in ordered_threads #
+	def queue_key(self, thr_num):
+		if self.schedule_alg == 'MNTP':
+			return (len(self.alloc_queue[thr_num]), thr_num)
+		elif self.schedule_alg == 'MTET':
+			return (self.queue_et[thr_num], thr_num)
+		else:
+			return (-self.queue_et[thr_num], thr_num)
+
+	# Add a part to (sign = 1) or remove a part from (sign = -1) the allocation queue of a thread #
+	# The totals of the queues and the order of the queues are updated (in O(log(threads)) time), instead of being calculated again by the scheduling heuristics #
+	def update_alloc_queue(self, thr_num, part, sign):
+		with self.queue_lock:
+			if sign == 1:
+				self.alloc_queue[thr_num][part] = self.alloc_seq
+
+				# Put the part in the heap of the queue, keyed by the allocation heuristic and the sequence number of the part #
+				if self.alloc_alg == 'MET':
+					heappush(self.alloc_heap[thr_num], (part.et, self.alloc_seq, part))
+				elif self.alloc_alg == 'MRT':
+					heappush(self.alloc_heap[thr_num], (-part.rt, self.alloc_seq, part))
+
+				self.alloc_seq += 1
+				self.queue_rt[thr_num] += part.rt
 			else:
-				thr_list.append([i, 0])
-
-		# Sort the numbers based on the most recent idle time #
-		thr_list = sorted(thr_list, key = itemgetter(1), reverse = True)
-		for i in range(num_threads):
-			thr_list_sort.append(thr_list[i][0])
-
-	# The MTET heuristic #
-	elif schedule_alg == 'MTET':
-		# Calculate the total execution time of the queues #
-		for i in range(num_threads):
-			total_et = 0
-			for j in range(len(alloc_queue[i])):
-				total_et += alloc_queue[i][j].et
-
-			thr_list.append([i, total_et])
-
-		# Sort the numbers based on the minimum total execution time #
-		thr_list = sorted(thr_list, key = itemgetter(1), reverse = False)
-		for i in range(num_threads):
-			thr_list_sort.append(thr_list[i][0])
-
-	# The MTRT heuristic #
-	elif schedule_alg == 'MTRT':
-		# Calculate the total response time of the queues #
-		for i in range(num_threads):
+				del self.alloc_queue[thr_num][part]
+				self.rt_changed[thr_num] = True
+
+			self.queue_et[thr_num] += sign * part.et
+			self.total_num_parts += sign
+			self.total_et += sign * part.et
+
+			# Put the new key of the queue in the order of the queues, and leave the old key in the heap #
+			if self.queue_order != None:
+				self.queue_ver[thr_num] += 1
+				heappush(self.queue_order, self.queue_key(thr_num) + (self.queue_ver[thr_num], ))
+
+				# Build the heap again from the current keys if it includes too many old keys #
+				if len(self.queue_order) > 2 * len(self.queue_ver):
+					self.sort_queues()
+
+	# Add a part to the allocation queue of a thread #
+	def push_alloc_queue(self, thr_num, part):
+		self.update_alloc_queue(thr_num, part, 1)
+
+	# Remove a part from the allocation queue of a thread #
+	def pop_alloc_queue(self, thr_num, part):
+		self.update_alloc_queue(thr_num, part, -1)
+
+	# Sort the allocation queues by their current keys (a heap) #
+	def sort_queues(self):
+		self.queue_order = []
+		for i in range(len(self.queue_ver)):
+			self.queue_order.append(self.queue_key(i) + (self.queue_ver[i], ))
+		heapify(self.queue_order)
+
+	# The total response time of an allocation queue, added in the order of the parts in the queue like the MTRT heuristic #
+	# It is kept while the parts are added, and calculated again only if a part has been removed since the last time #
+	def queue_total_rt(self, thr_num):
+		if self.rt_changed[thr_num]:
 			total_rt = 0
-			for j in range(len(alloc_queue[i])):
-				total_rt += alloc_queue[i][j].rt
+			for part in self.alloc_queue[thr_num]:
+				total_rt += part.rt
+			self.queue_rt[thr_num] = total_rt
+			self.rt_changed[thr_num] = False
+
+		return self.queue_rt[thr_num]
+
+	# The key of an allocation queue in the order of the MTRT heuristic (the maximum total response time first) #
+	def mtrt_key(self, thr_num):
+		return (-self.queue_et[thr_num], -self.queue_total_rt(thr_num))
+
+	# Take the thread numbers from the order of the queues, except thr_excl, as many as the new ready parts #
+	# Only the first threads are taken from the heap (in O(num_ready * log(threads)) time, apart from the old keys and the ties of MTRT) #
+	def ordered_threads(self, num_ready, thr_excl):
+		with self.queue_lock:
+			thr_list_sort = []
+			entries = [] # The current keys taken from the heap
+			while bool(self.queue_order):
+				entry = heappop(self.queue_order)
+
+				# Skip the old keys #
+				if entry[2] != self.queue_ver[entry[1]]:
+					continue
+
+				# Stop after the threads needed, but for MTRT, also take the threads with the same total execution time as the last one #
+				if len(thr_list_sort) >= num_ready and (self.schedule_alg != 'MTRT' or entry[0] != entries[len(entries) - 1][0]):
+					heappush(self.queue_order, entry)
+					break
+
+				entries.append(entry)
+				if entry[1] != thr_excl:
+					thr_list_sort.append(entry[1])
+
+			# Put the current keys back in the heap #
+			for i in range(len(entries)):
+				heappush(self.queue_order, entries[i])
+
+			# Sort the threads with the same total execution time by the maximum total response time (a stable sort keeps the order of the threads on ties) #
+			if self.schedule_alg == 'MTRT':
+				thr_list_sort = sorted(thr_list_sort, key = self.mtrt_key)
+				del thr_list_sort[num_ready:]
+
+		return thr_list_sort
+
+	# Select the allocation queues for the new ready parts (num_ready) using one of the scheduling heuristics #
+	# The threads are returned in order, except thr_excl (if any), and only the first num_ready threads are needed #
+	def schedule_heuristic(self, num_threads, schedule_alg, num_ready, thr_excl):
+		thr_list = [] # The thread numbers
+		thr_list_sort = [] # The sorted thread numbers
+
+		# The MNTP heuristic #
+		if schedule_alg == 'MNTP':
+			# Take the numbers from the order of the queues (the minimum number of parts first) #
+			thr_list_sort = self.ordered_threads(num_ready, thr_excl)
+
+		# The NT heuristic #
+		if schedule_alg == 'NT':
+			# Specify the numbers based on the current thread #
+			for i in range(num_threads)[self.curr_thr + 1::]:
+				thr_list_sort.append(i)
+			for i in range(num_threads)[:self.curr_thr + 1:]:
+				thr_list_sort.append(i)
+
+		# The MRIT heuristic #
+		if schedule_alg == 'MRIT':
+			# Calculate the recent idle time of the threads #
+			for i in range(num_threads):
+				if self.last_idle[i] != -1:
+					thr_list.append([i, self.t - self.last_idle[i]])
+				else:
+					thr_list.append([i, 0])
+
+			# Sort the numbers based on the most recent idle time #
+			thr_list = sorted(thr_list, key = itemgetter(1), reverse = True)
+			for i in range(num_threads):
+				thr_list_sort.append(thr_list[i][0])
+
+		# The MTET heuristic #
+		elif schedule_alg == 'MTET':
+			# Take the numbers from the order of the queues (the minimum total execution time first) #
+			thr_list_sort = self.ordered_threads(num_ready, thr_excl)
+
+		# The MTRT heuristic #
+		elif schedule_alg == 'MTRT':
+			# Take the numbers from the order of the queues (the maximum total response time first) #
+			thr_list_sort = self.ordered_threads(num_ready, thr_excl)
+
+		# The TMCD heuristic #
+		elif schedule_alg == 'TMCD':
+			# Take the number of parts of the queues #
+			num_parts = []
+			for i in range(num_threads):
+				num_parts.append(len(self.alloc_queue[i]))
+
+			# Calculate the cost of the queues from the recent idle time of the threads and the totals of the queues #
+			thr_cost = cost.tmcd_cost(self.alpha, self.beta, self.gamma, num_parts, cost.recent_idle_time(self.last_idle, self.t), self.queue_et)
+
+			# Sort the numbers based on the least cost #
+			thr_list_sort = cost.least_cost_order(thr_cost)
+
+		# Remove thr_excl from the list of threads, and keep the first threads, if the list includes all the threads #
+		if self.queue_order == None:
+			if thr_excl != None:
+				thr_list_sort.remove(thr_excl)
+			del thr_list_sort[num_ready:]
+
+		return thr_list_sort
+
+	# Choose a part from the allocation queue using one of the allocation heuristics #
+	def alloc_heuristic(self, sel_parts, alloc_alg):
+		# The MET heuristic #
+		if alloc_alg == 'MET':
+			part_id = 0
+			# Find the queue with the minimum execution time #
+			for i in range(len(sel_parts))[1::]:
+				if sel_parts[i].et < sel_parts[part_id].et:
+					part_id = i
+
+		# The MRT heuristic #
+		if alloc_alg == 'MRT':
+			part_id = 0
+			# Find the queue with the maximum response time #
+			for i in range(len(sel_parts))[1::]:
+				if sel_parts[i].rt > sel_parts[part_id].rt:
+					part_id = i
+
+		# The MCD heuristic #
+		if alloc_alg == 'MCD':
+			# Take the execution time and the response time of the parts #
+			et = []
+			rt = []
+			for i in range(len(sel_parts)):
+				et.append(sel_parts[i].et)
+				rt.append(sel_parts[i].rt)
+
+			# Calculate the cost of each part, and select the part with the least cost #
+			part_id = cost.least_cost(cost.mcd_cost(self.theta, self.psi, et, rt))
+
+		return sel_parts[part_id]
+
+	# Check whether a part in the allocation queue of a thread can be chosen #
+	# The part must not have a data dependency or the related part must be finished, and for tied tasks (desc_rel is given), #
+	# a new task can be started on the thread only if it is a descendant of all the tasks suspended on the thread #
+	def eligible_part(self, thr_num, part, desc_rel):
+		if not func.dep_satisfied(self.details, part):
+			return False
+
+		if desc_rel != None and part.p_id == 0:
+			if not func.is_allowed(self.allowed[thr_num], part.t_id):
+				return False
+
+		return True
+
+	# Put the parts waiting for a finished part back in the heaps of the allocation queues #
+	def release_dep(self, part):
+		with self.queue_lock:
+			entries = self.blocked_dep.pop(part, None)
+			if entries != None:
+				for i in range(len(entries)):
+					heappush(self.alloc_heap[entries[i][0]], entries[i][1])
+
+	# Put the first parts of tied tasks set aside on a thread back in the heap of its allocation queue, when a task suspended on the thread is finished #
+	def release_thr(self, thr_num):
+		with self.queue_lock:
+			for i in range(len(self.blocked_thr[thr_num])):
+				heappush(self.alloc_heap[thr_num], self.blocked_thr[thr_num][i])
+			self.blocked_thr[thr_num] = []
+
+	# Choose one of the eligible parts in the allocation queue of a thread using one of the allocation heuristics #
+	# None is returned if there are not any eligible parts #
+	def choose_part(self, thr_num, alloc_alg, desc_rel):
+		with self.queue_lock:
+			sel_part = None
+
+			# The MET and MRT heuristics take the first eligible part from the heap of the queue, which is the same part #
+			# as scanning the queue in order, while the parts that are not eligible yet (see eligible_part) are set aside #
+			# until the part or the thread that blocks them is finished (see release_dep and release_thr) #
+			if alloc_alg == 'MET' or alloc_alg == 'MRT':
+				heap = self.alloc_heap[thr_num]
+				while bool(heap):
+					entry = heappop(heap)
+					part = entry[2]
+
+					# The related part of the data dependency is not finished #
+					if not func.dep_satisfied(self.details, part):
+						if part.dep not in self.blocked_dep:
+							self.blocked_dep[part.dep] = []
+						self.blocked_dep[part.dep].append((thr_num, entry))
+
+					# The task cannot be started on the thread until one of the tasks suspended on the thread is finished #
+					elif desc_rel != None and part.p_id == 0 and not func.is_allowed(self.allowed[thr_num], part.t_id):
+						self.blocked_thr[thr_num].append(entry)
 
-			thr_list.append([i, total_rt])
-
-		# Sort the numbers based on the maximum total response time #
-		thr_list = sorted(thr_list, key = itemgetter(1), reverse = True)
-		for i in range(num_threads):
-			thr_list_sort.append(thr_list[i][0])
+					else:
+						sel_part = part
+						break
 
-	# The TMCD heuristic #
-	elif schedule_alg == 'TMCD':
-		# Calculate the recent idle time of the threads #
-		rec_idle_time = []
-		for i in range(num_threads):
-			if last_idle[i] != -1:
-				rec_idle_time.append(t - last_idle[i])
+			# The cost of the MCD heuristic depends on all the eligible parts, so the queue is scanned #
 			else:
-				rec_idle_time.append(0)
+				sel_parts = []
+				for part in self.alloc_queue[thr_num]:
+					if self.eligible_part(thr_num, part, desc_rel):
+						sel_parts.append(part)
 
-		# Calculate total number of parts, total execution time, and total response time of the queues #
-		total_num_parts = 0
-		total_it = 0
-		total_et = 0
-		for i in range(num_threads):
-			total_it += rec_idle_time[i]
-			for j in range(len(alloc_queue[i])):
-				total_num_parts += 1
-				total_et += alloc_queue[i][j].et
-
-		if total_num_parts == 0:
-			total_num_parts = 1
-		if total_et == 0:
-			total_et = 1
+				if bool(sel_parts):
+					sel_part = self.alloc_heuristic(sel_parts, alloc_alg)
 
-		# Calculate the cost of the queues #
-		for i in range(num_threads):
-			sum_et = 0
-			for j in range(len(alloc_queue[i])):
-				sum_et += alloc_queue[i][j].et
+		return sel_part
 
-			if rec_idle_time[i] != 0:
-				val_it = 1 / (rec_idle_time[i] / total_it)
-			else:
-				val_it = 0
+	# The mapping process for tied tasks #
+	def mapping_tied(self, thr_num, num_tasks, num_threads, part_list, desc_rel, schedule_alg, alloc_alg):
+		# Continue the mapping process while the allocation queues of the threads are not empty, as well as #
+		# the execution queues of the threads include any parts in the execution status #
+		while self.comp_parts_cnt < self.parts_cnt:
+			self.step_tied(thr_num, num_tasks, num_threads, part_list, desc_rel, schedule_alg, alloc_alg)
 
-			thr_list.append([i, alpha * len(alloc_queue[i]) / total_num_parts + beta * val_it + gamma * sum_et / total_et])
-
-		# Sort the numbers based on the least cost #
-		thr_list = sorted(thr_list, key = itemgetter(1), reverse = False)
-		for i in range(num_threads):
-			thr_list_sort.append(thr_list[i][0])
-
-	return thr_list_sort
-
-# Choose a part from the allocation queue using one of the allocation heuristics #
-def alloc_heuristic(sel_parts, alloc_alg):
-	global theta, psi
-
-	# The MET heuristic #
-	if alloc_alg == 'MET':
-		part_id = 0
-		# Find the queue with the minimum execution time #
-		for i in range(len(sel_parts))[1::]:
-			if sel_parts[i].et < sel_parts[part_id].et:
-				part_id = i
-
-	# The MRT heuristic #
-	if alloc_alg == 'MRT':
-		part_id = 0
-		# Find the queue with the maximum response time #
-		for i in range(len(sel_parts))[1::]:
-			if sel_parts[i].rt > sel_parts[part_id].rt:
-				part_id = i
-
-	# The MCD heuristic #
-	if alloc_alg == 'MCD':
-		# Calculate total execution time and total response time of the parts #
-		total_et = 0
-		total_rt = 0
-		for i in range(len(sel_parts)):
-			total_et += sel_parts[i].et
-			total_rt += sel_parts[i].rt
-
-		# Calculate the cost of each part #
-		cost = []
-		for i in range(len(sel_parts)):
-			cost.append(theta * sel_parts[i].et / total_et + psi * 1 / (sel_parts[i].rt / total_rt))
-
-		# Select the part with the least cost #
-		part_id = 0
-		for i in range(len(sel_parts)):
-			if cost[i] < cost[part_id]:
-				part_id = i
-
-	return sel_parts[part_id]
-
-# The mapping process for tied tasks #
-def mapping_tied(thr_num, num_tasks, num_threads, part_list, desc_rel, schedule_alg, alloc_alg):
-	global alloc_queue, suspend_list, last_idle, execution_queue, curr_thr, t, parts_cnt, comp_parts_cnt
-
-	# Continue the mapping process while the allocation queues of the threads are not empty, as well as #
-	# the execution queues of the threads include any parts in the execution status #
-	while comp_parts_cnt < parts_cnt:
+	# Perform one step of the mapping process for tied tasks on a thread #
+	def step_tied(self, thr_num, num_tasks, num_threads, part_list, desc_rel, schedule_alg, alloc_alg):
 		# Check the execution queue of each thread separately #
-		if bool(execution_queue[thr_num]):
-			part = execution_queue[thr_num][len(execution_queue[thr_num]) - 1]
+		if bool(self.execution_queue[thr_num]):
+			part = self.execution_queue[thr_num][len(self.execution_queue[thr_num]) - 1]
+			detail = self.details[part]
 			# The part is in the execution status and its process has been already finished #
-			if part.status == 's' and part.f_time <= t:
-				part.status = 'f'
+			if detail.status == 's' and detail.f_time <= self.t:
+				detail.status = 'f'
+				self.release_dep(part)
 
-				last_idle[thr_num] = t
-				curr_thr = thr_num
-				comp_parts_cnt += 1
+				self.last_idle[thr_num] = self.t
+				self.curr_thr = thr_num
+				self.comp_parts_cnt += 1
 
 				# Remove the task from the list of suspended tasks #
 				if part.p_id == len(part_list[part.t_id]) - 1:
-					suspend_list[thr_num].remove(part.t_id)
+					self.suspend_list[thr_num].remove(part.t_id)
+					self.allowed[thr_num] = func.allowed_tasks(desc_rel, self.suspend_list[thr_num])
+					self.release_thr(thr_num)
 
 				# The part has a sibling part #
 				if part.sibling != None:
-					alloc_queue[thr_num].append(part.sibling)
+					self.push_alloc_queue(thr_num, part.sibling)
 
 				# The part has any child parts #
 				new_ready_parts = []
@@ -238,134 +387,69 @@ def mapping_tied(thr_num, num_tasks, num_threads, part_list, desc_rel, schedule_
 
 				# Check the new ready parts and allocate them to the allocation queues of the threads #
 				if bool(new_ready_parts):
-					thr_list = schedule_heuristic(num_threads, schedule_alg)
-
-					# Remove thr_num from the list of threads if the part has a sibling part #
+					# Leave thr_num out of the list of threads if the part has a sibling part #
+					thr_excl = None
+					num_queues = num_threads
 					if part.sibling != None:
-						thr_list.remove(thr_num)
+						thr_excl = thr_num
+						num_queues -= 1
 
-					# Assign the new ready parts to the allocation queues #
-					index = 0
+					thr_list = self.schedule_heuristic(num_threads, schedule_alg, len(new_ready_parts), thr_excl)
+
+					# Assign the new ready parts to the allocation queues in turn #
 					for i in range(len(new_ready_parts)):
 						# Select an allocation queue from the list #
-						thread_id = thr_list[index]
+						thread_id = thr_list[i % num_queues]
 
 						# Add the part to the selected allocation queue #
-						alloc_queue[thread_id].append(new_ready_parts[i])
-
-						# Increase the index #
-						if index < len(thr_list) - 1:
-							index += 1
-						else:
-							index = 0
+						self.push_alloc_queue(thread_id, new_ready_parts[i])
 
 		# Check whether the thread is idle #
-		if not bool(execution_queue[thr_num]) or execution_queue[thr_num][len(execution_queue[thr_num]) - 1].status == 'f':
+		if not bool(self.execution_queue[thr_num]) or self.details[self.execution_queue[thr_num][len(self.execution_queue[thr_num]) - 1]].status == 'f':
 			# Check the allocation queue of each thread separately and assign one of the parts to the thread, if any #
-			if bool(alloc_queue[thr_num]):
-				# Build the list of parts that do not have a data dependency or have a dependency but the related part is finished #
-				elg_parts = [] # Eligible parts
-
-				for i in range(len(alloc_queue[thr_num])):
-					if alloc_queue[thr_num][i].dep != None:
-						flag_finished = False
-						for j in range(num_threads):
-							for k in range(len(execution_queue[j])):
-								if alloc_queue[thr_num][i].dep == execution_queue[j][k] and execution_queue[j][k].status == 'f':
-									flag_finished = True
-
-					# Append the part to the selected parts #
-					if alloc_queue[thr_num][i].dep == None or (alloc_queue[thr_num][i].dep != None and flag_finished == True):
-						elg_parts.append(alloc_queue[thr_num][i])
-
-				# Check whether there are any non-dependent parts #
-				if bool(elg_parts):
-					# There are not any tasks currently suspended on the thread #
-					if not bool(suspend_list[thr_num]):
-						# Choose one of the parts using the heuristic algorithm #
-						sel_part = alloc_heuristic(elg_parts, alloc_alg)
-
-						# Assign the part to the thread #
-						execution_queue[thr_num].append(sel_part)
-						part = execution_queue[thr_num][len(execution_queue[thr_num]) - 1]
-
-						part.status = 's'
-						part.s_time = t
-						part.f_time = t + part.et
-
-						# Append the task to the list of suspended tasks #
-						if part.p_id == 0:
-							suspend_list[thr_num].append(part.t_id)
-
-						last_idle[thr_num] = -1
-
-						# Remove the part from the queue #
-						for i in range(len(alloc_queue[thr_num])):
-							if alloc_queue[thr_num][i] == sel_part:
-								alloc_queue[thr_num].remove(alloc_queue[thr_num][i])
-								break
-
-					# There are any tasks currently suspended on the thread #
-					else:
-						# Find the parts that belong to or are descendant of the tasks suspended to the thread #
-						sel_parts = []
-						for i in range(len(elg_parts)):
-							# The part is related to a currently suspended task #
-							if elg_parts[i].p_id > 0:
-								sel_parts.append(elg_parts[i])
-
-							# The part is related to a new task #
-							else:
-								flag = True
-								for j in range(len(suspend_list[thr_num])):
-									if desc_rel[suspend_list[thr_num][j]][elg_parts[i].t_id] == 0:
-										flag = False
-
-								if flag == True:
-									sel_parts.append(elg_parts[i])
-
-						# Check whether there are any selected parts #
-						if bool(sel_parts):
-							# Choose one of the parts using the heuristic algorithm #
-							sel_part = alloc_heuristic(sel_parts, alloc_alg)
-
-							# Assign the part to the thread #
-							execution_queue[thr_num].append(sel_part)
-							part = execution_queue[thr_num][len(execution_queue[thr_num]) - 1]
-
-							part.status = 's'
-							part.s_time = t
-							part.f_time = t + part.et
-
-							# Append the task to the list of suspended tasks #
-							if part.p_id == 0:
-								suspend_list[thr_num].append(part.t_id)
-
-							last_idle[thr_num] = -1
-
-							# Remove the part from the queue #
-							for i in range(len(alloc_queue[thr_num])):
-								if alloc_queue[thr_num][i] == sel_part:
-									alloc_queue[thr_num].remove(alloc_queue[thr_num][i])
-									break
-
-# The mapping process for untied tasks #
-def mapping_untied(thr_num, num_tasks, num_threads, part_list, schedule_alg, alloc_alg):
-	global alloc_queue, last_idle, execution_queue, curr_thr, t, parts_cnt, comp_parts_cnt
-
-	# Continue the mapping process while the allocation queues of the threads are not empty, as well as #
-	# the execution queues of the threads include any parts in the execution status #
-	while comp_parts_cnt < parts_cnt:
+			if bool(self.alloc_queue[thr_num]):
+				# Choose one of the parts that do not have a data dependency or have a dependency but the related part is finished #
+				# (and, for tied tasks, that can be started on the thread) using the heuristic algorithm #
+				sel_part = self.choose_part(thr_num, alloc_alg, desc_rel)
+
+				# Check whether there are any eligible parts #
+				if sel_part != None:
+					# Assign the part to the thread #
+					self.details[sel_part] = func.detail('s', None, None, self.t, self.t + sel_part.et)
+					self.execution_queue[thr_num].append(sel_part)
+					part = self.execution_queue[thr_num][len(self.execution_queue[thr_num]) - 1]
+
+					# Append the task to the list of suspended tasks #
+					if part.p_id == 0:
+						self.suspend_list[thr_num].append(part.t_id)
+						self.allowed[thr_num] &= desc_rel[part.t_id]
+
+					self.last_idle[thr_num] = -1
+
+					# Remove the part from the queue #
+					self.pop_alloc_queue(thr_num, sel_part)
+
+	# The mapping process for untied tasks #
+	def mapping_untied(self, thr_num, num_tasks, num_threads, part_list, schedule_alg, alloc_alg):
+		# Continue the mapping process while the allocation queues of the threads are not empty, as well as #
+		# the execution queues of the threads include any parts in the execution status #
+		while self.comp_parts_cnt < self.parts_cnt:
+			self.step_untied(thr_num, num_tasks, num_threads, part_list, schedule_alg, alloc_alg)
+
+	# Perform one step of the mapping process for untied tasks on a thread #
+	def step_untied(self, thr_num, num_tasks, num_threads, part_list, schedule_alg, alloc_alg):
 		# Check the execution queue of each thread separately #
-		if bool(execution_queue[thr_num]):
-			part = execution_queue[thr_num][len(execution_queue[thr_num]) - 1]
+		if bool(self.execution_queue[thr_num]):
+			part = self.execution_queue[thr_num][len(self.execution_queue[thr_num]) - 1]
+			detail = self.details[part]
 			# The part is in the execution status and its process has been already finished #
-			if part.status == 's' and part.f_time <= t:
-				part.status = 'f'
+			if detail.status == 's' and detail.f_time <= self.t:
+				detail.status = 'f'
+				self.release_dep(part)
 
-				last_idle[thr_num] = t
-				curr_thr = thr_num
-				comp_parts_cnt += 1
+				self.last_idle[thr_num] = self.t
+				self.curr_thr = thr_num
+				self.comp_parts_cnt += 1
 
 				new_ready_parts = []
 				# The part has a sibling part #
@@ -378,148 +462,163 @@ def mapping_untied(thr_num, num_tasks, num_threads, part_list, schedule_alg, all
 
 				# Check the new ready parts and allocate them to the allocation queues of the threads #
 				if bool(new_ready_parts):
-					thr_list = schedule_heuristic(num_threads, schedule_alg)
+					thr_list = self.schedule_heuristic(num_threads, schedule_alg, len(new_ready_parts), None)
 
-					index = 0
-					# Assign the new ready parts to the allocation queues #
+					# Assign the new ready parts to the allocation queues in turn #
 					for i in range(len(new_ready_parts)):
 						# Select an allocation queue from the list #
-						thread_id = thr_list[index]
+						thread_id = thr_list[i % num_threads]
 
 						# Add the part to the selected allocation queue #
-						alloc_queue[thread_id].append(new_ready_parts[i])
-
-						# Increase the index #
-						if index < num_threads - 1:
-							index += 1
-						else:
-							index = 0
+						self.push_alloc_queue(thread_id, new_ready_parts[i])
 
 		# Check whether the thread is idle #
-		if not bool(execution_queue[thr_num]) or execution_queue[thr_num][len(execution_queue[thr_num]) - 1].status == 'f':
+		if not bool(self.execution_queue[thr_num]) or self.details[self.execution_queue[thr_num][len(self.execution_queue[thr_num]) - 1]].status == 'f':
 			# Check the allocation queue of each thread separately and assign one of the parts to the thread, if any #
-			if bool(alloc_queue[thr_num]):
-				# Build the list of parts that do not have a data dependency or have a dependency but the related part is finished #
-				elg_parts = [] # Eligible parts
-
-				for i in range(len(alloc_queue[thr_num])):
-					if alloc_queue[thr_num][i].dep != None:
-						flag_finished = False
-						for j in range(num_threads):
-							for k in range(len(execution_queue[j])):
-								if alloc_queue[thr_num][i].dep == execution_queue[j][k] and execution_queue[j][k].status == 'f':
-									flag_finished = True
-
-					# Append the part to the selected parts #
-					if alloc_queue[thr_num][i].dep == None or (alloc_queue[thr_num][i].dep != None and flag_finished == True):
-						elg_parts.append(alloc_queue[thr_num][i])
-
-				# Check whether there are any non-dependent parts #
-				if bool(elg_parts):
-					# Choose one of the parts using the heuristic algorithm #
-					sel_part = alloc_heuristic(elg_parts, alloc_alg)
+			if bool(self.alloc_queue[thr_num]):
+				# Choose one of the parts that do not have a data dependency or have a dependency but the related part is finished #
+				sel_part = self.choose_part(thr_num, alloc_alg, None)
 
+				# Check whether there are any eligible parts #
+				if sel_part != None:
 					# Assign the part to the thread #
-					execution_queue[thr_num].append(sel_part)
-					part = execution_queue[thr_num][len(execution_queue[thr_num]) - 1]
+					self.details[sel_part] = func.detail('s', None, None, self.t, self.t + sel_part.et)
+					self.execution_queue[thr_num].append(sel_part)
+					part = self.execution_queue[thr_num][len(self.execution_queue[thr_num]) - 1]
 
-					part.status = 's'
-					part.s_time = t
-					part.f_time = t + part.et
-
-					last_idle[thr_num] = -1
+					self.last_idle[thr_num] = -1
 
 					# Remove the part from the queue #
-					for i in range(len(alloc_queue[thr_num])):
-						if alloc_queue[thr_num][i] == sel_part:
-							alloc_queue[thr_num].remove(alloc_queue[thr_num][i])
-							break
-
-# The main mapping process #
-def execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, schedule_alg, alloc_alg, graphic_result):
-	global alloc_queue, suspend_list, last_idle, execution_queue, t, parts_cnt
-
-	# Determine the number of all the parts
-	for i in range(num_tasks):
-		parts_cnt += len(part_list[i])
-
-	# Initialize the response time #
-	t = 0
-
-	# Create an allocation queue for each thread #
-	alloc_queue = []
-	for i in range(num_threads):
-		alloc_queue.append([])
-
-	# Create the initial list of suspended tasks #
-	suspend_list = []
-	for i in range(num_threads):
-		suspend_list.append([])
-
-	# Create a list for the last idle time of the threads #
-	last_idle = []
-	for i in range(num_threads):
-		last_idle.append(0)
-
-	# Create an execution queue for each thread #
-	execution_queue = []
-	for i in range(num_threads):
-		execution_queue.append([])
-
-	# Put the first part of the system in the execution queue of the first thread #
-	execution_queue[0].append(first_task_part)
-	execution_queue[0][0].status = 's'
-	execution_queue[0][0].s_time = 1
-	execution_queue[0][0].f_time = 1 + execution_queue[0][0].et
-
-	suspend_list[0].append(0) # Append Task 0 to the list of suspended tasks of Thread 0
-
-	# Show the mapping algorithm and the task type #
-	if task_type == 'tied':
-		print('\nNEW for tied tasks (' + schedule_alg + ', ' + alloc_alg + ')' + '\n***********************************')
-	else:
-		print('\nNEW for untied tasks (' + schedule_alg + ', ' + alloc_alg + ')' + '\n***********************************')
-
-	# Create and start the threads #
-	thr_clock = threading.Thread(target = clock, args = (num_threads, ))
-	thr_clock.start()
-
-	threads = []
-	for i in range(num_threads):
+					self.pop_alloc_queue(thr_num, sel_part)
+
+	# The main mapping process #
+	def execute(self, task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, schedule_alg, alloc_alg, graphic_result, sim_engine):
+		# Determine the number of all the parts, so the scheduler can be reused for another mapping process #
+		self.parts_cnt = 0
+		self.comp_parts_cnt = 0
+		for i in range(num_tasks):
+			self.parts_cnt += len(part_list[i])
+
+		# Initialize the response time #
+		self.t = 0
+
+		# Create an allocation queue for each thread #
+		self.alloc_queue = []
+		self.alloc_heap = []
+		self.alloc_seq = 0
+		self.alloc_alg = alloc_alg
+		self.blocked_dep = {}
+		self.blocked_thr = []
+		self.queue_et = []
+		self.queue_rt = []
+		self.rt_changed = []
+		for i in range(num_threads):
+			self.alloc_queue.append({})
+			self.alloc_heap.append([])
+			self.blocked_thr.append([])
+			self.queue_et.append(0)
+			self.queue_rt.append(0)
+			self.rt_changed.append(False)
+		self.total_num_parts = 0
+		self.total_et = 0
+
+		# Sort the allocation queues by the key of the scheduling heuristic, if the heuristic uses a fixed order of the queues #
+		self.schedule_alg = schedule_alg
+		self.queue_order = None
+		self.queue_ver = []
+		if schedule_alg == 'MNTP' or schedule_alg == 'MTET' or schedule_alg == 'MTRT':
+			for i in range(num_threads):
+				self.queue_ver.append(0)
+			self.sort_queues()
+
+		# Create the initial list of suspended tasks #
+		self.suspend_list = []
+		self.allowed = []
+		for i in range(num_threads):
+			self.suspend_list.append([])
+			self.allowed.append(-1)
+
+		# Create a list for the last idle time of the threads #
+		self.last_idle = []
+		for i in range(num_threads):
+			self.last_idle.append(0)
+
+		# Create an execution queue for each thread #
+		self.execution_queue = []
+		for i in range(num_threads):
+			self.execution_queue.append([])
+
+		# Create the details of the mapping process of the parts #
+		self.details = {}
+
+		# Put the first part of the system in the execution queue of the first thread #
+		self.details[first_task_part] = func.detail('s', None, None, 1, 1 + first_task_part.et)
+		self.execution_queue[0].append(first_task_part)
+
+		self.suspend_list[0].append(0) # Append Task 0 to the list of suspended tasks of Thread 0
+		self.allowed[0] = desc_rel[0]
+
+		# Show the mapping algorithm and the task type #
+		if task_type == 'tied':
+			print('\nNEW for tied tasks (' + schedule_alg + ', ' + alloc_alg + ')' + '\n***********************************')
+		else:
+			print('\nNEW for untied tasks (' + schedule_alg + ', ' + alloc_alg + ')' + '\n***********************************')
+
+		# The arguments of the steps of the mapping process (desc_rel is used only for tied tasks) #
 		if task_type == 'tied':
-			thr = threading.Thread(target = mapping_tied, args = (i, num_tasks, num_threads, part_list, desc_rel, schedule_alg, alloc_alg, ))
+			args = (num_tasks, num_threads, part_list, desc_rel, schedule_alg, alloc_alg, )
 		else:
-			thr = threading.Thread(target = mapping_untied, args = (i, num_tasks, num_threads, part_list, schedule_alg, alloc_alg, ))
-		threads.append(thr)
-		thr.start()
-
-	# Wait until the threads are executed completely #
-	thr_clock.join()
-	for thr in threads:
-		thr.join()
-	threads = []
-
-	# Calculate the results #
-	response_time = t # The response time
-	idle_time = sum(func.idle_time(num_threads, execution_queue, t)) # The idle time of the system
-	waiting_time = func.wait_time(num_threads, execution_queue) # The waiting time of the threads
-	miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, execution_queue, deadline, t) # The missed deadline status of the system
-
-	# Show the results #
-	print('Response time: ' + str(response_time))
-	print('Idle time: ' + str(idle_time))
-	print('Waiting time: ' + str(waiting_time))
-	print('Missed deadline: ' + str(miss_deadline))
-	'''
-	print("\nThe execution queues of the threads:") # The contents of the execution queues of the threads
-	for i in range(num_threads):
-		print('Thr ' + str(i) + ':')
-		for j in range(len(execution_queue[i])):
-			print('p' + str(execution_queue[i][j].t_id) + str(execution_queue[i][j].p_id) + ' --> status = ' + execution_queue[i][j].status + ', start waiting time = ' + str(execution_queue[i][j].s_w_time) +\
-			 ', finish waiting time = ' + str(execution_queue[i][j].f_w_time) + ', start time = ' + str(execution_queue[i][j].s_time) + ', finish time = ' + str(execution_queue[i][j].f_time))
-	'''
-	if graphic_result == 1:
-		func.graphic_result(num_threads, execution_queue, 'new', task_type, schedule_alg, alloc_alg) # The graphical output
-
-	# Return the results to the main program #
-	return response_time, idle_time, waiting_time, miss_deadline
+			args = (num_tasks, num_threads, part_list, schedule_alg, alloc_alg, )
+
+		# Simulate the threads using the discrete-event engine #
+		if sim_engine == 1:
+			self.t = engine.simulate(self, task_type, num_threads, self.execution_queue, args)
+		# Use the clock thread of the system #
+		else:
+			# Create and start the threads #
+			thr_clock = threading.Thread(target = self.clock, args = (num_threads, ))
+			thr_clock.start()
+
+			threads = []
+			for i in range(num_threads):
+				if task_type == 'tied':
+					thr = threading.Thread(target = self.mapping_tied, args = (i, ) + args)
+				else:
+					thr = threading.Thread(target = self.mapping_untied, args = (i, ) + args)
+				threads.append(thr)
+				thr.start()
+
+			# Wait until the threads are executed completely #
+			thr_clock.join()
+			for thr in threads:
+				thr.join()
+			threads = []
+
+		# Calculate the results #
+		response_time = self.t # The response time
+		idle_time = sum(func.idle_time(num_threads, self.execution_queue, self.details, self.t)) # The idle time of the system
+		waiting_time = func.wait_time(num_threads, self.execution_queue, self.details) # The waiting time of the threads
+		miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, self.execution_queue, self.details, deadline, self.t) # The missed deadline status of the system
+
+		# Show the results #
+		print('Response time: ' + str(response_time))
+		print('Idle time: ' + str(idle_time))
+		print('Waiting time: ' + str(waiting_time))
+		print('Missed deadline: ' + str(miss_deadline))
+		'''
+		print("\nThe execution queues of the threads:") # The contents of the execution queues of the threads
+		for i in range(num_threads):
+			print('Thr ' + str(i) + ':')
+			for j in range(len(self.execution_queue[i])):
+				print('p' + str(self.execution_queue[i][j].t_id) + str(self.execution_queue[i][j].p_id) + ' --> status = ' + self.details[self.execution_queue[i][j]].status + ', start waiting time = ' + str(self.details[self.execution_queue[i][j]].s_w_time) +\
+				 ', finish waiting time = ' + str(self.details[self.execution_queue[i][j]].f_w_time) + ', start time = ' + str(self.details[self.execution_queue[i][j]].s_time) + ', finish time = ' + str(self.details[self.execution_queue[i][j]].f_time))
+		'''
+		if graphic_result == 1:
+			func.graphic_result(num_threads, self.execution_queue, self.details, 'new', task_type, schedule_alg, alloc_alg) # The graphical output
+
+		# Return the results to the main program #
+		return response_time, idle_time, waiting_time, miss_deadline
+
+# The main mapping process using a new scheduler #
+def execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, schedule_alg, alloc_alg, graphic_result, sim_engine):
+	return scheduler().execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, schedule_alg, alloc_alg, graphic_result, sim_engine)
\ No newline at end of file
@@ -0,0 +1,208 @@
+ #**************************************************************************
+ # store.py
+ #
+ # This file includes a compact storage of the task parts, in which the
+ # details of the parts are kept in typed arrays instead of one object
+ # with its own attributes for each part.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+from array import array
+
+# Global variables #
+none = -1 # The value stored in the arrays instead of None
+
+# Define the class of the compact storage of the parts of a graph #
+# An instance is used instead of the class of the task part (main.part) to create the parts of the graph, and it returns #
+# a view of each part, so the graph generator and the mapping algorithms work without any changes #
+class graph:
+	def __init__(self):
+		self.t_id = array('q') # Task ID
+		self.p_id = array('q') # Part ID
+		self.et = array('q') # Execution time
+		self.rt = array('d') # Response time
+		self.dep = array('q') # The index of the part related to input data dependency
+		self.parent = array('q') # The index of the parent part
+		self.sibling = array('q') # The index of the next part in the same task
+		self.num_succ = array('q') # The number of immediate successors
+		self.views = [] # The view of each part
+
+	# Create a part (with the same parameters as main.part) and return its view #
+	def __call__(self, t_id, p_id, et, dep, parent, sibling, rt):
+		view = part(self, len(self.views))
+		self.views.append(view)
+
+		self.t_id.append(t_id)
+		self.p_id.append(p_id)
+		self.et.append(none)
+		self.rt.append(float('nan'))
+		self.dep.append(none)
+		self.parent.append(none)
+		self.sibling.append(none)
+		self.num_succ.append(0)
+
+		view.et = et
+		view.rt = rt
+		view.dep = dep
+		view.parent = parent
+		view.sibling = sibling
+
+		return view
+
+	# Add the parts of a graph at once from the lists of their details, and return their views #
+	# dep, parent and sibling are the indices of the parts among the added parts (none for no part), and et and rt are not specified #
+	def extend(self, t_id, p_id, dep, parent, sibling, num_succ):
+		base = len(self.views)
+		count = len(t_id)
+
+		# Shift the indices of the parts after the existing parts #
+		if base > 0:
+			dep = shift(dep, base)
+			parent = shift(parent, base)
+			sibling = shift(sibling, base)
+
+		self.t_id.extend(t_id)
+		self.p_id.extend(p_id)
+		self.et.extend(array('q', [none]) * count)
+		self.rt.extend(array('d', [float('nan')]) * count)
+		self.dep.extend(dep)
+		self.parent.extend(parent)
+		self.sibling.extend(sibling)
+		self.num_succ.extend(num_succ)
+
+		views = []
+		for i in range(base, base + count):
+			views.append(part(self, i))
+		self.views.extend(views)
+
+		return views
+
+	# Set the execution times and the response times of the parts stored one after another from the index first #
+	def set_et(self, first, et, rt):
+		self.et[first:first + len(et)] = array('q', et)
+		self.rt[first:first + len(rt)] = array('d', rt)
+
+# Shift the indices of parts (except none) #
+def shift(index, base):
+	shifted = array('q')
+	for i in range(len(index)):
+		if index[i] == none:
+			shifted.append(none)
+		else:
+			shifted.append(index[i] + base)
+
+	return shifted
+
+# Convert an index stored in the arrays to a view #
+def to_view(graph, index):
+	if index == none:
+		return None
+	else:
+		return graph.views[index]
+
+# Convert a view to an index stored in the arrays #
+def to_index(view):
+	if view == None:
+		return none
+	else:
+		return view.index
+
+# Convert a time stored in the arrays to a time #
+def to_time(value):
+	if value == none:
+		return None
+	else:
+		return value
+
+# Convert a time to a value stored in the arrays #
+def to_value(time):
+	if time == None:
+		return none
+	else:
+		return time
+
+# Define the class of the view of a part in the compact storage #
+# It has the same attributes as main.part, and there is exactly one view for each part, so the parts can be compared #
+class part:
+	__slots__ = ('graph', 'index', 'child')
+
+	def __init__(self, graph, index):
+		self.graph = graph # The compact storage
+		self.index = index # The index of the part in the arrays
+		self.child = [] # The child tasks (their first parts) created by the part (filled by the graph generator)
+
+	@property
+	def t_id(self):
+		return self.graph.t_id[self.index]
+
+	@property
+	def p_id(self):
+		return self.graph.p_id[self.index]
+
+	@property
+	def et(self):
+		return to_time(self.graph.et[self.index])
+
+	@et.setter
+	def et(self, et):
+		self.graph.et[self.index] = to_value(et)
+
+	@property
+	def rt(self):
+		rt = self.graph.rt[self.index]
+		# NaN stands for None #
+		if rt != rt:
+			return None
+		else:
+			return rt
+
+	@rt.setter
+	def rt(self, rt):
+		if rt == None:
+			self.graph.rt[self.index] = float('nan')
+		else:
+			self.graph.rt[self.index] = rt
+
+	@property
+	def dep(self):
+		return to_view(self.graph, self.graph.dep[self.index])
+
+	@dep.setter
+	def dep(self, dep):
+		self.graph.dep[self.index] = to_index(dep)
+
+	@property
+	def parent(self):
+		return to_view(self.graph, self.graph.parent[self.index])
+
+	@parent.setter
+	def parent(self, parent):
+		self.graph.parent[self.index] = to_index(parent)
+
+	@property
+	def sibling(self):
+		return to_view(self.graph, self.graph.sibling[self.index])
+
+	@sibling.setter
+	def sibling(self, sibling):
+		self.graph.sibling[self.index] = to_index(sibling)
+
+	@property
+	def num_succ(self):
+		return self.graph.num_succ[self.index]
+
+	@num_succ.setter
+	def num_succ(self, num_succ):
+		self.graph.num_succ[self.index] = num_succ
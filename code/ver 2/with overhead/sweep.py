@@ -0,0 +1,291 @@
+ #**************************************************************************
+ # sweep.py
+ #
+ # This tool evaluates a grid of the weights of the TMCD (alpha, beta and
+ # gamma) and MCD (theta and psi) heuristics on a shared set of random
+ # graphs, and reports the best weights by the response time and the
+ # missed deadline rate.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import contextlib
+import io
+import itertools
+import multiprocessing
+import random
+import cache
+import gen
+import runner
+import store
+import new
+
+# Global variables #
+num_tasks = 7 # The number of tasks
+num_parts = 5 # The maximum number of parts for each task
+et_min = 3 # Minimum execution time for each task part
+et_max = 10 # Maximum execution time for each task part
+deadline_min = 0.5 # The minimum probability for determining the deadline of the whole system
+deadline_max = 1 # The maximum probability for determining the deadline of the whole system
+system_model = 1 # 1: The first task is the parent of the other tasks,
+				 # 2: Each task (all parts) can have a random number of child tasks,
+				 # 3: Each task (only the first part) can have m:n child tasks
+min_num_child = 2 # The minimum number of child tasks (in the system model 3)
+max_num_child = 3 # The maximum number of child tasks (in the system model 3)
+dep_pro = 0.6 # The probability of selecting the sibling tasks in the dependency graph
+num_dep_level = 2 # The maximum number of dependencies (at each level) in the dependency graph between sibling tasks
+num_threads = 4 # The number of threads
+sim_engine = 1 # 0: Clock thread (sleeping on each tick), 1: Discrete-event engine (jumping to the next event)
+num_workers = 4 # The number of worker processes evaluating the grid in parallel (1: Evaluate it in one process)
+num_graphs = 10 # The number of random graphs shared by all the points of the grid
+numpy_gen = 0 # 0: Generate the random graphs and the execution times using the random module, 1: Using a NumPy random generator (for large graphs)
+graph_cache = 0 # 0: Generate the random graphs, 1: Load them from the cache of the graphs (graph_cache) if they have been generated with the same parameters and seeds
+seed = None # The master seed of the random number generator (None: Choose it randomly)
+
+task_types = ['tied', 'untied'] # The task types
+schedule_alg = 'TMCD' # The scheduling heuristic (the weights of TMCD are swept only if it is TMCD)
+alloc_alg = 'MCD' # The allocation heuristic (the weights of MCD are swept only if it is MCD)
+
+# The ranges of the weights (start, stop, step), including the stop value #
+# The ranges, weight_sum, num_graphs and num_workers can also be given on the command line (see parse_args) #
+alpha_range = (0, 1, 0.25)
+beta_range = (0, 1, 0.25)
+gamma_range = (0, 1, 0.25)
+theta_range = (0, 1, 0.25)
+psi_range = (0, 1, 0.25)
+weight_sum = 1 # 0: Evaluate all the combinations, 1: Evaluate only the combinations whose weights of each heuristic add up to 1
+
+# Global variables of the worker processes #
+graphs = None # The shared graphs (part_list, deadline, desc_rel)
+
+# Specify the values of a range of a weight #
+def weight_values(weight_range):
+	start, stop, step = weight_range
+	if step <= 0:
+		raise ValueError('The step of a range of the weights must be positive: ' + str(weight_range))
+
+	values = []
+	k = 0
+	while start + k * step <= stop + step / 2:
+		values.append(round(start + k * step, 10))
+		k += 1
+
+	return values
+
+# Keep the weights of a heuristic that add up to 1 #
+def unit_sum(weights):
+	sel_weights = []
+	for i in range(len(weights)):
+		if round(sum(weights[i]), 10) == 1:
+			sel_weights.append(weights[i])
+
+	return sel_weights
+
+# Specify the points of the grid (alpha, beta, gamma, theta, psi) #
+# The weights of a heuristic that is not used keep their default values, so the grid does not repeat the same runs #
+def weight_grid():
+	if schedule_alg == 'TMCD':
+		tmcd_weights = list(itertools.product(weight_values(alpha_range), weight_values(beta_range), weight_values(gamma_range)))
+	else:
+		tmcd_weights = [(new.alpha, new.beta, new.gamma)]
+
+	if alloc_alg == 'MCD':
+		mcd_weights = list(itertools.product(weight_values(theta_range), weight_values(psi_range)))
+	else:
+		mcd_weights = [(new.theta, new.psi)]
+
+	if weight_sum == 1:
+		if schedule_alg == 'TMCD':
+			tmcd_weights = unit_sum(tmcd_weights)
+		if alloc_alg == 'MCD':
+			mcd_weights = unit_sum(mcd_weights)
+
+	grid = []
+	for tmcd_weight, mcd_weight in itertools.product(tmcd_weights, mcd_weights):
+		grid.append(tmcd_weight + mcd_weight)
+
+	return grid
+
+# Generate the shared graphs, each of them from a seed derived from the master seed #
+# The child index and the descendant relation of each graph are built once and reused by all the points of the grid #
+def generate_graphs():
+	graph_list = []
+	for i in range(num_graphs):
+		graph_seed = runner.derive_seed(seed, i)
+		random.seed(graph_seed)
+
+		rng = None
+		if numpy_gen == 1:
+			rng = gen.random_generator(graph_seed)
+
+		desc_rel = None
+		if graph_cache == 1:
+			part_list, desc_rel = cache.graph_rand(num_tasks, num_parts, system_model, store.graph(), dep_pro, num_dep_level, min_num_child, max_num_child, graph_seed, rng)
+		elif numpy_gen == 1:
+			part_list = gen.graph_rand_np(num_tasks, num_parts, system_model, store.graph(), dep_pro, num_dep_level, min_num_child, max_num_child, rng)
+		else:
+			part_list = gen.graph_rand(num_tasks, num_parts, system_model, store.graph(), dep_pro, num_dep_level, min_num_child, max_num_child)
+
+		if numpy_gen == 1:
+			num_all_parts = 0
+			for j in range(num_tasks):
+				num_all_parts += len(part_list[j])
+
+			et, deadline_factor = gen.draw_et(1, num_all_parts, et_min, et_max, deadline_min, deadline_max, rng)
+			part_list, deadline, desc_rel = gen.specify_et_np(num_tasks, part_list, et[0], deadline_factor[0], desc_rel)
+		else:
+			part_list, deadline, desc_rel = gen.specify_et(num_tasks, part_list, et_min, et_max, deadline_min, deadline_max, desc_rel)
+		graph_list.append((part_list, deadline, desc_rel))
+
+	return graph_list
+
+# Evaluate one point of the grid on all the shared graphs #
+# The result of each task type is the mean response time and the missed deadline rate over the graphs #
+def evaluate(weight):
+	policy = new.scheduler()
+	policy.alpha, policy.beta, policy.gamma, policy.theta, policy.psi = weight
+
+	result = []
+	for task_type in task_types:
+		sum_response_time = 0
+		num_miss_deadline = 0
+		for part_list, deadline, desc_rel in graphs:
+			# The mapping algorithm shows its results, which are not needed for each point #
+			with contextlib.redirect_stdout(io.StringIO()):
+				response_time, idle_time, waiting_time, miss_deadline = policy.execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, \
+					part_list[0][0], schedule_alg, alloc_alg, 0, sim_engine)
+
+			sum_response_time += response_time
+			num_miss_deadline += miss_deadline
+
+		result.append((sum_response_time / len(graphs), num_miss_deadline / len(graphs)))
+
+	return result
+
+# Evaluate all the points of the grid and return their results in the order of the grid #
+def evaluate_grid(grid, graph_list):
+	global graphs
+
+	graphs = graph_list
+
+	results = []
+	# The worker processes are forked, so they share the graphs with the main process without copying them #
+	# (they are not used on systems without the fork start method, e.g., Windows) #
+	if num_workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+		print('The fork start method is not available on this system, so num_workers = ' + str(num_workers) + ' is ignored and the points are evaluated one after another')
+
+	if num_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+		with ProcessPoolExecutor(max_workers = num_workers, mp_context = multiprocessing.get_context('fork')) as executor:
+			for result in executor.map(evaluate, grid, chunksize = max(1, len(grid) // (num_workers * 4))):
+				results.append(result)
+	# Evaluate the points one after another #
+	else:
+		for i in range(len(grid)):
+			results.append(evaluate(grid[i]))
+
+	graphs = None
+
+	return results
+
+# Find the best point of the grid for a task type by one of the results (0: response time, 1: missed deadline rate) #
+# The other result breaks the ties, and then the first point is taken #
+def best_point(results, type_num, key):
+	best = 0
+	for i in range(len(results)):
+		if (results[i][type_num][key], results[i][type_num][1 - key]) < (results[best][type_num][key], results[best][type_num][1 - key]):
+			best = i
+
+	return best
+
+# Show a point of the grid with its results #
+def show(weight, result):
+	print('alpha = ' + str(weight[0]) + ', beta = ' + str(weight[1]) + ', gamma = ' + str(weight[2]) + ', theta = ' + str(weight[3]) + ', psi = ' + str(weight[4]) + \
+		' --> response time = ' + str(result[0]) + ', missed deadline rate = ' + str(result[1]))
+
+# Take the ranges of the weights and the size of the sweep from the command line (the global variables are the defaults) #
+# The arguments are checked here, so the errors are reported as the usage of the command instead of a traceback #
+def parse_args():
+	global alpha_range, beta_range, gamma_range, theta_range, psi_range, weight_sum, num_graphs, num_workers
+
+	parser = argparse.ArgumentParser(description = 'Evaluate a grid of the weights of the TMCD and MCD heuristics.')
+	weight_ranges = (('alpha', alpha_range), ('beta', beta_range), ('gamma', gamma_range), ('theta', theta_range), ('psi', psi_range))
+	for name, weight_range in weight_ranges:
+		parser.add_argument('--' + name, type = float, nargs = 3, default = weight_range, metavar = ('START', 'STOP', 'STEP'), \
+			help = 'the range of ' + name + ', including the stop value (default: ' + ' '.join(map(str, weight_range)) + ')')
+	parser.add_argument('--weight-sum', type = int, choices = [0, 1], default = weight_sum, \
+		help = '1: evaluate only the combinations whose weights of each heuristic add up to 1 (default: ' + str(weight_sum) + ')')
+	parser.add_argument('--graphs', type = int, default = num_graphs, help = 'the number of random graphs (default: ' + str(num_graphs) + ')')
+	parser.add_argument('--workers', type = int, default = num_workers, help = 'the number of worker processes (default: ' + str(num_workers) + ')')
+	args = parser.parse_args()
+
+	for name, weight_range in weight_ranges:
+		start, stop, step = getattr(args, name)
+		if step <= 0:
+			parser.error('argument --' + name + ': STEP must be positive')
+		if start > stop:
+			parser.error('argument --' + name + ': START must not be greater than STOP')
+	if args.graphs < 1:
+		parser.error('the number of graphs must be at least 1')
+	if args.workers < 1:
+		parser.error('the number of worker processes must be at least 1')
+
+	alpha_range = tuple(args.alpha)
+	beta_range = tuple(args.beta)
+	gamma_range = tuple(args.gamma)
+	theta_range = tuple(args.theta)
+	psi_range = tuple(args.psi)
+	weight_sum = args.weight_sum
+	num_graphs = args.graphs
+	num_workers = args.workers
+
+	if not bool(weight_grid()):
+		parser.error('the ranges do not include any combination of the weights of each heuristic that adds up to 1 (see --weight-sum)')
+
+parse_args()
+
+# Specify the master seed, so the graphs can be reproduced #
+if seed == None:
+	seed = random.SystemRandom().randrange(2 ** 32)
+print('Master seed = ' + str(seed))
+
+grid = weight_grid()
+print('The number of points of the grid: ' + str(len(grid)) + ', the number of graphs: ' + str(num_graphs))
+print('The sweep is in progress. Please wait ...')
+
+results = evaluate_grid(grid, generate_graphs())
+
+# Write the results of all the points (alpha, beta, gamma, theta, psi, and the response time and the missed deadline rate of each task type) #
+file = open("sweep.dat", "w")
+for i in range(len(grid)):
+	row = list(grid[i])
+	for j in range(len(task_types)):
+		row += list(results[i][j])
+	for j in range(len(row)):
+		file.write(str(row[j]))
+		if j != len(row) - 1:
+			file.write("\t")
+	file.write("\n")
+file.close()
+
+# Show the best weights of each task type by the response time and by the missed deadline rate (the other one breaks the ties) #
+for j in range(len(task_types)):
+	print('\nThe best weights for ' + task_types[j] + ' tasks (' + schedule_alg + ', ' + alloc_alg + ')\n***********************************')
+	best = best_point(results, j, 0)
+	print('By the response time:')
+	show(grid[best], results[best][j])
+	best = best_point(results, j, 1)
+	print('By the missed deadline rate:')
+	show(grid[best], results[best][j])
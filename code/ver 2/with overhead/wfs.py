@@ -17,41 +17,65 @@
  # See the License for the specific language governing permissions and
  # limitations under the License.
  #**************************************************************************
+from collections import OrderedDict
+import engine
 import func
 import threading
 import time
 
-# Global variables #
-t = 0 # Response time
-part_queue = [] # The queue of ready parts
-thread_queue = [] # The queues of the threads
-curr_thread_num = None # The thread number of the last finished task part
-parts_cnt = 0 # The number of all the parts
-comp_parts_cnt = 0 # The number of completed parts
-
-# Specify the clock of the system #
-def clock(num_threads):
-	global t, parts_cnt, comp_parts_cnt
-
-	while comp_parts_cnt < parts_cnt:
-		t += 1
-		time.sleep(0.001)
-
-# The mapping process for tied tasks #
-def mapping_tied(thr_num, num_tasks, num_threads, part_list):
-	global thread_queue, part_queue, curr_thread_num, t, parts_cnt, comp_parts_cnt
-
-	# Continue the mapping process while the queue of ready parts is not empty and #
-	# the queues of the threads do not include any part in the execution status #
-	while comp_parts_cnt < parts_cnt:
+# Define the class of the WFS scheduler, which keeps the state of one mapping process #
+class scheduler:
+	def __init__(self):
+		self.t = 0 # Response time
+		self.part_queue = OrderedDict() # The queue of ready parts (in order, with O(1) insertion at both ends and O(1) removal)
+		self.thread_queue = [] # The queues of the threads
+		self.curr_thread_num = None # The thread number of the last finished task part
+		self.owner = {} # The thread of each task that has been started (the parts of a tied task are executed on the same thread)
+		self.idle_threads = 0 # The bitset of the idle threads (bit i is set if Thread i is idle)
+		self.idle_lock = threading.Lock() # The lock of the bitset of the idle threads (the threads of the clock-based simulation change it concurrently)
+		self.details = {} # The details of the mapping process of the parts (see func.detail), kept apart from the parts of the graph
+		self.parts_cnt = 0 # The number of all the parts
+		self.comp_parts_cnt = 0 # The number of completed parts
+
+	# Specify the clock of the system #
+	def clock(self, num_threads):
+		while self.comp_parts_cnt < self.parts_cnt:
+			self.t += 1
+			time.sleep(0.001)
+
+	# Mark a thread as idle in the bitset of the idle threads #
+	def set_idle(self, thr_num):
+		with self.idle_lock:
+			self.idle_threads |= 1 << thr_num
+
+	# Mark a thread as busy in the bitset of the idle threads #
+	def set_busy(self, thr_num):
+		with self.idle_lock:
+			self.idle_threads &= ~(1 << thr_num)
+
+	# The mapping process for tied tasks #
+	def mapping_tied(self, thr_num, num_tasks, num_threads, part_list):
+		# Continue the mapping process while the queue of ready parts is not empty and #
+		# the queues of the threads do not include any part in the execution status #
+		while self.comp_parts_cnt < self.parts_cnt:
+			# The notification is used to prevent the problem with the execution of the program #
+			if thr_num == 0:
+				print('Master Thread, t = ' + str(self.t))
+
+			self.step_tied(thr_num, num_tasks, num_threads, part_list)
+
+	# Perform one step of the mapping process for tied tasks on a thread #
+	def step_tied(self, thr_num, num_tasks, num_threads, part_list):
 		# Check the queue of each thread separately #
-		if bool(thread_queue[thr_num]):
-			part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
+		if bool(self.thread_queue[thr_num]):
+			part = self.thread_queue[thr_num][len(self.thread_queue[thr_num]) - 1]
+			detail = self.details[part]
 			# The task is in the execution status and its process has been finished #
-			if part.status == 's' and part.f_time <= t:
-				part.status = 'f'
-				curr_thread_num = thr_num
-				comp_parts_cnt += 1
+			if detail.status == 's' and detail.f_time <= self.t:
+				detail.status = 'f'
+				self.set_idle(thr_num)
+				self.curr_thread_num = thr_num
+				self.comp_parts_cnt += 1
 
 				child_sibling = []
 
@@ -66,87 +90,72 @@ def mapping_tied(thr_num, num_tasks, num_threads, part_list):
 
 				# Insert the child and sibling parts at the beginning of the queue of ready parts #
 				for i in range(len(child_sibling))[::-1]:
-					part_queue.insert(0, child_sibling[i])
+					self.part_queue[child_sibling[i]] = None
+					self.part_queue.move_to_end(child_sibling[i], last = False)
 
 		# Check the list of ready parts and assign them to the threads #
 		# This process is done just by the master thread #
 		if thr_num == 0:
-			print('Master Thread, t = ' + str(t)) # The notification is used to prevent the problem with the execution of the program
-			if bool(part_queue):				
+			if bool(self.part_queue):				
 				remove_list = []
 				# Look for any part in the queue of ready parts and find a suitable thread for each one #
-				for i in range(len(part_queue)):
-					# Check whether there is a data dependency, so the related part is finished #
-					flag_finished = False
-					if part_queue[i].dep != None:
-						for j in range(num_threads):
-							for k in range(len(thread_queue[j])):
-								if part_queue[i].dep == thread_queue[j][k] and thread_queue[j][k].status == 'f':
-									flag_finished = True
-
+				# (a copy of the queue is used, since the other threads of the clock-based simulation can add parts to it) #
+				for ready_part in list(self.part_queue):
 					# Map the part if there is not a data dependency, or #
 					# there is a data dependency but the related part is finished #
-					if part_queue[i].dep == None or (part_queue[i].dep != None and flag_finished == True):
+					if func.dep_satisfied(self.details, ready_part):
 						# Check whether the part is the first part of the related task #
-						if part_queue[i].p_id == 0:
+						if ready_part.p_id == 0:
 							# Find the thread number of the parent task #
-							thread_num = None
-							for j in range(num_threads):
-								for k in range(len(thread_queue[j])):
-									if part_queue[i].parent.t_id == thread_queue[j][k].t_id:
-										thread_num = j
-										break
+							thread_num = self.owner.get(ready_part.parent.t_id)
 
 							# If the thread number is found #
-							if thread_num != None and thread_queue[thread_num][len(thread_queue[thread_num]) - 1].status == 'f':
-								thread_queue[thread_num].append(part_queue[i])
-								new_part = thread_queue[thread_num][len(thread_queue[thread_num]) - 1]
-
-								new_part.status = 's'
-								new_part.s_time = t
-								new_part.f_time = t + part_queue[i].et
+							if thread_num != None and self.details[self.thread_queue[thread_num][len(self.thread_queue[thread_num]) - 1]].status == 'f':
+								self.details[ready_part] = func.detail('s', None, None, self.t, self.t + ready_part.et)
+								self.thread_queue[thread_num].append(ready_part)
+								self.set_busy(thread_num)
+								self.owner[ready_part.t_id] = thread_num
 
-								remove_list.append(part_queue[i])
+								remove_list.append(ready_part)
 						else:
 							# Find the thread number of the first part #
-							thread_num = None
-							for j in range(num_threads):
-								for k in range(len(thread_queue[j])):
-									if part_queue[i].t_id == thread_queue[j][k].t_id:
-										thread_num = j
-										break
+							thread_num = self.owner.get(ready_part.t_id)
 
 							# If the thread number is found #
-							if thread_num != None and thread_queue[thread_num][len(thread_queue[thread_num]) - 1].status == 'f':
-								thread_queue[thread_num].append(part_queue[i])
-								new_part = thread_queue[thread_num][len(thread_queue[thread_num]) - 1]
-
-								new_part.status = 's'
-								new_part.s_time = t
-								new_part.f_time = t + part_queue[i].et
+							if thread_num != None and self.details[self.thread_queue[thread_num][len(self.thread_queue[thread_num]) - 1]].status == 'f':
+								self.details[ready_part] = func.detail('s', None, None, self.t, self.t + ready_part.et)
+								self.thread_queue[thread_num].append(ready_part)
+								self.set_busy(thread_num)
 
-								remove_list.append(part_queue[i])
+								remove_list.append(ready_part)
 
 				# Remove the parts, which were processed, from the queue of ready parts #
 				for j in range(len(remove_list)):
-					list_index = part_queue.index(remove_list[j])
-					part_queue.remove(part_queue[list_index])
+					del self.part_queue[remove_list[j]]
 
-# The mapping process for untied tasks #
-def mapping_untied(thr_num, num_tasks, num_threads, part_list):
-	global thread_queue, part_queue, curr_thread_num, t, parts_cnt, comp_parts_cnt
+	# The mapping process for untied tasks #
+	def mapping_untied(self, thr_num, num_tasks, num_threads, part_list):
+		# Doing the mapping process while the queues of the threads and #
+		# the queue of ready parts are not empty #
+		while self.comp_parts_cnt < self.parts_cnt:
+			# The notification is used to prevent the problem with the execution of the program #
+			if thr_num == 0:
+				print('Master Thread, t = ' + str(self.t))
 
-	# Doing the mapping process while the queues of the threads and #
-	# the queue of ready parts are not empty #
-	while comp_parts_cnt < parts_cnt:
+			self.step_untied(thr_num, num_tasks, num_threads, part_list)
+
+	# Perform one step of the mapping process for untied tasks on a thread #
+	def step_untied(self, thr_num, num_tasks, num_threads, part_list):
 		# Check the queue of each thread separately #
-		if bool(thread_queue[thr_num]):
-			part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
+		if bool(self.thread_queue[thr_num]):
+			part = self.thread_queue[thr_num][len(self.thread_queue[thr_num]) - 1]
+			detail = self.details[part]
 			# The task is in the execution status and its process has been finished #
-			if part.status == 's' and part.f_time <= t:
-				part.status = 'f'
-				curr_thread_num = thr_num
-				comp_parts_cnt += 1
+			if detail.status == 's' and detail.f_time <= self.t:
+				detail.status = 'f'
+				self.set_idle(thr_num)
+				self.curr_thread_num = thr_num
+				self.comp_parts_cnt += 1
 
 				child_sibling = []
 
@@ -161,115 +170,130 @@ def mapping_untied(thr_num, num_tasks, num_threads, part_list):
 
 				# Insert the child and sibling parts at the beginning of the queue of ready parts #
 				for i in range(len(child_sibling))[::-1]:
-					part_queue.insert(0, child_sibling[i])
+					self.part_queue[child_sibling[i]] = None
+					self.part_queue.move_to_end(child_sibling[i], last = False)
 
 		# Check the list of ready parts and assign them to the threads #
 		# This process is done just by the master thread #
 		if thr_num == 0:
-			print('Master Thread, t = ' + str(t)) # The notification is used to prevent the problem with the execution of the program
-			if bool(part_queue):				
+			if bool(self.part_queue):				
 				remove_list = []
 				# Look for any part in the queue of ready parts and find an idle thread for each one #
-				for i in range(len(part_queue)):
-					# Check whether there is a data dependency, so the related part is finished #
-					flag_finished = False
-					if part_queue[i].dep != None:
-						for j in range(num_threads):
-							for k in range(len(thread_queue[j])):
-								if part_queue[i].dep == thread_queue[j][k] and thread_queue[j][k].status == 'f':
-									flag_finished = True
-
+				# (a copy of the queue is used, since the other threads of the clock-based simulation can add parts to it) #
+				for ready_part in list(self.part_queue):
 					# Map the part if there is not a data dependency, or #
 					# there is a data dependency but the related part is finished #
-					if part_queue[i].dep == None or (part_queue[i].dep != None and flag_finished == True):
+					if func.dep_satisfied(self.details, ready_part):
 						# Find an idle thread for the part #
-						thread_num = func.find_idle_thread(num_threads, thread_queue, curr_thread_num)
+						thread_num = func.find_idle_thread(num_threads, self.idle_threads, self.curr_thread_num)
 
 						# An idle thread is found #
 						if thread_num != None:
-							thread_queue[thread_num].append(part_queue[i])
-							new_part = thread_queue[thread_num][len(thread_queue[thread_num]) - 1]
+							self.details[ready_part] = func.detail('s', None, None, self.t, self.t + ready_part.et)
+							self.thread_queue[thread_num].append(ready_part)
+							self.set_busy(thread_num)
 
-							new_part.status = 's'
-							new_part.s_time = t
-							new_part.f_time = t + part_queue[i].et
+							remove_list.append(ready_part)
 
-							remove_list.append(part_queue[i])
+						# There is not any idle thread for the next parts either #
+						else:
+							break
 
 				# Remove the parts, which were processed, from the queue of ready parts #
 				for j in range(len(remove_list)):
-					list_index = part_queue.index(remove_list[j])
-					part_queue.remove(part_queue[list_index])
-
-# The main mapping process #
-def execute(task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result):
-	global thread_queue, part_queue, t, parts_cnt
-
-	# Determine the number of all the parts
-	for i in range(num_tasks):
-		parts_cnt += len(part_list[i])
-
-	# Initialize the response time and the queue of ready parts #
-	t = 0
-	part_queue = []
-
-	# Create a queue for each thread #
-	thread_queue = []
-	for i in range(num_threads):
-		thread_queue.append([])
-
-	# Put the first part of the system in the queue of the first thread #
-	thread_queue[0].append(first_task_part)
-	thread_queue[0][0].status = 's'
-	thread_queue[0][0].s_time = 1
-	thread_queue[0][0].f_time = 1 + thread_queue[0][0].et
-
-	# Show the mapping algorithm and the task type #
-	if task_type == 'tied':
-		print('\nWFS for tied tasks\n***********************************')
-	else:
-		print('\nWFS for untied tasks\n***********************************')
-
-	# Create and start the threads #
-	thr_clock = threading.Thread(target = clock, args = (num_threads, ))
-	thr_clock.start()
-
-	threads = []
-	for i in range(num_threads):
+					del self.part_queue[remove_list[j]]
+
+	# The main mapping process #
+	def execute(self, task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result, sim_engine):
+		# Determine the number of all the parts, so the scheduler can be reused for another mapping process #
+		self.parts_cnt = 0
+		self.comp_parts_cnt = 0
+		for i in range(num_tasks):
+			self.parts_cnt += len(part_list[i])
+
+		# Initialize the response time and the queue of ready parts #
+		self.t = 0
+		self.part_queue = OrderedDict()
+
+		# Create a queue for each thread #
+		self.thread_queue = []
+		for i in range(num_threads):
+			self.thread_queue.append([])
+
+		# Create the details of the mapping process of the parts #
+		self.details = {}
+
+		# Put the first part of the system in the queue of the first thread #
+		self.details[first_task_part] = func.detail('s', None, None, 1, 1 + first_task_part.et)
+		self.thread_queue[0].append(first_task_part)
+
+		# Task 0 is started on the first thread #
+		self.owner = {}
+		self.owner[first_task_part.t_id] = 0
+
+		# All the threads except the first thread are idle #
+		self.idle_threads = 0
+		for i in range(num_threads)[1::]:
+			self.idle_threads |= 1 << i
+
+		# Show the mapping algorithm and the task type #
 		if task_type == 'tied':
-			thr = threading.Thread(target = mapping_tied, args = (i, num_tasks, num_threads, part_list, ))
+			print('\nWFS for tied tasks\n***********************************')
+		else:
+			print('\nWFS for untied tasks\n***********************************')
+
+		# The arguments of the steps of the mapping process #
+		args = (num_tasks, num_threads, part_list, )
+
+		# Simulate the threads using the discrete-event engine #
+		if sim_engine == 1:
+			self.t = engine.simulate(self, task_type, num_threads, self.thread_queue, args)
+		# Use the clock thread of the system #
 		else:
-			thr = threading.Thread(target = mapping_untied, args = (i, num_tasks, num_threads, part_list, ))
-		threads.append(thr)
-		thr.start()
-
-	# Wait until the threads are executed completely #
-	thr_clock.join()
-	for thr in threads:
-		thr.join()
-	threads = []
-
-	# Calculate the results #
-	response_time = t # The response time
-	idle_time = sum(func.idle_time(num_threads, thread_queue, t)) # The idle time of the system
-	waiting_time = func.wait_time(num_threads, thread_queue) # The waiting time of the threads
-	miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, thread_queue, deadline, t) # The missed deadline status of the system
-
-	# Show the results #
-	print('Response time: ' + str(response_time))
-	print('Idle time: ' + str(idle_time))
-	print('Waiting time: ' + str(waiting_time))
-	print('Missed deadline: ' + str(miss_deadline))
-	'''
-	print("\nThe queues of the threads:") # The contents of the queues of the threads
-	for i in range(num_threads):
-		print('Thr ' + str(i) + ':')
-		for j in range(len(thread_queue[i])):
-			print('p' + str(thread_queue[i][j].t_id) + str(thread_queue[i][j].p_id) + ' --> status = ' + thread_queue[i][j].status + ', start waiting time = ' + str(thread_queue[i][j].s_w_time) +\
-			 ', finish waiting time = ' + str(thread_queue[i][j].f_w_time) + ', start time = ' + str(thread_queue[i][j].s_time) + ', finish time = ' + str(thread_queue[i][j].f_time))
-	'''
-	if graphic_result == 1:
-		func.graphic_result(num_threads, thread_queue, 'wfs', task_type, '', '') # The graphical output
-
-	# Return the results to the main program #
-	return response_time, idle_time, waiting_time, miss_deadline
+			# Create and start the threads #
+			thr_clock = threading.Thread(target = self.clock, args = (num_threads, ))
+			thr_clock.start()
+
+			threads = []
+			for i in range(num_threads):
+				if task_type == 'tied':
+					thr = threading.Thread(target = self.mapping_tied, args = (i, ) + args)
+				else:
+					thr = threading.Thread(target = self.mapping_untied, args = (i, ) + args)
+				threads.append(thr)
+				thr.start()
+
+			# Wait until the threads are executed completely #
+			thr_clock.join()
+			for thr in threads:
+				thr.join()
+			threads = []
+
+		# Calculate the results #
+		response_time = self.t # The response time
+		idle_time = sum(func.idle_time(num_threads, self.thread_queue, self.details, self.t)) # The idle time of the system
+		waiting_time = func.wait_time(num_threads, self.thread_queue, self.details) # The waiting time of the threads
+		miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, self.thread_queue, self.details, deadline, self.t) # The missed deadline status of the system
+
+		# Show the results #
+		print('Response time: ' + str(response_time))
+		print('Idle time: ' + str(idle_time))
+		print('Waiting time: ' + str(waiting_time))
+		print('Missed deadline: ' + str(miss_deadline))
+		'''
+		print("\nThe queues of the threads:") # The contents of the queues of the threads
+		for i in range(num_threads):
+			print('Thr ' + str(i) + ':')
+			for j in range(len(self.thread_queue[i])):
+				print('p' + str(self.thread_queue[i][j].t_id) + str(self.thread_queue[i][j].p_id) + ' --> status = ' + self.details[self.thread_queue[i][j]].status + ', start waiting time = ' + str(self.details[self.thread_queue[i][j]].s_w_time) +\
+				 ', finish waiting time = ' + str(self.details[self.thread_queue[i][j]].f_w_time) + ', start time = ' + str(self.details[self.thread_queue[i][j]].s_time) + ', finish time = ' + str(self.details[self.thread_queue[i][j]].f_time))
+		'''
+		if graphic_result == 1:
+			func.graphic_result(num_threads, self.thread_queue, self.details, 'wfs', task_type, '', '') # The graphical output
+
+		# Return the results to the main program #
+		return response_time, idle_time, waiting_time, miss_deadline
+
+# The main mapping process using a new scheduler #
+def execute(task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result, sim_engine):
+	return scheduler().execute(task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result, sim_engine)
\ No newline at end of file
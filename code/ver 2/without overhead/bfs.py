@@ -17,229 +17,246 @@
  # See the License for the specific language governing permissions and
  # limitations under the License.
  #**************************************************************************
+from collections import OrderedDict
 import func
 
-# Global variables #
-part_queue = [] # The queue of ready parts
-thread_queue = [] # The queues of the threads
-curr_thread_num = None # The thread number of the last finished task part
-parts_cnt = 0 # The number of all the parts
-comp_parts_cnt = 0 # The number of completed parts
-
-# The mapping process for tied tasks #
-def mapping_tied(num_tasks, num_threads, part_list):
-	global thread_queue, part_queue, curr_thread_num, parts_cnt, comp_parts_cnt
-
-	t = 0 # Response time
-
-	# Continue the mapping process while the queue of ready parts is not empty and #
-	# the queues of the threads do not include any part in the execution status #
-	while comp_parts_cnt < parts_cnt:
-		for thr_num in range(num_threads):
-			# Check the queue of each thread separately #
-			if bool(thread_queue[thr_num]):
-				part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
-				# The task is in the waitng status #
-				if part.status == 'w':
-					for i in range(num_threads):
-						for j in range(len(thread_queue[i])):
-							if part.dep == thread_queue[i][j] and thread_queue[i][j].status == 'f':
-								part.f_w_time = t
-
-								part.status = 's'
-								part.s_time = t
-								part.f_time = t + part.et
-
-				# The task is in the execution status and its process has been finished #
-				if part.status == 's' and part.f_time <= t:
-					part.status = 'f'
-					curr_thread_num = thr_num
-					comp_parts_cnt += 1
-
-					# The part includes a sibling part #
-					if part.sibling != None:
-						# The sibling part contains a data dependency #
-						if part.sibling.dep == None:
-							thread_queue[thr_num].append(part.sibling)
-
-							new_part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
-							new_part.status = 's'
-							new_part.s_time = t
-							new_part.f_time = t + thread_queue[thr_num][len(thread_queue[thr_num]) - 1].et
-						# The sibling part does not contain a data dependency #
-						else:
-							thread_queue[thr_num].append(part.sibling)
-
-							new_part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
-							new_part.status = 'w'
-							new_part.s_w_time = t
-
-					# If the part includes any child parts #
-					child_list = func.discover_child(num_tasks, part_list, part)
-					for i in range(len(child_list)):
-						part_queue.append(child_list[i])
-
-			# Check the list of ready parts and assign them to the threads #
-			# This process is done just by the master thread #
-			if thr_num == 0:
-				if bool(part_queue):
-					remove_list = []
-					# Look for any part in the queue of ready parts and find an idle thread for each one #
-					for i in range(len(part_queue)):
-						# Check whether there is a data dependency, so the related part is finished #
-						flag_finished = False
-						if part_queue[i].dep != None:
-							for j in range(num_threads):
-								for k in range(len(thread_queue[j])):
-									if part_queue[i].dep == thread_queue[j][k] and thread_queue[j][k].status == 'f':
-										flag_finished = True
-
-						# Map the part if there is not a data dependency, or #
-						# there is a data dependency but the related part is finished #
-						if part_queue[i].dep == None or (part_queue[i].dep != None and flag_finished == True):
-							# Find an idle thread for the part #
-							thread_num = func.find_idle_thread(num_threads, thread_queue, curr_thread_num)
-
-							# An idle thread is found #
-							if thread_num != None:
-								thread_queue[thread_num].append(part_queue[i])
-								new_part = thread_queue[thread_num][len(thread_queue[thread_num]) - 1]
-
-								new_part.status = 's'
-								new_part.s_time = t
-								new_part.f_time = t + part_queue[i].et
-
-								remove_list.append(part_queue[i])
-
-					# Remove the parts, which were processed, from the queue of ready parts #
-					for j in range(len(remove_list)):
-						list_index = part_queue.index(remove_list[j])
-						part_queue.remove(part_queue[list_index])
-
-		t += 1
-
-	return t
-
-# The mapping process for untied tasks #
-def mapping_untied(num_tasks, num_threads, part_list):
-	global thread_queue, part_queue, curr_thread_num, parts_cnt, comp_parts_cnt
-
-	t = 0 # Response time
-
-	# Doing the mapping process while the queues of the threads and #
-	# the queue of ready parts are not empty #
-	while comp_parts_cnt < parts_cnt:
-		for thr_num in range(num_threads):
-			# Check the queue of each thread separately #
-			if bool(thread_queue[thr_num]):
-				part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
-				# The task is in the execution status and its process has been finished #
-				if part.status == 's' and part.f_time <= t:
-					part.status = 'f'
-					curr_thread_num = thr_num
-					comp_parts_cnt += 1
-
-					# The part includes a sibling part #
-					if part.sibling != None:
-						part_queue.append(part.sibling)
-
-					# If the part includes any child parts #
-					child_list = func.discover_child(num_tasks, part_list, part)
-					for i in range(len(child_list)):
-						part_queue.append(child_list[i])
-
-			# Check the list of ready parts and assign them to the threads #
-			# This process is done just by the master thread #
-			if thr_num == 0:
-				if bool(part_queue):
-					remove_list = []
-					# Look for any part in the queue of ready parts and find an idle thread for each one #
-					for i in range(len(part_queue)):
-						# Check whether there is a data dependency, so the related part is finished #
-						flag_finished = False
-						if part_queue[i].dep != None:
-							for j in range(num_threads):
-								for k in range(len(thread_queue[j])):
-									if part_queue[i].dep == thread_queue[j][k] and thread_queue[j][k].status == 'f':
-										flag_finished = True
-
-						# Map the part if there is not a data dependency, or #
-						# there is a data dependency but the related part is finished #
-						if part_queue[i].dep == None or (part_queue[i].dep != None and flag_finished == True):
-							# Find an idle thread for the part #
-							thread_num = func.find_idle_thread(num_threads, thread_queue, curr_thread_num)
-
-							# An idle thread is found #
-							if thread_num != None:
-								thread_queue[thread_num].append(part_queue[i])
-								new_part = thread_queue[thread_num][len(thread_queue[thread_num]) - 1]
-
-								new_part.status = 's'
-								new_part.s_time = t
-								new_part.f_time = t + part_queue[i].et
-
-								remove_list.append(part_queue[i])
-
-					# Remove the parts, which were processed, from the queue of ready parts #
-					for j in range(len(remove_list)):
-						list_index = part_queue.index(remove_list[j])
-						part_queue.remove(part_queue[list_index])
-
-		t += 1
-
-	return t
-
-# The main mapping process #
-def execute(task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result):
-	global thread_queue, part_queue, parts_cnt
-
-	# Determine the number of all the parts #
-	for i in range(num_tasks):
-		parts_cnt += len(part_list[i])
-
-	# Initialize the ready queue #
-	part_queue = []
-
-	# Create a queue for each thread #
-	thread_queue = []
-	for i in range(num_threads):
-		thread_queue.append([])
-
-	# Put the first part of the system in the queue of the first thread #
-	thread_queue[0].append(first_task_part)
-	thread_queue[0][0].status = 's'
-	thread_queue[0][0].s_time = 1
-	thread_queue[0][0].f_time = 1 + thread_queue[0][0].et
-
-	# Show the mapping algorithm and the task type #
-	if task_type == 'tied':
-		print('\nBFS for tied tasks\n***********************************')
-		t = mapping_tied(num_tasks, num_threads, part_list)
-	else:
-		print('\nBFS for untied tasks\n***********************************')
-		t = mapping_untied(num_tasks, num_threads, part_list)
-
-	# Calculate the results #
-	response_time = t # The response time
-	idle_time = sum(func.idle_time(num_threads, thread_queue, t)) # The idle time of the system
-	waiting_time = func.wait_time(num_threads, thread_queue) # The waiting time of the threads
-	miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, thread_queue, deadline, t) # The missed deadline status of the system
-
-	# Show the results #
-	print('Response time: ' + str(response_time))
-	print('Idle time: ' + str(idle_time))
-	print('Waiting time: ' + str(waiting_time))
-	print('Missed deadline: ' + str(miss_deadline))
-	'''
-	print("\nThe queues of the threads:") # The contents of the queues of the threads
-	for i in range(num_threads):
-		print('Thr ' + str(i) + ':')
-		for j in range(len(thread_queue[i])):
-			print('p' + str(thread_queue[i][j].t_id) + str(thread_queue[i][j].p_id) + ' --> status = ' + thread_queue[i][j].status + ', start waiting time = ' + str(thread_queue[i][j].s_w_time) +\
-			 ', finish waiting time = ' + str(thread_queue[i][j].f_w_time) + ', start time = ' + str(thread_queue[i][j].s_time) + ', finish time = ' + str(thread_queue[i][j].f_time))
-	'''
-	if graphic_result == 1:
-		func.graphic_result(num_threads, thread_queue, 'bfs', task_type, '', '') # The graphical output
-
-	# Return the results to the main program #
-	return response_time, idle_time, waiting_time, miss_deadline
+# Define the class of the BFS scheduler, which keeps the state of one mapping process #
+class scheduler:
+	def __init__(self):
+		self.part_queue = OrderedDict() # The queue of ready parts (in order, with O(1) insertion at both ends and O(1) removal)
+		self.thread_queue = [] # The queues of the threads
+		self.curr_thread_num = None # The thread number of the last finished task part
+		self.idle_threads = 0 # The bitset of the idle threads (bit i is set if Thread i is idle)
+		self.details = {} # The details of the mapping process of the parts (see func.detail), kept apart from the parts of the graph
+		self.parts_cnt = 0 # The number of all the parts
+		self.comp_parts_cnt = 0 # The number of completed parts
+
+	# Mark a thread as idle in the bitset of the idle threads #
+	def set_idle(self, thr_num):
+		self.idle_threads |= 1 << thr_num
+
+	# Mark a thread as busy in the bitset of the idle threads #
+	def set_busy(self, thr_num):
+		self.idle_threads &= ~(1 << thr_num)
+
+	# The mapping process for tied tasks #
+	def mapping_tied(self, num_tasks, num_threads, part_list, time_skip):
+		t = 0 # Response time
+
+		# Continue the mapping process while the queue of ready parts is not empty and #
+		# the queues of the threads do not include any part in the execution status #
+		while self.comp_parts_cnt < self.parts_cnt:
+			# Record the number of completed and mapped parts before checking the threads #
+			num_comp_parts = self.comp_parts_cnt
+			num_mapped_parts = func.count_parts(num_threads, self.thread_queue)
+
+			for thr_num in range(num_threads):
+				# Check the queue of each thread separately #
+				if bool(self.thread_queue[thr_num]):
+					part = self.thread_queue[thr_num][len(self.thread_queue[thr_num]) - 1]
+					detail = self.details[part]
+					# The task is in the waitng status #
+					if detail.status == 'w' and func.dep_satisfied(self.details, part):
+						detail.f_w_time = t
+
+						detail.status = 's'
+						detail.s_time = t
+						detail.f_time = t + part.et
+
+					# The task is in the execution status and its process has been finished #
+					if detail.status == 's' and detail.f_time <= t:
+						detail.status = 'f'
+						self.set_idle(thr_num)
+						self.curr_thread_num = thr_num
+						self.comp_parts_cnt += 1
+
+						# The part includes a sibling part #
+						if part.sibling != None:
+							# The sibling part contains a data dependency #
+							if part.sibling.dep == None:
+								self.details[part.sibling] = func.detail('s', None, None, t, t + part.sibling.et)
+								self.thread_queue[thr_num].append(part.sibling)
+								self.set_busy(thr_num)
+							# The sibling part does not contain a data dependency #
+							else:
+								self.details[part.sibling] = func.detail('w', t, None, None, None)
+								self.thread_queue[thr_num].append(part.sibling)
+								self.set_busy(thr_num)
+
+						# If the part includes any child parts #
+						child_list = func.discover_child(num_tasks, part_list, part)
+						for i in range(len(child_list)):
+							self.part_queue[child_list[i]] = None
+
+				# Check the list of ready parts and assign them to the threads #
+				# This process is done just by the master thread #
+				if thr_num == 0:
+					if bool(self.part_queue):
+						remove_list = []
+						# Look for any part in the queue of ready parts and find an idle thread for each one #
+						for ready_part in self.part_queue:
+							# Map the part if there is not a data dependency, or #
+							# there is a data dependency but the related part is finished #
+							if func.dep_satisfied(self.details, ready_part):
+								# Find an idle thread for the part #
+								thread_num = func.find_idle_thread(num_threads, self.idle_threads, self.curr_thread_num)
+
+								# An idle thread is found #
+								if thread_num != None:
+									self.details[ready_part] = func.detail('s', None, None, t, t + ready_part.et)
+									self.thread_queue[thread_num].append(ready_part)
+									self.set_busy(thread_num)
+
+									remove_list.append(ready_part)
+
+								# There is not any idle thread for the next parts either #
+								else:
+									break
+
+						# Remove the parts, which were processed, from the queue of ready parts #
+						for j in range(len(remove_list)):
+							del self.part_queue[remove_list[j]]
+
+			# Skip to the next finish time if no part has been completed or mapped at this time, #
+			# since no decision is possible until then #
+			if time_skip == 1 and self.comp_parts_cnt == num_comp_parts and func.count_parts(num_threads, self.thread_queue) == num_mapped_parts:
+				t = func.next_finish_time(num_threads, self.thread_queue, self.details, t)
+			else:
+				t += 1
+
+		return t
+
+	# The mapping process for untied tasks #
+	def mapping_untied(self, num_tasks, num_threads, part_list, time_skip):
+		t = 0 # Response time
+
+		# Doing the mapping process while the queues of the threads and #
+		# the queue of ready parts are not empty #
+		while self.comp_parts_cnt < self.parts_cnt:
+			# Record the number of completed and mapped parts before checking the threads #
+			num_comp_parts = self.comp_parts_cnt
+			num_mapped_parts = func.count_parts(num_threads, self.thread_queue)
+
+			for thr_num in range(num_threads):
+				# Check the queue of each thread separately #
+				if bool(self.thread_queue[thr_num]):
+					part = self.thread_queue[thr_num][len(self.thread_queue[thr_num]) - 1]
+					detail = self.details[part]
+					# The task is in the execution status and its process has been finished #
+					if detail.status == 's' and detail.f_time <= t:
+						detail.status = 'f'
+						self.set_idle(thr_num)
+						self.curr_thread_num = thr_num
+						self.comp_parts_cnt += 1
+
+						# The part includes a sibling part #
+						if part.sibling != None:
+							self.part_queue[part.sibling] = None
+
+						# If the part includes any child parts #
+						child_list = func.discover_child(num_tasks, part_list, part)
+						for i in range(len(child_list)):
+							self.part_queue[child_list[i]] = None
+
+				# Check the list of ready parts and assign them to the threads #
+				# This process is done just by the master thread #
+				if thr_num == 0:
+					if bool(self.part_queue):
+						remove_list = []
+						# Look for any part in the queue of ready parts and find an idle thread for each one #
+						for ready_part in self.part_queue:
+							# Map the part if there is not a data dependency, or #
+							# there is a data dependency but the related part is finished #
+							if func.dep_satisfied(self.details, ready_part):
+								# Find an idle thread for the part #
+								thread_num = func.find_idle_thread(num_threads, self.idle_threads, self.curr_thread_num)
+
+								# An idle thread is found #
+								if thread_num != None:
+									self.details[ready_part] = func.detail('s', None, None, t, t + ready_part.et)
+									self.thread_queue[thread_num].append(ready_part)
+									self.set_busy(thread_num)
+
+									remove_list.append(ready_part)
+
+								# There is not any idle thread for the next parts either #
+								else:
+									break
+
+						# Remove the parts, which were processed, from the queue of ready parts #
+						for j in range(len(remove_list)):
+							del self.part_queue[remove_list[j]]
+
+			# Skip to the next finish time if no part has been completed or mapped at this time, #
+			# since no decision is possible until then #
+			if time_skip == 1 and self.comp_parts_cnt == num_comp_parts and func.count_parts(num_threads, self.thread_queue) == num_mapped_parts:
+				t = func.next_finish_time(num_threads, self.thread_queue, self.details, t)
+			else:
+				t += 1
+
+		return t
+
+	# The main mapping process #
+	def execute(self, task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result, time_skip):
+		# Determine the number of all the parts, so the scheduler can be reused for another mapping process #
+		self.parts_cnt = 0
+		self.comp_parts_cnt = 0
+		for i in range(num_tasks):
+			self.parts_cnt += len(part_list[i])
+
+		# Initialize the ready queue #
+		self.part_queue = OrderedDict()
+
+		# Create a queue for each thread #
+		self.thread_queue = []
+		for i in range(num_threads):
+			self.thread_queue.append([])
+
+		# Create the details of the mapping process of the parts #
+		self.details = {}
+
+		# Put the first part of the system in the queue of the first thread #
+		self.details[first_task_part] = func.detail('s', None, None, 1, 1 + first_task_part.et)
+		self.thread_queue[0].append(first_task_part)
+
+		# All the threads except the first thread are idle #
+		self.idle_threads = 0
+		for i in range(num_threads)[1::]:
+			self.idle_threads |= 1 << i
+
+		# Show the mapping algorithm and the task type #
+		if task_type == 'tied':
+			print('\nBFS for tied tasks\n***********************************')
+			t = self.mapping_tied(num_tasks, num_threads, part_list, time_skip)
+		else:
+			print('\nBFS for untied tasks\n***********************************')
+			t = self.mapping_untied(num_tasks, num_threads, part_list, time_skip)
+
+		# Calculate the results #
+		response_time = t # The response time
+		idle_time = sum(func.idle_time(num_threads, self.thread_queue, self.details, t)) # The idle time of the system
+		waiting_time = func.wait_time(num_threads, self.thread_queue, self.details) # The waiting time of the threads
+		miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, self.thread_queue, self.details, deadline, t) # The missed deadline status of the system
+
+		# Show the results #
+		print('Response time: ' + str(response_time))
+		print('Idle time: ' + str(idle_time))
+		print('Waiting time: ' + str(waiting_time))
+		print('Missed deadline: ' + str(miss_deadline))
+		'''
+		print("\nThe queues of the threads:") # The contents of the queues of the threads
+		for i in range(num_threads):
+			print('Thr ' + str(i) + ':')
+			for j in range(len(self.thread_queue[i])):
+				print('p' + str(self.thread_queue[i][j].t_id) + str(self.thread_queue[i][j].p_id) + ' --> status = ' + self.details[self.thread_queue[i][j]].status + ', start waiting time = ' + str(self.details[self.thread_queue[i][j]].s_w_time) +\
+				 ', finish waiting time = ' + str(self.details[self.thread_queue[i][j]].f_w_time) + ', start time = ' + str(self.details[self.thread_queue[i][j]].s_time) + ', finish time = ' + str(self.details[self.thread_queue[i][j]].f_time))
+		'''
+		if graphic_result == 1:
+			func.graphic_result(num_threads, self.thread_queue, self.details, 'bfs', task_type, '', '') # The graphical output
+
+		# Return the results to the main program #
+		return response_time, idle_time, waiting_time, miss_deadline
+
+# The main mapping process using a new scheduler #
+def execute(task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result, time_skip):
+	return scheduler().execute(task_type, num_tasks, num_threads, part_list, deadline, first_task_part, graphic_result, time_skip)
\ No newline at end of file
@@ -0,0 +1,188 @@
+ #**************************************************************************
+ # cache.py
+ #
+ # This file includes a cache of the generated random graphs on the disk,
+ # in which each graph is stored with its child index and its descendant
+ # relation in a compact binary file named by a hash of its parameters.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+from array import array
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import gen
+
+# Global variables #
+cache_dir = 'graph_cache' # The directory of the cache
+version = 2 # The version of the format of the files (a part of the hash, so the files of another version are not used)
+magic = b'HMGRAPH' + bytes([version]) # The first bytes of each file
+header = struct.Struct('<8s6q') # magic, num_tasks, num_all_parts, num_child, desc_size, state_size, byte order (1: little-endian)
+
+# The layout of a file (all the numbers are 8-byte integers in the byte order of the system, so each section can be memory-mapped) #
+# header | t_id, p_id, dep, parent, sibling, num_succ (num_all_parts numbers each, the indices of the parts, -1 for no part) | #
+# offset (num_tasks + 1 numbers, the index of the first part of each task) | child_offset (num_all_parts + 1 numbers) | #
+# child (num_child numbers, the child tasks of part k are child[child_offset[k]:child_offset[k + 1]]) | #
+# desc_offset (num_tasks + 1 numbers, in bytes) | desc_rel (desc_size bytes, the bitset of task i is little-endian in #
+# desc_rel[desc_offset[i]:desc_offset[i + 1]]) | state (state_size bytes, the state of the random number generator after generating the graph in JSON) #
+
+# Specify the name of the file of a graph based on a hash of the parameters of the random graph and its seed #
+def file_name(num_tasks, num_parts, system_model, dep_pro, num_dep_level, min_num_child, max_num_child, seed, numpy_gen):
+	params = (version, num_tasks, num_parts, system_model, dep_pro, num_dep_level, min_num_child, max_num_child, seed, numpy_gen)
+	return os.path.join(cache_dir, hashlib.sha256(repr(params).encode()).hexdigest() + '.graph')
+
+# Pad a number of bytes to a multiple of 8 #
+def pad(size):
+	return (size + 7) // 8 * 8
+
+# Encode the state of a random number generator as JSON, so loading a file cannot run any code (unlike pickle) #
+# The state of the random module is a tuple (version, internal state, gauss_next), and the state of a NumPy bit generator is a dictionary #
+def encode_state(state):
+	if isinstance(state, tuple):
+		state = {'random': [state[0], list(state[1]), state[2]]}
+	else:
+		state = {'numpy': state}
+
+	return json.dumps(state).encode()
+
+# Decode the state of a random number generator, rebuilding the tuple of the random module #
+def decode_state(state_bytes):
+	state = json.loads(bytes(state_bytes))
+	if 'random' in state:
+		return (state['random'][0], tuple(state['random'][1]), state['random'][2])
+
+	return state['numpy']
+
+# Store a graph with its descendant relation and the state of the random number generator in a file #
+def save(file_name, num_tasks, part_list, desc_rel, state):
+	# Specify the index of each part in the order of part_list #
+	parts_list_tmp = [] # All the parts in the order of their indices
+	offset = array('q', [0])
+	for i in range(num_tasks):
+		parts_list_tmp.extend(part_list[i])
+		offset.append(len(parts_list_tmp))
+
+	index = {}
+	for k in range(len(parts_list_tmp)):
+		index[parts_list_tmp[k]] = k
+
+	# Take the details of the parts as the indices of the parts #
+	t_id = array('q')
+	p_id = array('q')
+	dep = array('q')
+	parent = array('q')
+	sibling = array('q')
+	num_succ = array('q')
+	child_offset = array('q', [0])
+	child = array('q')
+	for k in range(len(parts_list_tmp)):
+		part = parts_list_tmp[k]
+		t_id.append(part.t_id)
+		p_id.append(part.p_id)
+		dep.append(index.get(part.dep, -1))
+		parent.append(index.get(part.parent, -1))
+		sibling.append(index.get(part.sibling, -1))
+		num_succ.append(part.num_succ)
+		for c in range(len(part.child)):
+			child.append(index[part.child[c]])
+		child_offset.append(len(child))
+
+	# Take the bitset of each task as little-endian bytes padded to 8 bytes #
+	desc_offset = array('q', [0])
+	desc_bytes = bytearray()
+	for i in range(num_tasks):
+		desc_bytes += desc_rel[i].to_bytes(pad((desc_rel[i].bit_length() + 7) // 8), 'little')
+		desc_offset.append(len(desc_bytes))
+
+	state_bytes = encode_state(state)
+
+	# Write the file under a temporary name and rename it, so a file being written (e.g., by another worker) is never read #
+	os.makedirs(os.path.dirname(file_name) or '.', exist_ok = True)
+	tmp_name = file_name + '.' + str(os.getpid()) + '.tmp'
+	with open(tmp_name, 'wb') as file:
+		file.write(header.pack(magic, num_tasks, len(parts_list_tmp), len(child), len(desc_bytes), len(state_bytes), int(sys.byteorder == 'little')))
+		for section in [t_id, p_id, dep, parent, sibling, num_succ, offset, child_offset, child, desc_offset]:
+			file.write(section.tobytes())
+		file.write(desc_bytes)
+		file.write(state_bytes)
+	os.replace(tmp_name, file_name)
+
+# Memory-map a file of a graph and return its sections (a dictionary of memory views, each of them can be used as an array) #
+def open_graph(file_name):
+	with open(file_name, 'rb') as file:
+		buffer = memoryview(mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ))
+
+	file_magic, num_tasks, num_all_parts, num_child, desc_size, state_size, little_endian = header.unpack_from(buffer)
+	if file_magic != magic or little_endian != int(sys.byteorder == 'little'):
+		raise ValueError('The file ' + file_name + ' is not a graph of this version of the cache')
+
+	sections = {'num_tasks': num_tasks}
+	position = header.size
+	for name, count in [('t_id', num_all_parts), ('p_id', num_all_parts), ('dep', num_all_parts), ('parent', num_all_parts), ('sibling', num_all_parts), \
+		('num_succ', num_all_parts), ('offset', num_tasks + 1), ('child_offset', num_all_parts + 1), ('child', num_child), ('desc_offset', num_tasks + 1)]:
+		sections[name] = buffer[position:position + count * 8].cast('q')
+		position += count * 8
+
+	sections['desc_rel'] = buffer[position:position + desc_size]
+	position += desc_size
+	sections['state'] = buffer[position:position + state_size]
+
+	return sections
+
+# Load a graph with its descendant relation and the state of the random number generator from a file #
+# The parts are created by part (the class of the task part or a compact storage), like the graph generator #
+def load(file_name, part):
+	sections = open_graph(file_name)
+	num_tasks = sections['num_tasks']
+
+	part_list = gen.create_parts(num_tasks, part, sections['offset'], sections['t_id'], sections['p_id'], sections['dep'], sections['parent'], \
+		sections['sibling'], sections['num_succ'], sections['child_offset'], sections['child'])
+
+	desc_rel = []
+	desc_offset = sections['desc_offset']
+	for i in range(num_tasks):
+		desc_rel.append(int.from_bytes(sections['desc_rel'][desc_offset[i]:desc_offset[i + 1]], 'little'))
+
+	return part_list, desc_rel, decode_state(sections['state'])
+
+# Generate a random graph, or load it from the cache if it has been generated with the same parameters and seed #
+# The random number generator (the random module, or rng if a NumPy random generator is used) must be seeded with seed, #
+# and it is left in the same state as after generating the graph, so the next random numbers (e.g., the execution times) #
+# are the same whether the graph is generated or loaded #
+def graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, seed, rng):
+	name = file_name(num_tasks, num_parts, system_model, dep_pro, num_dep_level, min_num_child, max_num_child, seed, int(rng != None))
+
+	if os.path.exists(name):
+		part_list, desc_rel, state = load(name, part)
+		if rng != None:
+			rng.bit_generator.state = state
+		else:
+			random.setstate(state)
+	else:
+		if rng != None:
+			part_list = gen.graph_rand_np(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, rng)
+			state = rng.bit_generator.state
+		else:
+			part_list = gen.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child)
+			state = random.getstate()
+
+		desc_rel = gen.descendant_rel(num_tasks, part_list)
+		save(name, num_tasks, part_list, desc_rel, state)
+
+	return part_list, desc_rel
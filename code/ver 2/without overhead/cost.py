@@ -0,0 +1,145 @@
+ #**************************************************************************
+ # cost.py
+ #
+ # This file includes the evaluator of the costs of the TMCD and MCD
+ # heuristics, which calculates the costs of all the threads (TMCD) or all
+ # the candidate parts (MCD) in one call, vectorized using NumPy for long
+ # lists.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+from operator import itemgetter
+
+# NumPy is optional, and the costs are calculated one element at a time without it #
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+# The minimum length of the lists whose costs are vectorized, since a NumPy call has a fixed overhead that is larger #
+# than calculating the costs of a few threads or parts one element at a time #
+vector_size = 64
+
+# The evaluator calculates the costs in the same order of operations as the heuristics, so the costs are exactly the same #
+# whether they are vectorized or not #
+
+# Calculate the recent idle time of the threads from their last idle time (-1 for a busy thread, whose recent idle time is 0) #
+def recent_idle_time(last_idle, t):
+	if numpy == None or len(last_idle) < vector_size:
+		rec_idle_time = []
+		for i in range(len(last_idle)):
+			if last_idle[i] != -1:
+				rec_idle_time.append(t - last_idle[i])
+			else:
+				rec_idle_time.append(0)
+
+		return rec_idle_time
+
+	last_idle = numpy.array(last_idle, dtype = numpy.int64)
+	return numpy.where(last_idle != -1, t - last_idle, 0)
+
+# Calculate the cost of the allocation queues of the threads by the TMCD heuristic #
+# num_parts, rec_idle_time and queue_et are the number of parts, the recent idle time and the total execution time of each queue #
+def tmcd_cost(alpha, beta, gamma, num_parts, rec_idle_time, queue_et):
+	if numpy == None or len(num_parts) < vector_size:
+		# Calculate the totals (1 instead of 0, so the terms of the cost are 0 for empty queues) #
+		total_num_parts = sum(num_parts)
+		total_it = sum(rec_idle_time)
+		total_et = sum(queue_et)
+		if total_num_parts == 0:
+			total_num_parts = 1
+		if total_et == 0:
+			total_et = 1
+
+		cost = []
+		for i in range(len(num_parts)):
+			# A thread that is not idle does not have a term of the recent idle time #
+			if rec_idle_time[i] != 0:
+				val_it = 1 / (rec_idle_time[i] / total_it)
+			else:
+				val_it = 0
+
+			cost.append(alpha * num_parts[i] / total_num_parts + beta * val_it + gamma * queue_et[i] / total_et)
+
+		return cost
+
+	num_parts = numpy.asarray(num_parts, dtype = numpy.int64)
+	rec_idle_time = numpy.asarray(rec_idle_time, dtype = numpy.int64)
+	queue_et = numpy.asarray(queue_et, dtype = numpy.int64)
+
+	# Calculate the totals (1 instead of 0, so the terms of the cost are 0 for empty queues) #
+	total_num_parts = int(num_parts.sum())
+	total_it = int(rec_idle_time.sum())
+	total_et = int(queue_et.sum())
+	if total_num_parts == 0:
+		total_num_parts = 1
+	if total_et == 0:
+		total_et = 1
+
+	# A thread that is not idle does not have a term of the recent idle time #
+	val_it = numpy.zeros(len(rec_idle_time))
+	idle = rec_idle_time != 0
+	val_it[idle] = 1 / (rec_idle_time[idle] / total_it)
+
+	return alpha * num_parts / total_num_parts + beta * val_it + gamma * queue_et / total_et
+
+# Calculate the cost of the candidate parts by the MCD heuristic from their execution times and response times #
+def mcd_cost(theta, psi, et, rt):
+	if numpy == None or len(et) < vector_size:
+		# Calculate total execution time and total response time of the parts #
+		total_et = 0
+		total_rt = 0
+		for i in range(len(et)):
+			total_et += et[i]
+			total_rt += rt[i]
+
+		cost = []
+		for i in range(len(et)):
+			cost.append(theta * et[i] / total_et + psi * 1 / (rt[i] / total_rt))
+
+		return cost
+
+	et = numpy.asarray(et, dtype = numpy.int64)
+	rt = numpy.asarray(rt, dtype = float)
+
+	# Calculate total execution time and total response time of the parts #
+	# The response times are added in order (the last cumulative sum), like the heuristic, instead of by pairwise summation #
+	total_et = int(et.sum())
+	total_rt = numpy.cumsum(rt)[-1]
+
+	return theta * et / total_et + psi * 1 / (rt / total_rt)
+
+# Sort the indices (the threads or the parts) based on the least cost, keeping the order of the indices on ties #
+def least_cost_order(cost):
+	if numpy == None or len(cost) < vector_size:
+		order = sorted(enumerate(cost), key = itemgetter(1))
+		for i in range(len(order)):
+			order[i] = order[i][0]
+
+		return order
+
+	return numpy.argsort(cost, kind = 'stable').tolist()
+
+# Find the index (the thread or the part) with the least cost, taking the first one on ties #
+def least_cost(cost):
+	if numpy == None or len(cost) < vector_size:
+		index = 0
+		for i in range(len(cost)):
+			if cost[i] < cost[index]:
+				index = i
+
+		return index
+
+	return int(numpy.argmin(cost))
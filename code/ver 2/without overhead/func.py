@@ -20,6 +20,19 @@
  #**************************************************************************
 from PIL import Image, ImageDraw, ImageFont
 
+# Define the class of the details of the mapping process of a part #
+# The details are kept by the scheduler of each mapping process (instead of the part), so several mapping processes #
+# can run on the same graph at the same time, and the parts do not need to be cleared before each of them #
+class detail:
+	__slots__ = ('status', 's_w_time', 'f_w_time', 's_time', 'f_time')
+
+	def __init__(self, status, s_w_time, f_w_time, s_time, f_time):
+		self.status = status # s: started; w : waiting for a data dependency; f : finished
+		self.s_w_time = s_w_time # Start time of the waiting process (data dependency)
+		self.f_w_time = f_w_time # Finish time of the waiting process (data dependency)
+		self.s_time = s_time # Start time of the execution process
+		self.f_time = f_time # Finish time of the execution process
+
 # Traverse the graph through the task parts #
 def traverse(num_tasks, part_list, task_part):
 	print('p' + str(task_part.t_id) + str(task_part.p_id))
@@ -31,69 +44,104 @@ def traverse(num_tasks, part_list, task_part):
 	if task_part.sibling != None:
 		traverse(num_tasks, part_list, task_part.sibling)
 
-# Clear the details of the list of parts #
-def clear(num_tasks, part_list):
-	for i in range(num_tasks):
-		for j in range(len(part_list[i])):
-			part_list[i][j].status = None
-			part_list[i][j].s_w_time = None
-			part_list[i][j].f_w_time = None
-			part_list[i][j].s_time = None
-			part_list[i][j].f_time = None
+# Discover the child tasks of a part using the index built by the graph generator (gen.index_child) #
+def discover_child(num_tasks, part_list, parent_part):
+	return parent_part.child
+
+# Check whether the data dependency of a part is satisfied (i.e., there is not a data dependency, or the related part is finished) #
+# Each part has at most one data dependency and details only includes the parts mapped in the current mapping process, so the #
+# detail of the related part marks whether it has been finished and the check does not scan the queues of the threads #
+def dep_satisfied(details, part):
+	if part.dep == None:
+		return True
 
-	return part_list
+	dep_detail = details.get(part.dep)
+	return dep_detail != None and dep_detail.status == 'f'
 
-# Discover the child tasks of a part #
-def discover_child(num_tasks, part_list, parent_part):
-	child_list = []
+# Check whether a task is a descendant of another task using the descendant relation (gen.descendant_rel) #
+def is_descendant(desc_rel, task, descendant_task):
+	return (desc_rel[task] >> descendant_task) & 1 == 1
+
+# Specify the tasks that can be started on a thread for tied tasks, i.e., the descendants of all the tasks suspended on the thread #
+# The result is a bitset like the descendant relation (bit j is set if Task j can be started), and all the tasks can be #
+# started (-1) if there are not any suspended tasks #
+def allowed_tasks(desc_rel, suspend_list):
+	allowed = -1
+	for i in range(len(suspend_list)):
+		allowed &= desc_rel[suspend_list[i]]
 
-	for i in range(num_tasks):
-		for j in range(len(part_list[i])):
-			if part_list[i][j].parent == parent_part:
-				child_list.append(part_list[i][j])
+	return allowed
 
-	return child_list
+# Check whether a task can be started on a thread using the bitset of the allowed tasks of the thread (allowed_tasks) #
+def is_allowed(allowed, task):
+	return (allowed >> task) & 1 == 1
 
-# Find an idle thread #
-def find_idle_thread(num_threads, thread_queue, curr_thread_num):
+# Find the lowest thread number in a bitset of threads #
+def lowest_thread(threads):
+	return (threads & -threads).bit_length() - 1
+
+# Find an idle thread using the bitset of the idle threads (bit i is set if Thread i is idle) #
+# The search starts after the thread of the last finished part and wraps around, so each call takes O(1) word operations #
+def find_idle_thread(num_threads, idle_threads, curr_thread_num):
 	thread_num = None
 
+	# There are not any idle threads #
+	if idle_threads == 0:
+		return thread_num
+
 	# If the number of threads is less than or equal to 2 #
 	if num_threads <= 2:
+		# Take the highest thread number #
 		if curr_thread_num == 0:
-			for i in range(num_threads)[::-1]:
-				if not bool(thread_queue[i]) or thread_queue[i][len(thread_queue[i]) - 1].status == 'f':
-					thread_num = i
-					break			
+			thread_num = idle_threads.bit_length() - 1
+		# Take the lowest thread number #
 		else:
-			for i in range(num_threads)[::]:
-				if not bool(thread_queue[i]) or thread_queue[i][len(thread_queue[i]) - 1].status == 'f':
-					thread_num = i
-					break				
+			thread_num = lowest_thread(idle_threads)
 
 	# If the number of threads is more than 2 #
 	else:
 		if curr_thread_num != num_threads - 1:
-			for i in range(num_threads)[curr_thread_num + 1::]:
-				if not bool(thread_queue[i]) or thread_queue[i][len(thread_queue[i]) - 1].status == 'f':
-					thread_num = i
-					break
-
-			if thread_num == None:
-				for i in range(num_threads)[:curr_thread_num:]:
-					if not bool(thread_queue[i]) or thread_queue[i][len(thread_queue[i]) - 1].status == 'f':
-						thread_num = i
-						break
+			# Look for the threads after the current thread #
+			next_threads = idle_threads >> (curr_thread_num + 1) << (curr_thread_num + 1)
+			if next_threads != 0:
+				thread_num = lowest_thread(next_threads)
+
+			# Look for the threads before the current thread #
+			else:
+				prev_threads = idle_threads & ((1 << curr_thread_num) - 1)
+				if prev_threads != 0:
+					thread_num = lowest_thread(prev_threads)
 		else:
-			for i in range(num_threads):
-				if not bool(thread_queue[i]) or thread_queue[i][len(thread_queue[i]) - 1].status == 'f':
-					thread_num = i
-					break
+			thread_num = lowest_thread(idle_threads)
 
 	return thread_num
 
+# Count the parts mapped to the threads #
+def count_parts(num_threads, queue):
+	count = 0
+	for i in range(num_threads):
+		count += len(queue[i])
+
+	return count
+
+# Find the next time at which a part being executed on the threads finishes #
+# A part waiting for a data dependency is released only when another part finishes #
+def next_finish_time(num_threads, queue, details, t):
+	next_time = None
+	for i in range(num_threads):
+		if bool(queue[i]):
+			detail = details[queue[i][len(queue[i]) - 1]]
+			if detail.status == 's' and (next_time == None or detail.f_time < next_time):
+				next_time = detail.f_time
+
+	# Advance the time by one tick if no part finishes later #
+	if next_time == None or next_time <= t:
+		next_time = t + 1
+
+	return next_time
+
 # Calculate the idle times #
-def idle_time(num_threads, queue, t):
+def idle_time(num_threads, queue, details, t):
 	idle_time_thr = [] # Idle time of each thread
 	# Determine the idle time of each thread separately #
 	for i in range(num_threads):
@@ -104,45 +152,61 @@ def idle_time(num_threads, queue, t):
 			f_time = 0
 
 			# Specify whether the part existing in the queue includes a waiting process #
-			if queue[i][j].s_w_time != None:
-				s_time = queue[i][j].s_w_time
+			if details[queue[i][j]].s_w_time != None:
+				s_time = details[queue[i][j]].s_w_time
 			else:
-				s_time = queue[i][j].s_time
+				s_time = details[queue[i][j]].s_time
 
 			# Determine whether the part existing in the queue has been executed completely #
-			if queue[i][j].f_time != None:
-				f_time = queue[i][j].f_time
+			if details[queue[i][j]].f_time != None:
+				f_time = details[queue[i][j]].f_time
 			else:
 				f_time = t
 
 			busy_time.append([s_time, f_time])
 
 		# Calculate the idle time of the thread based on its busy (wait and/or execution) times #
-		idle_time_thr.append([])
-		idle_time_thr[i] = 0
-		for k in range(t):
-			flag = False
-			for m in range(len(busy_time)):
-				if (k + 1) >= busy_time[m][0] and (k + 1) <= busy_time[m][1]:
-					flag = True
-			# Identify whether the thread is idle at time k #
-			if flag == False:
-				idle_time_thr[i] += 1
+		# The thread is busy at time k (1 <= k <= t) if s_time <= k <= f_time for any of its busy times, so #
+		# the busy times are clipped to [1, t], sorted and merged, and the idle time is the sum of the gaps #
+		busy_time = sorted(busy_time)
+		num_busy = 0 # The number of times at which the thread is busy
+		curr_s_time = None # Start time of the current merged busy time
+		curr_f_time = None # Finish time of the current merged busy time
+		for m in range(len(busy_time)):
+			s_time = max(busy_time[m][0], 1)
+			f_time = min(busy_time[m][1], t)
+			if s_time > f_time:
+				continue
+
+			# Merge the busy time with the current one if they overlap or are adjacent #
+			if curr_f_time != None and s_time <= curr_f_time + 1:
+				if f_time > curr_f_time:
+					curr_f_time = f_time
+			else:
+				if curr_f_time != None:
+					num_busy += curr_f_time - curr_s_time + 1
+				curr_s_time = s_time
+				curr_f_time = f_time
+
+		if curr_f_time != None:
+			num_busy += curr_f_time - curr_s_time + 1
+
+		idle_time_thr.append(t - num_busy)
 
 	return idle_time_thr
 
 # Calculate the waiting time of the threads (data dependency)
-def wait_time(num_threads, queue):
+def wait_time(num_threads, queue, details):
 	time = 0
 	for i in range(num_threads):
 		for j in range(len(queue[i])):
-			if queue[i][j].s_w_time != None and queue[i][j].f_w_time != None:
-				time += queue[i][j].f_w_time - queue[i][j].s_w_time
+			if details[queue[i][j]].s_w_time != None and details[queue[i][j]].f_w_time != None:
+				time += details[queue[i][j]].f_w_time - details[queue[i][j]].s_w_time
 
 	return time
 
 # Specify the missed deadline status of the whole system #
-def miss_deadline(num_tasks, num_threads, part_list, queue, deadline, t):
+def miss_deadline(num_tasks, num_threads, part_list, queue, details, deadline, t):
 	s_time = 0 # Start time
 	f_time = 0 # Finish time
 	# Check the parts existing in the queue of each thread #
@@ -151,16 +215,16 @@ def miss_deadline(num_tasks, num_threads, part_list, queue, deadline, t):
 			# Determine start time of the first part of the first task based on the waiting or execution process #
 			if queue[i][j].t_id == 0 and queue[i][j].p_id == 0:
 				# Specify whether the part includes a waiting time #
-				if queue[i][j].s_w_time != None:
-					s_time = queue[i][j].s_w_time
+				if details[queue[i][j]].s_w_time != None:
+					s_time = details[queue[i][j]].s_w_time
 				else:
-					s_time = queue[i][j].s_time
+					s_time = details[queue[i][j]].s_time
 
 			# Determine finish time of the last part of the last task #
 			if queue[i][j].t_id == (num_tasks - 1) and queue[i][j].p_id == (len(part_list[num_tasks - 1]) - 1):
 				# Specify whether the part has been finished completely #
-				if queue[i][j].f_time != None:
-					f_time = queue[i][j].f_time
+				if details[queue[i][j]].f_time != None:
+					f_time = details[queue[i][j]].f_time
 				else:
 					f_time = t
 
@@ -171,14 +235,14 @@ def miss_deadline(num_tasks, num_threads, part_list, queue, deadline, t):
 		return 1
 
 # Draw the graphical result #
-def graphic_result(num_threads, queue, alg_name, task_type, par1, par2):
+def graphic_result(num_threads, queue, details, alg_name, task_type, par1, par2):
 	# Specify the width and height of the window #
 	win_width = num_threads * 100 + (num_threads - 1) * 10 + 100
 	queue_height = 0
 	for i in range(num_threads):
 		if bool(queue[i]):
-			if queue_height < queue[i][len(queue[i]) - 1].f_time:
-				queue_height = queue[i][len(queue[i]) - 1].f_time
+			if queue_height < details[queue[i][len(queue[i]) - 1]].f_time:
+				queue_height = details[queue[i][len(queue[i]) - 1]].f_time
 	win_height = queue_height * 10 + 100
 
 	# Prepare the drawing process #
@@ -199,13 +263,13 @@ def graphic_result(num_threads, queue, alg_name, task_type, par1, par2):
 
 		for k in range(len(queue[j])):
 			# Draw the box related to the waiting process #
-			if queue[j][k].s_w_time != None and queue[j][k].f_w_time != None:
-				draw.rectangle((l_point, queue[j][k].s_w_time * 10 + 50, l_point + 100, queue[j][k].f_w_time * 10 + 50), fill = (200, 200, 200), outline = (0, 0, 0), width = 1)
+			if details[queue[j][k]].s_w_time != None and details[queue[j][k]].f_w_time != None:
+				draw.rectangle((l_point, details[queue[j][k]].s_w_time * 10 + 50, l_point + 100, details[queue[j][k]].f_w_time * 10 + 50), fill = (200, 200, 200), outline = (0, 0, 0), width = 1)
 			# Draw the box related to the execution process #
-			draw.rectangle((l_point, queue[j][k].s_time * 10 + 50, l_point + 100, queue[j][k].f_time * 10 + 50), fill = (0, 255, 0), outline = (0, 0, 0), width = 1)
+			draw.rectangle((l_point, details[queue[j][k]].s_time * 10 + 50, l_point + 100, details[queue[j][k]].f_time * 10 + 50), fill = (0, 255, 0), outline = (0, 0, 0), width = 1)
 			# Draw the name of each part #
 			part_id = 'p' + str(queue[j][k].t_id) + str(queue[j][k].p_id)
-			draw.text((l_point + 40, (queue[j][k].s_time + (queue[j][k].f_time - queue[j][k].s_time) // 2) * 10 + 45), part_id, fill = "black", font = font_part_id, align = "center")
+			draw.text((l_point + 40, (details[queue[j][k]].s_time + (details[queue[j][k]].f_time - details[queue[j][k]].s_time) // 2) * 10 + 45), part_id, fill = "black", font = font_part_id, align = "center")
 
 		l_point += 110
 
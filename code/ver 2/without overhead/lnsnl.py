@@ -19,334 +19,279 @@
  # See the License for the specific language governing permissions and
  # limitations under the License.
  #**************************************************************************
+from heapq import heappop, heappush
 import func
 
-# Global variables #
-ready_queue = [] # The ready queue
-suspend_list = [] # The list of tasks suspended on the threads
-last_idle = [] # Last idle time of the threads (-1 for a busy thread)
-thread_queue = [] # The thread queues of the threads
-parts_cnt = 0 # The number of all the parts
-comp_parts_cnt = 0 # The number of completed parts
-
-# The mapping process for tied tasks #
-def mapping_tied(num_tasks, num_threads, part_list, desc_rel):
-	global ready_queue, suspend_list, last_idle, thread_queue, parts_cnt, comp_parts_cnt
-
-	t = 0 # Response time
-
-	# Continue the mapping process while the ready queue and/or the thread queues of the threads are not empty #
-	while comp_parts_cnt < parts_cnt:
-		for thr_num in range(num_threads):
-			# Check the thread queue of each thread separately #
-			if bool(thread_queue[thr_num]):
-				part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
-				# The part is in the execution status and its process has been already finished #
-				if part.status == 's' and part.f_time <= t:
-					part.status = 'f'
-					last_idle[thr_num] = t
-					comp_parts_cnt += 1
-
-					# If the part has any child parts #
-					child_list = func.discover_child(num_tasks, part_list, part)
-					for i in range(len(child_list)):
-						ready_queue.append(child_list[i])
-
-					# The part has a sibling part #
-					if part.sibling != None:
-						ready_queue.append(part.sibling)
-
-					# Remove the task from the list of suspended tasks #
-					if part.p_id == len(part_list[part.t_id]) - 1:
-						suspend_list[thr_num].remove(part.t_id)
-
-			# This process is done just by the master thread #
-			if thr_num == 0:
-				# Check the ready queue and allocate one of its parts to an idle thread #
-				if bool(ready_queue):
-					# Select and sort the idle threads #
-					temp_idle_list = last_idle.copy()
-					sort_idle_list = []
-					for i in range(num_threads):
-						thread_id = -1
-						min_idle_time = -1
-						for j in range(num_threads):
-							if temp_idle_list[j] != -1:
-								thread_id = j
-								min_idle_time = temp_idle_list[j]
-								break
-
-						for k in range(num_threads)[j+1::]:
-							if temp_idle_list[k] != -1:
-								if temp_idle_list[k] < min_idle_time:
-									thread_id = k
-									min_idle_time = temp_idle_list[k]
-
-						if thread_id != -1:
-							sort_idle_list.append(thread_id)
-							temp_idle_list[thread_id] = -1
-
-					# Allocate and execute ready parts by idle threads #
-					for index in range(len(sort_idle_list)):
-						thread_id = sort_idle_list[index]
-						sel_parts = []
-						# Look for any parts in the ready queue and find suitable ones #
-						for i in range(len(ready_queue)):
-							# Check whether there is a data dependency, so the related part is finished #
-							flag_finished = False
-							if ready_queue[i].dep != None:
-								for j in range(num_threads):
-									for k in range(len(thread_queue[j])):
-										if ready_queue[i].dep == thread_queue[j][k] and thread_queue[j][k].status == 'f':
-											flag_finished = True
-
-							# Put the part in the list if there is not a data dependency, or #
-							# there is a data dependency but the related part is finished #
-							if ready_queue[i].dep == None or (ready_queue[i].dep != None and flag_finished == True):
-								# Check whether the part is the first part of its task #
-								# The part is the first part of the task #
-								if ready_queue[i].p_id == 0:
-									flag = True
-									for j in range(len(suspend_list[thread_id])):
-										if desc_rel[suspend_list[thread_id][j]][ready_queue[i].t_id] == 0:
-											flag = False
-
-									if flag == True:
-										sel_parts.append(ready_queue[i])
-
-								# The part is not the first part of the task #
-								else:
-									# Look for the first part of the task in the thread queue #
-									flag = False
-									for j in range(len(thread_queue[thread_id])):
-										if ready_queue[i].t_id == thread_queue[thread_id][j].t_id:
-											flag = True
-											break
-
-									if flag == True:
-										# Add the part to the selected parts #
-										sel_parts.append(ready_queue[i])
-
-						# Choose one of the parts from the selected parts by the LNSNL heuristic #
-						# Determine the number of immediate successors #
-						num_successors = []
-						for i in range(len(sel_parts)):
-							count = 0
-							if sel_parts[i].sibling != None:
-								count += 1
-							child_list = func.discover_child(num_tasks, part_list, part)
-							count += len(child_list)
-
-							num_successors.append(count)
-
-						# Select the part with the largest number of immediate successors #					
-						if bool(num_successors):
-							max_index = 0
-							max_value = num_successors[0]
-
-							for i in range(len(num_successors))[1::]:
-								if num_successors[i] > max_value:
-									max_index = i
-									max_value = num_successors[i]
-
-
-							# Assign the part to the thread #
-							thread_queue[thread_id].append(sel_parts[max_index])
-							part = thread_queue[thread_id][len(thread_queue[thread_id]) - 1]
-
-							part.status = 's'
-							part.s_time = t
-							part.f_time = t + part.et
-
-							# Append the task to the list of suspended tasks #
-							if part.p_id == 0:
-								suspend_list[thread_id].append(part.t_id)
-
-							last_idle[thread_id] = -1
-
-							# Remove the part from the ready queue #
-							ready_queue.remove(sel_parts[max_index])
-
-		t += 1
-
-	return t
-
-# The mapping process for untied tasks #
-def mapping_untied(num_tasks, num_threads, part_list):
-	global ready_queue, last_idle, thread_queue, parts_cnt, comp_parts_cnt
-
-	t = 0 # Response time
-
-	# Continue the mapping process while the ready queue and/or the thread queues of the threads are not empty #
-	while comp_parts_cnt < parts_cnt:
-		for thr_num in range(num_threads):
-			# Check the thread queue of each thread separately #
-			if bool(thread_queue[thr_num]):
-				part = thread_queue[thr_num][len(thread_queue[thr_num]) - 1]
-				# The part is in the execution status and its process has been already finished #
-				if part.status == 's' and part.f_time <= t:
-					part.status = 'f'
-					last_idle[thr_num] = t
-					comp_parts_cnt += 1
-
-					# If the part has any child parts #
-					child_list = func.discover_child(num_tasks, part_list, part)
-					for i in range(len(child_list)):
-						ready_queue.append(child_list[i])
-
-					# The part has a sibling part #
-					if part.sibling != None:
-						ready_queue.append(part.sibling)
-
-			# This process is done just by the master thread #
-			if thr_num == 0:
-				# Check the ready queue and allocate one of its parts to an idle thread #
-				if bool(ready_queue):
-					# Select and sort the idle threads #
-					temp_idle_list = last_idle.copy()
-					sort_idle_list = []
-					for i in range(num_threads):
-						thread_id = -1
-						min_idle_time = -1
-						for j in range(num_threads):
-							if temp_idle_list[j] != -1:
-								thread_id = j
-								min_idle_time = temp_idle_list[j]
-								break
-
-						for k in range(num_threads)[j+1::]:
-							if temp_idle_list[k] != -1:
-								if temp_idle_list[k] < min_idle_time:
-									thread_id = k
-									min_idle_time = temp_idle_list[k]
-
-						if thread_id != -1:
-							sort_idle_list.append(thread_id)
-							temp_idle_list[thread_id] = -1
-
-					# Allocate and execute ready parts by idle threads #
-					for index in range(len(sort_idle_list)):
-						thread_id = sort_idle_list[index]
-						sel_parts = []
-						# Look for any parts in the ready queue and find suitable ones #
-						for i in range(len(ready_queue)):
-							# Check whether there is a data dependency, so the related part is finished #
-							flag_finished = False
-							if ready_queue[i].dep != None:
-								for j in range(num_threads):
-									for k in range(len(thread_queue[j])):
-										if ready_queue[i].dep == thread_queue[j][k] and thread_queue[j][k].status == 'f':
-											flag_finished = True
-
-							# Put the part in the list if there is not a data dependency, or #
-							# there is a data dependency but the related part is finished #
-							if ready_queue[i].dep == None or (ready_queue[i].dep != None and flag_finished == True):
-								# Add the part to the selected parts #
-								sel_parts.append(ready_queue[i])
-
-						# Choose one of the parts from the selected parts by the LNSNL heuristic #
-						# Determine the number of immediate successors #
-						num_successors = []
-						for i in range(len(sel_parts)):
-							count = 0
-							if sel_parts[i].sibling != None:
-								count += 1
-							child_list = func.discover_child(num_tasks, part_list, part)
-							count += len(child_list)
-
-							num_successors.append(count)
-
-						# Select the part with the largest number of immediate successors #					
-						if bool(num_successors):
-							max_index = 0
-							max_value = num_successors[0]
-
-							for i in range(len(num_successors))[1::]:
-								if num_successors[i] > max_value:
-									max_index = i
-									max_value = num_successors[i]
-
-
-							# Assign the part to the thread #
-							thread_queue[thread_id].append(sel_parts[max_index])
-							part = thread_queue[thread_id][len(thread_queue[thread_id]) - 1]
-
-							part.status = 's'
-							part.s_time = t
-							part.f_time = t + part.et
-
-							last_idle[thread_id] = -1
-
-							# Remove the part from the ready queue #
-							ready_queue.remove(sel_parts[max_index])
-
-		t += 1
-
-	return t
-
-# The main mapping process #
-def execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, graphic_result):
-	global ready_queue, suspend_list, last_idle, thread_queue, parts_cnt
-
-	# Determine the number of all the parts #
-	for i in range(num_tasks):
-		parts_cnt += len(part_list[i])
-
-	# Initialize the ready queue #
-	ready_queue = []
-
-	# Create the initial list of suspended tasks #
-	suspend_list = []
-	for i in range(num_threads):
-		suspend_list.append([])
-
-	# Create a list for the last idle time of the threads #
-	last_idle = []
-	for i in range(num_threads):
-		last_idle.append(0)
-
-	# Create an thread queue for each thread #
-	thread_queue = []
-	for i in range(num_threads):
-		thread_queue.append([])
-
-	# Put the first part of the system in the thread queue of the first thread #
-	thread_queue[0].append(first_task_part)
-	thread_queue[0][0].status = 's'
-	thread_queue[0][0].s_time = 1
-	thread_queue[0][0].f_time = 1 + thread_queue[0][0].et
-
-	suspend_list[0].append(0) # Append Task 0 to the list of suspended tasks of Thread 0
-
-	# Show the mapping algorithm and the task type #
-	if task_type == 'tied':
-		print('\nLNSNL for tied tasks\n***********************************')
-		t = mapping_tied(num_tasks, num_threads, part_list, desc_rel)
-	else:
-		print('\nLNSNL for untied tasks\n***********************************')
-		t = mapping_untied(num_tasks, num_threads, part_list)
-
-	# Calculate the results #
-	response_time = t # The response time
-	idle_time = sum(func.idle_time(num_threads, thread_queue, t)) # The idle time of the system
-	waiting_time = func.wait_time(num_threads, thread_queue) # The waiting time of the threads
-	miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, thread_queue, deadline, t) # The missed deadline status of the system
-
-	# Show the results #
-	print('Response time: ' + str(response_time))
-	print('Idle time: ' + str(idle_time))
-	print('Waiting time: ' + str(waiting_time))
-	print('Missed deadline: ' + str(miss_deadline))
-	'''
-	print("\nThe thread queues of the threads:") # The contents of the thread queues of the threads
-	for i in range(num_threads):
-		print('Thr ' + str(i) + ':')
-		for j in range(len(thread_queue[i])):
-			print('p' + str(thread_queue[i][j].t_id) + str(thread_queue[i][j].p_id) + ' --> status = ' + thread_queue[i][j].status + ', start waiting time = ' + str(thread_queue[i][j].s_w_time) +\
-			 ', finish waiting time = ' + str(thread_queue[i][j].f_w_time) + ', start time = ' + str(thread_queue[i][j].s_time) + ', finish time = ' + str(thread_queue[i][j].f_time))
-	'''
-	if graphic_result == 1:
-		func.graphic_result(num_threads, thread_queue, 'lnsnl', task_type, '', '') # The graphical output
-
-	# Return the results to the main program #
-	return response_time, idle_time, waiting_time, miss_deadline
+# Define the class of the LNSNL scheduler, which keeps the state of one mapping process #
+class scheduler:
+	def __init__(self):
+		self.ready_queue = [] # The ready queue (a heap keyed by the number of immediate successors and the order of arrival of the parts)
+		self.ready_seq = 0 # The sequence number of the next part added to the ready queue
+		self.suspend_list = [] # The list of tasks suspended on the threads
+		self.allowed = [] # The tasks that can be started on the threads, kept as the suspended tasks change (see func.allowed_tasks)
+		self.last_idle = [] # Last idle time of the threads (-1 for a busy thread)
+		self.idle_heap = [] # The heap of the idle threads keyed by their last idle time and their thread numbers
+		self.owner = {} # The thread of each task that has been started (the parts of a tied task are executed on the same thread)
+		self.thread_queue = [] # The thread queues of the threads
+		self.details = {} # The details of the mapping process of the parts (see func.detail), kept apart from the parts of the graph
+		self.parts_cnt = 0 # The number of all the parts
+		self.comp_parts_cnt = 0 # The number of completed parts
+
+	# Put a part in the ready queue #
+	# The largest number of immediate successors comes first, and the first arrived part on ties #
+	def push_ready(self, part):
+		heappush(self.ready_queue, (-part.num_succ, self.ready_seq, part))
+		self.ready_seq += 1
+
+	# Mark a thread as idle since a time #
+	def set_idle(self, thr_num, t):
+		self.last_idle[thr_num] = t
+		heappush(self.idle_heap, (t, thr_num))
+
+	# Check whether a ready part can be assigned to a thread (desc_rel is None for untied tasks) #
+	def eligible_part(self, thread_id, part, desc_rel):
+		# The part does not have a data dependency, or the related part is finished #
+		if not func.dep_satisfied(self.details, part):
+			return False
+
+		if desc_rel != None:
+			# The first part of a task can be started only if the task is a descendant of all the tasks suspended on the thread #
+			if part.p_id == 0:
+				if not func.is_allowed(self.allowed[thread_id], part.t_id):
+					return False
+
+			# The other parts of a task are executed on the thread of its first part #
+			elif self.owner.get(part.t_id) != thread_id:
+				return False
+
+		return True
+
+	# Choose the part with the largest number of immediate successors (the LNSNL heuristic) among the parts that can be assigned to a thread #
+	# The parts that cannot be assigned to the thread are set aside and put back in the ready queue #
+	def choose_part(self, thread_id, desc_rel):
+		sel_part = None
+		set_aside = [] # The entries of the parts that cannot be assigned to the thread
+		while bool(self.ready_queue):
+			entry = heappop(self.ready_queue)
+			if self.eligible_part(thread_id, entry[2], desc_rel):
+				sel_part = entry[2]
+				break
+
+			set_aside.append(entry)
+
+		for i in range(len(set_aside)):
+			heappush(self.ready_queue, set_aside[i])
+
+		return sel_part
+
+	# Allocate the ready parts to the idle threads (desc_rel is None for untied tasks) #
+	# The idle threads are taken in the order of their last idle time (the lowest thread number on ties) #
+	def dispatch(self, desc_rel, t):
+		set_aside = [] # The entries of the idle threads that do not get a part
+		while bool(self.idle_heap) and bool(self.ready_queue):
+			entry = heappop(self.idle_heap)
+			thread_id = entry[1]
+
+			# Discard the entry of a thread that has been busy since then #
+			if self.last_idle[thread_id] != entry[0]:
+				continue
+
+			# Choose one of the parts by the LNSNL heuristic #
+			part = self.choose_part(thread_id, desc_rel)
+
+			if part == None:
+				set_aside.append(entry)
+
+				# The parts of untied tasks can be assigned to any thread, so the next threads do not get a part either #
+				if desc_rel == None:
+					break
+			else:
+				# Assign the part to the thread #
+				self.details[part] = func.detail('s', None, None, t, t + part.et)
+				self.thread_queue[thread_id].append(part)
+
+				# Append the task to the list of suspended tasks, and record the thread of the task #
+				if desc_rel != None and part.p_id == 0:
+					self.suspend_list[thread_id].append(part.t_id)
+					self.allowed[thread_id] &= desc_rel[part.t_id]
+					self.owner[part.t_id] = thread_id
+
+				self.last_idle[thread_id] = -1
+
+		for i in range(len(set_aside)):
+			heappush(self.idle_heap, set_aside[i])
+
+	# The mapping process for tied tasks #
+	def mapping_tied(self, num_tasks, num_threads, part_list, desc_rel, time_skip):
+		t = 0 # Response time
+
+		# Continue the mapping process while the ready queue and/or the thread queues of the threads are not empty #
+		while self.comp_parts_cnt < self.parts_cnt:
+			# Record the number of completed and mapped parts before checking the threads #
+			num_comp_parts = self.comp_parts_cnt
+			num_mapped_parts = func.count_parts(num_threads, self.thread_queue)
+
+			for thr_num in range(num_threads):
+				# Check the thread queue of each thread separately #
+				if bool(self.thread_queue[thr_num]):
+					part = self.thread_queue[thr_num][len(self.thread_queue[thr_num]) - 1]
+					detail = self.details[part]
+					# The part is in the execution status and its process has been already finished #
+					if detail.status == 's' and detail.f_time <= t:
+						detail.status = 'f'
+						self.set_idle(thr_num, t)
+						self.comp_parts_cnt += 1
+
+						# If the part has any child parts #
+						child_list = func.discover_child(num_tasks, part_list, part)
+						for i in range(len(child_list)):
+							self.push_ready(child_list[i])
+
+						# The part has a sibling part #
+						if part.sibling != None:
+							self.push_ready(part.sibling)
+
+						# Remove the task from the list of suspended tasks #
+						if part.p_id == len(part_list[part.t_id]) - 1:
+							self.suspend_list[thr_num].remove(part.t_id)
+							self.allowed[thr_num] = func.allowed_tasks(desc_rel, self.suspend_list[thr_num])
+
+				# This process is done just by the master thread #
+				if thr_num == 0:
+					# Check the ready queue and allocate its parts to the idle threads #
+					if bool(self.ready_queue):
+						self.dispatch(desc_rel, t)
+
+			# Skip to the next finish time if no part has been completed or mapped at this time, #
+			# since no decision is possible until then #
+			if time_skip == 1 and self.comp_parts_cnt == num_comp_parts and func.count_parts(num_threads, self.thread_queue) == num_mapped_parts:
+				t = func.next_finish_time(num_threads, self.thread_queue, self.details, t)
+			else:
+				t += 1
+
+		return t
+
+	# The mapping process for untied tasks #
+	def mapping_untied(self, num_tasks, num_threads, part_list, time_skip):
+		t = 0 # Response time
+
+		# Continue the mapping process while the ready queue and/or the thread queues of the threads are not empty #
+		while self.comp_parts_cnt < self.parts_cnt:
+			# Record the number of completed and mapped parts before checking the threads #
+			num_comp_parts = self.comp_parts_cnt
+			num_mapped_parts = func.count_parts(num_threads, self.thread_queue)
+
+			for thr_num in range(num_threads):
+				# Check the thread queue of each thread separately #
+				if bool(self.thread_queue[thr_num]):
+					part = self.thread_queue[thr_num][len(self.thread_queue[thr_num]) - 1]
+					detail = self.details[part]
+					# The part is in the execution status and its process has been already finished #
+					if detail.status == 's' and detail.f_time <= t:
+						detail.status = 'f'
+						self.set_idle(thr_num, t)
+						self.comp_parts_cnt += 1
+
+						# If the part has any child parts #
+						child_list = func.discover_child(num_tasks, part_list, part)
+						for i in range(len(child_list)):
+							self.push_ready(child_list[i])
+
+						# The part has a sibling part #
+						if part.sibling != None:
+							self.push_ready(part.sibling)
+
+				# This process is done just by the master thread #
+				if thr_num == 0:
+					# Check the ready queue and allocate its parts to the idle threads #
+					if bool(self.ready_queue):
+						self.dispatch(None, t)
+
+			# Skip to the next finish time if no part has been completed or mapped at this time, #
+			# since no decision is possible until then #
+			if time_skip == 1 and self.comp_parts_cnt == num_comp_parts and func.count_parts(num_threads, self.thread_queue) == num_mapped_parts:
+				t = func.next_finish_time(num_threads, self.thread_queue, self.details, t)
+			else:
+				t += 1
+
+		return t
+
+	# The main mapping process #
+	def execute(self, task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, graphic_result, time_skip):
+		# Determine the number of all the parts, so the scheduler can be reused for another mapping process #
+		self.parts_cnt = 0
+		self.comp_parts_cnt = 0
+		for i in range(num_tasks):
+			self.parts_cnt += len(part_list[i])
+
+		# Initialize the ready queue #
+		self.ready_queue = []
+		self.ready_seq = 0
+
+		# Create the initial list of suspended tasks #
+		self.suspend_list = []
+		self.allowed = []
+		for i in range(num_threads):
+			self.suspend_list.append([])
+			self.allowed.append(-1)
+
+		# Create a list for the last idle time of the threads #
+		self.last_idle = []
+		self.idle_heap = []
+		for i in range(num_threads):
+			self.last_idle.append(0)
+			self.idle_heap.append((0, i))
+
+		# Create an thread queue for each thread #
+		self.thread_queue = []
+		for i in range(num_threads):
+			self.thread_queue.append([])
+
+		# Create the details of the mapping process of the parts #
+		self.details = {}
+
+		# Put the first part of the system in the thread queue of the first thread #
+		self.details[first_task_part] = func.detail('s', None, None, 1, 1 + first_task_part.et)
+		self.thread_queue[0].append(first_task_part)
+
+		self.suspend_list[0].append(0) # Append Task 0 to the list of suspended tasks of Thread 0
+		self.allowed[0] = desc_rel[0]
+		self.owner = {}
+		self.owner[0] = 0 # Task 0 is started on Thread 0
+
+		# Show the mapping algorithm and the task type #
+		if task_type == 'tied':
+			print('\nLNSNL for tied tasks\n***********************************')
+			t = self.mapping_tied(num_tasks, num_threads, part_list, desc_rel, time_skip)
+		else:
+			print('\nLNSNL for untied tasks\n***********************************')
+			t = self.mapping_untied(num_tasks, num_threads, part_list, time_skip)
+
+		# Calculate the results #
+		response_time = t # The response time
+		idle_time = sum(func.idle_time(num_threads, self.thread_queue, self.details, t)) # The idle time of the system
+		waiting_time = func.wait_time(num_threads, self.thread_queue, self.details) # The waiting time of the threads
+		miss_deadline = func.miss_deadline(num_tasks, num_threads, part_list, self.thread_queue, self.details, deadline, t) # The missed deadline status of the system
+
+		# Show the results #
+		print('Response time: ' + str(response_time))
+		print('Idle time: ' + str(idle_time))
+		print('Waiting time: ' + str(waiting_time))
+		print('Missed deadline: ' + str(miss_deadline))
+		'''
+		print("\nThe thread queues of the threads:") # The contents of the thread queues of the threads
+		for i in range(num_threads):
+			print('Thr ' + str(i) + ':')
+			for j in range(len(self.thread_queue[i])):
+				print('p' + str(self.thread_queue[i][j].t_id) + str(self.thread_queue[i][j].p_id) + ' --> status = ' + self.details[self.thread_queue[i][j]].status + ', start waiting time = ' + str(self.details[self.thread_queue[i][j]].s_w_time) +\
+				 ', finish waiting time = ' + str(self.details[self.thread_queue[i][j]].f_w_time) + ', start time = ' + str(self.details[self.thread_queue[i][j]].s_time) + ', finish time = ' + str(self.details[self.thread_queue[i][j]].f_time))
+		'''
+		if graphic_result == 1:
+			func.graphic_result(num_threads, self.thread_queue, self.details, 'lnsnl', task_type, '', '') # The graphical output
+
+		# Return the results to the main program #
+		return response_time, idle_time, waiting_time, miss_deadline
+
+# The main mapping process using a new scheduler #
+def execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, graphic_result, time_skip):
+	return scheduler().execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, first_task_part, graphic_result, time_skip)
\ No newline at end of file
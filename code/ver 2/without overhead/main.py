@@ -18,12 +18,13 @@
  # See the License for the specific language governing permissions and
  # limitations under the License.
  #**************************************************************************
+import random
+import cache
 import gen
 import func
-import bfs
-import wfs
-import lnsnl
-import new
+import runner
+import sink
+import store
 
 # Global variables #
 num_tasks = 7 # The number of tasks
@@ -34,6 +35,10 @@ deadline = 0 # Deadline of the whole system
 deadline_min = 0.5 # The minimum probability for determining the deadline of the whole system
 deadline_max = 1 # The maximum probability for determining the deadline of the whole system
 graph_gen_type = 1 # 1: Generate the graph one time, 2: Generate the graph in each iteration
+graph_file = None # The file of the predefined graph (a benchmark in the JSON lines format, see gen.graph_load), None: The graph of gen.graph_predef
+fixed_et = 0 # 0: Specify the execution times randomly in each iteration, 1: Keep the execution times given by the file of the predefined graph (if graph_gen_type is 1)
+numpy_gen = 0 # 0: Generate the random graph and the execution times using the random module, 1: Using a NumPy random generator (for large graphs)
+graph_cache = 0 # 0: Generate the random graph, 1: Load it from the cache of the graphs (graph_cache) if it has been generated with the same parameters and seed
 system_model = 1 # 1: The first task is the parent of the other tasks,
 				 # 2: Each task (all parts) can have a random number of child tasks,
 				 # 3: Each task (only the first part) can have m:n child tasks
@@ -43,11 +48,16 @@ dep_pro = 0.6 # The probability of selecting the sibling tasks in the dependency
 num_dep_level = 2 # The maximum number of dependencies (at each level) in the dependency graph between sibling tasks
 num_threads = 4 # The number of threads
 graphic_result = 0 # 0: Not show, 1: Show
+time_skip = 1 # 0: Advance the time tick by tick, 1: Skip to the next finish time whenever no decision is possible
+num_workers = 4 # The number of worker processes running the mapping algorithms in parallel (1: Run them one after another)
+compact_graph = 0 # 0: Store the task parts as objects, 1: Store them compactly in typed arrays (for large graphs)
+results_format = 0 # 0: Text (results.dat), 1: Binary records (results.bin, buffered and readable by sink.load)
 itr = 1 # The number of iterations
+seed = None # The master seed of the random number generator (None: Choose it randomly)
 
 # Define the class of the task part #
 class part:
-	def __init__(self, t_id, p_id, et, dep, parent, sibling, rt, status, s_w_time, f_w_time, s_time, f_time):
+	def __init__(self, t_id, p_id, et, dep, parent, sibling, rt):
 		self.t_id = t_id # Task ID
 		self.p_id = p_id # Part ID
 		self.et = et # Execution time of the part
@@ -55,23 +65,44 @@ class part:
 		self.parent = parent # The child task
 		self.sibling = sibling # The next part in the same task
 		self.rt = rt # Response time of the part (only used in the new mapping algorithm)
-		self.status = status # s: started; w : waiting for a data dependency; f : finished
-		self.s_w_time = s_w_time # Start time of the waiting process (data dependency)
-		self.f_w_time = f_w_time # Finish time of the waiting process (data dependency)
-		self.s_time = s_time # Start time of the execution process
-		self.f_time = f_time # Finish time of the execution process
+		self.child = [] # The child tasks (their first parts) created by the part (filled by the graph generator)
+		self.num_succ = 0 # The number of immediate successors (the sibling part and the child tasks) of the part (filled by the graph generator)
+
+# Create the task parts in the compact storage instead of objects #
+if compact_graph == 1:
+	part = store.graph()
+
+# Specify the master seed, so each iteration (generated from a seed derived from it) can be reproduced #
+if seed == None:
+	seed = random.SystemRandom().randrange(2 ** 32)
+print('Master seed = ' + str(seed))
+random.seed(seed)
 
 # Generate the graph #
+part_list = None
+desc_rel = None # The descendant relation of the graph (only taken from the cache of the graphs)
 print("Perform the mapping process based on the predefined graph? (y/n)")
 graph_type = input()
 
 if graph_gen_type == 1:
 	if graph_type == 'y':
-		# Generate it according to a predefined structure #
-		part_list = gen.graph_predef(num_tasks, part)
+		# Generate it according to a predefined structure, or load it from the file of a benchmark #
+		if graph_file != None:
+			part_list = gen.graph_load(graph_file, part)
+			num_tasks = len(part_list)
+		else:
+			part_list = gen.graph_predef(num_tasks, part)
 	else:
 		# Generate it randomly #
-		part_list = gen.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child)
+		if graph_cache == 1:
+			rng = None
+			if numpy_gen == 1:
+				rng = gen.random_generator(seed)
+			part_list, desc_rel = cache.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, seed, rng)
+		elif numpy_gen == 1:
+			part_list = gen.graph_rand_np(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, gen.random_generator(seed))
+		else:
+			part_list = gen.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child)
 
 	# Show the details of the graph #
 	#print('\nThe traverse of the graph:')
@@ -101,287 +132,33 @@ if graph_gen_type == 1:
 # Show the status of the mapping process #
 print('The mapping process is in progress. Please wait ...')
 
-# Reset the file to write the results #
-file = open("results.dat", "w")
-file.close()
-
-for i in range(itr):
-	print('\n++++++++++++++++++++\nIteration = ' + str(i + 1) + '\n++++++++++++++++++++')
-
-	# Generate the random graph randomly #
-	if graph_gen_type == 2:
-		part_list = gen.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child)
-
-	# Determine the execution time and generate the list of tasks #
-	part_list, deadline, desc_rel = gen.specify_et(num_tasks, part_list, et_min, et_max, deadline_min, deadline_max)
-
-	results = []
-
-	# +++++++++++++++++++Tied+++++++++++++++++++++ #
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# BFS mapping algorithm for tied tasks #
-	results.append(bfs.execute('tied', num_tasks, num_threads, part_list, deadline, part_list[0][0], graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# WFS mapping algorithm for tied tasks #
-	results.append(wfs.execute('tied', num_tasks, num_threads, part_list, deadline, part_list[0][0], graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# LNSNL mapping algorithm for tied tasks #
-	results.append(lnsnl.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MNTP', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MNTP', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MNTP', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'NT', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'NT', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'NT', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MRIT', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MRIT', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MRIT', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTET', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTET', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTET', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTRT', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTRT', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTRT', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'TMCD', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'TMCD', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for tied tasks #
-	results.append(new.execute('tied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'TMCD', 'MCD', graphic_result))
-
-	# +++++++++++++++++++Untied+++++++++++++++++++++ #
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# BFS mapping algorithm for untied tasks #
-	results.append(bfs.execute('untied', num_tasks, num_threads, part_list, deadline, part_list[0][0], graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# WFS mapping algorithm for untied tasks #
-	results.append(wfs.execute('untied', num_tasks, num_threads, part_list, deadline, part_list[0][0], graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# LNSNL mapping algorithm for untied tasks #
-	results.append(lnsnl.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MNTP', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MNTP', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MNTP', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'NT', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'NT', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'NT', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MRIT', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MRIT', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MRIT', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTET', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTET', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTET', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTRT', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTRT', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'MTRT', 'MCD', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'TMCD', 'MET', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'TMCD', 'MRT', graphic_result))
-
-	# Clear the detailed contents of the list #
-	part_list = func.clear(num_tasks, part_list)
-
-	# NEW mapping algorithm for untied tasks #
-	results.append(new.execute('untied', num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], 'TMCD', 'MCD', graphic_result))
-
-	# Open the file, write the results, and close ir #
-	file = open("results.dat", "a")
-
-	for i in range(0, 42):
-		file.write(str(results[i][0]) + "\t")
-		file.write(str(results[i][1]) + "\t")
-		file.write(str(results[i][2]) + "\t")
-		file.write(str(results[i][3]))
-		if i != 41:
-			file.write("\t")
-
+# Create the sink of the binary records, or reset the file to write the results #
+if results_format == 1:
+	results_sink = sink.results_sink("results.bin", runner.configs)
+else:
+	file = open("results.dat", "w")
 	file.close()
+
+# Run the iterations (split across the worker processes if there are several workers and iterations) #
+for i, itr_seed, results in runner.run_iterations(num_workers, itr, seed, graph_gen_type, numpy_gen, graph_cache, fixed_et, part_list, desc_rel, num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, \
+	min_num_child, max_num_child, et_min, et_max, deadline_min, deadline_max, num_threads, graphic_result, time_skip):
+	# Add the records of the results to the sink #
+	if results_format == 1:
+		results_sink.write(i, itr_seed, results)
+	else:
+		# Open the file, write the results, and close ir #
+		file = open("results.dat", "a")
+
+		for j in range(0, 42):
+			file.write(str(results[j][0]) + "\t")
+			file.write(str(results[j][1]) + "\t")
+			file.write(str(results[j][2]) + "\t")
+			file.write(str(results[j][3]))
+			if j != 41:
+				file.write("\t")
+
+		file.close()
+
+# Write the remaining records of the results #
+if results_format == 1:
+	results_sink.close()
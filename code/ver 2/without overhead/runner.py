@@ -0,0 +1,190 @@
+ #**************************************************************************
+ # runner.py
+ #
+ # Run the iterations and the configurations of the mapping algorithms,
+ # either one after another or in parallel across a pool of worker processes.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import multiprocessing
+import random
+import cache
+import gen
+import store
+import bfs
+import wfs
+import lnsnl
+import new
+
+# Global variables #
+graph = None # The graph shared with the worker processes (num_tasks, num_threads, part_list, deadline, desc_rel, graphic_result, sim_mode)
+study = None # The parameters of the iterations shared with the worker processes
+
+# The configurations of the mapping algorithms [algorithm, task type, scheduling heuristic, allocation heuristic] #
+# in the order of the columns of results.dat #
+configs = []
+for task_type in ['tied', 'untied']:
+	configs.append(['bfs', task_type, '', ''])
+	configs.append(['wfs', task_type, '', ''])
+	configs.append(['lnsnl', task_type, '', ''])
+	for schedule_alg in ['MNTP', 'NT', 'MRIT', 'MTET', 'MTRT', 'TMCD']:
+		for alloc_alg in ['MET', 'MRT', 'MCD']:
+			configs.append(['new', task_type, schedule_alg, alloc_alg])
+
+# Run one configuration of the mapping algorithms on the shared graph #
+def run_config(config):
+	num_tasks, num_threads, part_list, deadline, desc_rel, graphic_result, sim_mode = graph
+	alg_name, task_type, schedule_alg, alloc_alg = config
+
+	if alg_name == 'bfs':
+		return bfs.execute(task_type, num_tasks, num_threads, part_list, deadline, part_list[0][0], graphic_result, sim_mode)
+	elif alg_name == 'wfs':
+		return wfs.execute(task_type, num_tasks, num_threads, part_list, deadline, part_list[0][0], graphic_result, sim_mode)
+	elif alg_name == 'lnsnl':
+		return lnsnl.execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], graphic_result, sim_mode)
+	else:
+		return new.execute(task_type, num_tasks, num_threads, part_list, deadline, desc_rel, part_list[0][0], schedule_alg, alloc_alg, graphic_result, sim_mode)
+
+# Run one configuration in a worker process and keep its output, so it can be shown in order by the main process #
+def run_config_worker(config):
+	output = io.StringIO()
+	with contextlib.redirect_stdout(output):
+		result = run_config(config)
+
+	return result, output.getvalue()
+
+# Run all the configurations on the graph and return their results in the order of configs #
+# sim_mode is the last parameter of the mapping algorithms (sim_engine with overhead, time_skip without overhead) #
+def run_all(num_workers, num_tasks, num_threads, part_list, deadline, desc_rel, graphic_result, sim_mode):
+	global graph
+
+	graph = (num_tasks, num_threads, part_list, deadline, desc_rel, graphic_result, sim_mode)
+
+	results = []
+	# The worker processes are forked, so they share the graph with the main process without copying or re-running main.py #
+	if num_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+		with ProcessPoolExecutor(max_workers = num_workers, mp_context = multiprocessing.get_context('fork')) as executor:
+			for result, output in executor.map(run_config_worker, configs):
+				print(output, end = '')
+				results.append(result)
+	# Run the configurations one after another #
+	else:
+		for i in range(len(configs)):
+			results.append(run_config(configs[i]))
+
+	graph = None
+
+	return results
+
+# Derive the seed of an iteration from the master seed #
+# The seed only depends on the master seed and the iteration number, so the iterations produce the same results #
+# regardless of the worker process running them #
+def derive_seed(seed, itr_num):
+	return random.Random(str(seed) + ':' + str(itr_num)).getrandbits(63)
+
+# Run one iteration: generate the graph (if needed), determine the execution times, and run all the configurations #
+def run_iteration(itr_num, num_workers):
+	seed, graph_gen_type, numpy_gen, graph_cache, fixed_et, part_list, desc_rel, num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, \
+		et_min, et_max, deadline_min, deadline_max, num_threads, graphic_result, sim_mode = study
+
+	print('\n++++++++++++++++++++\nIteration = ' + str(itr_num + 1) + '\n++++++++++++++++++++')
+
+	# Seed the random number generator for the iteration #
+	itr_seed = derive_seed(seed, itr_num)
+	random.seed(itr_seed)
+	rng = None
+	if numpy_gen == 1:
+		rng = gen.random_generator(itr_seed)
+
+	# Generate the random graph randomly #
+	if graph_gen_type == 2:
+		# Create a new compact storage for the graph of the iteration #
+		if isinstance(part, store.graph):
+			part = store.graph()
+
+		if graph_cache == 1:
+			part_list, desc_rel = cache.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, itr_seed, rng)
+		elif numpy_gen == 1:
+			part_list = gen.graph_rand_np(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, rng)
+		else:
+			part_list = gen.graph_rand(num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child)
+
+	# Determine the execution time and generate the list of tasks #
+	# The execution times given by the file of the predefined graph are kept if the graph is not generated in each iteration #
+	if fixed_et == 1 and graph_gen_type == 1:
+		part_list, deadline, desc_rel = gen.specify_rt(num_tasks, part_list, deadline_min, deadline_max, desc_rel)
+	elif numpy_gen == 1:
+		num_all_parts = 0
+		for i in range(num_tasks):
+			num_all_parts += len(part_list[i])
+
+		et, deadline_factor = gen.draw_et(1, num_all_parts, et_min, et_max, deadline_min, deadline_max, rng)
+		part_list, deadline, desc_rel = gen.specify_et_np(num_tasks, part_list, et[0], deadline_factor[0], desc_rel)
+	else:
+		part_list, deadline, desc_rel = gen.specify_et(num_tasks, part_list, et_min, et_max, deadline_min, deadline_max, desc_rel)
+
+	# Run the mapping algorithms for tied and untied tasks #
+	results = run_all(num_workers, num_tasks, num_threads, part_list, deadline, desc_rel, graphic_result, sim_mode)
+
+	return itr_seed, results
+
+# Run one iteration in a worker process and keep its output, so it can be shown in order by the main process #
+def run_iteration_worker(itr_num):
+	output = io.StringIO()
+	with contextlib.redirect_stdout(output):
+		itr_seed, results = run_iteration(itr_num, 1)
+
+	return itr_seed, results, output.getvalue()
+
+# Run the iterations and yield their results (iteration number, seed of the iteration, results) in order #
+# Several iterations are split across the worker processes, while a single iteration splits its configurations #
+def run_iterations(num_workers, itr, seed, graph_gen_type, numpy_gen, graph_cache, fixed_et, part_list, desc_rel, num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, \
+	et_min, et_max, deadline_min, deadline_max, num_threads, graphic_result, sim_mode):
+	global study
+
+	study = (seed, graph_gen_type, numpy_gen, graph_cache, fixed_et, part_list, desc_rel, num_tasks, num_parts, system_model, part, dep_pro, num_dep_level, min_num_child, max_num_child, \
+		et_min, et_max, deadline_min, deadline_max, num_threads, graphic_result, sim_mode)
+
+	# The worker processes are forked, so they are not used on systems without the fork start method (e.g., Windows) #
+	if num_workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+		print('The fork start method is not available on this system, so num_workers = ' + str(num_workers) + ' is ignored and the mapping algorithms are run one after another')
+
+	# Stream the results of the iterations from the worker processes #
+	# The iterations are submitted in a bounded window ahead of the one being shown, so the results (and their outputs) #
+	# waiting to be shown in order do not grow with the number of iterations #
+	if itr > 1 and num_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+		with ProcessPoolExecutor(max_workers = num_workers, mp_context = multiprocessing.get_context('fork')) as executor:
+			window = num_workers * 4 # The maximum number of iterations submitted but not shown yet
+			pending = deque() # The submitted iterations in order
+			next_itr = 0 # The next iteration to submit
+			for itr_num in range(itr):
+				while next_itr < itr and len(pending) < window:
+					pending.append(executor.submit(run_iteration_worker, next_itr))
+					next_itr += 1
+
+				itr_seed, results, output = pending.popleft().result()
+				print(output, end = '')
+				yield itr_num, itr_seed, results
+	# Run the iterations one after another #
+	else:
+		for itr_num in range(itr):
+			itr_seed, results = run_iteration(itr_num, num_workers)
+			yield itr_num, itr_seed, results
+
+	study = None
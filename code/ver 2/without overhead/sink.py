@@ -0,0 +1,88 @@
+ #**************************************************************************
+ # sink.py
+ #
+ # This file includes a buffered sink of the results, which writes one
+ # fixed-size binary record for each configuration of each iteration, so
+ # the results can be appended quickly and memory-mapped afterwards.
+ #*************************************************************************
+ # Copyright 2023 Instituto Superior de Engenharia do Porto
+ #
+ # Licensed under the Apache License, Version 2.0 (the "License");
+ # you may not use this file except in compliance with the License.
+ # You may obtain a copy of the License at
+ #
+ #              http://www.apache.org/licenses/LICENSE-2.0
+ #
+ # Unless required by applicable law or agreed to in writing, software
+ # distributed under the License is distributed on an "AS IS" BASIS,
+ # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ # See the License for the specific language governing permissions and
+ # limitations under the License.
+ #**************************************************************************
+import struct
+
+# Global variables #
+# The fields of a record (name, struct format, NumPy type), stored little-endian without padding (72 bytes for each record) #
+fields = [
+	('iteration', 'q', '<i8'), # The iteration number (from 0, so the seed of the iteration is runner.derive_seed(seed, iteration))
+	('seed', 'q', '<i8'), # The seed of the iteration
+	('algorithm', '8s', 'S8'), # The mapping algorithm (bfs, wfs, lnsnl or new)
+	('task_type', '8s', 'S8'), # The task type (tied or untied)
+	('schedule_alg', '4s', 'S4'), # The scheduling heuristic of the new mapping algorithm (empty for the other algorithms)
+	('alloc_alg', '4s', 'S4'), # The allocation heuristic of the new mapping algorithm (empty for the other algorithms)
+	('response', 'q', '<i8'), # The response time
+	('idle', 'q', '<i8'), # The idle time of the system
+	('wait', 'q', '<i8'), # The waiting time of the threads
+	('miss', 'q', '<i8'), # The missed deadline status of the system
+]
+flush_size = 1 << 20 # The size of the buffer (in bytes) after which the records are written to the file
+
+# The layout of a record #
+record_format = '<'
+for field in fields:
+	record_format += field[1]
+record = struct.Struct(record_format)
+
+# The NumPy type of a record, so the file can be read by numpy.fromfile or numpy.memmap #
+def dtype():
+	import numpy
+
+	record_type = []
+	for field in fields:
+		record_type.append((field[0], field[2]))
+
+	return numpy.dtype(record_type)
+
+# Memory-map a file of results as a NumPy array of records #
+def load(file_name):
+	import numpy
+	return numpy.memmap(file_name, dtype = dtype(), mode = 'r')
+
+# Define the class of the sink of the results #
+# The records are kept in a buffer and written to the end of the file when the buffer is full, or when the sink is flushed or closed #
+class results_sink:
+	def __init__(self, file_name, configs):
+		self.file = open(file_name, 'wb') # The file of the results (reset when the sink is created)
+		self.buffer = bytearray() # The records that have not been written to the file
+		self.configs = [] # The fields of the configurations of the mapping algorithms (in the order of the results)
+		for i in range(len(configs)):
+			self.configs.append((configs[i][0].encode(), configs[i][1].encode(), configs[i][2].encode(), configs[i][3].encode()))
+
+	# Add the results of all the configurations of an iteration #
+	def write(self, itr_num, itr_seed, results):
+		for j in range(len(results)):
+			self.buffer += record.pack(itr_num, itr_seed, *self.configs[j], *results[j])
+
+		if len(self.buffer) >= flush_size:
+			self.flush()
+
+	# Write the records of the buffer to the file #
+	def flush(self):
+		self.file.write(self.buffer)
+		self.file.flush()
+		self.buffer = bytearray()
+
+	# Write the remaining records and close the file #
+	def close(self):
+		self.flush()
+		self.file.close()